@@ -0,0 +1,66 @@
+"""Mengukur waktu cold import `fuzzymadm` di proses Python baru.
+
+Pemakaian:
+    python benchmarks/bench_import.py [--runs 20] [--budget-ms 100]
+
+Juga memastikan import tidak ikut memuat streamlit, matplotlib atau pandas.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import numpy
+t1 = time.perf_counter()
+import fuzzymadm
+t2 = time.perf_counter()
+heavy = sorted(m for m in ("streamlit", "matplotlib", "pandas", "openpyxl") if m in sys.modules)
+print(json.dumps([(t1 - t0) * 1e3, (t2 - t1) * 1e3, heavy]))
+"""
+
+
+def measure(runs):
+    numpy_ms, engine_ms, heavy = [], [], set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        n_ms, e_ms, loaded = json.loads(out)
+        numpy_ms.append(n_ms)
+        engine_ms.append(e_ms)
+        heavy.update(loaded)
+    return {
+        "runs": runs,
+        "numpy_ms_median": statistics.median(numpy_ms),
+        "engine_ms_median": statistics.median(engine_ms),
+        "total_ms_median": statistics.median(a + b for a, b in zip(numpy_ms, engine_ms)),
+        "heavy_modules": sorted(heavy),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--budget-ms", type=float, default=100.0,
+                    help="batas total (numpy + fuzzymadm) dalam milidetik")
+    args = ap.parse_args(argv)
+
+    res = measure(args.runs)
+    print(json.dumps(res, indent=2))
+    if res["heavy_modules"]:
+        print(f"GAGAL: import fuzzymadm ikut memuat {res['heavy_modules']}", file=sys.stderr)
+        return 1
+    if res["total_ms_median"] > args.budget_ms:
+        print(f"GAGAL: cold import {res['total_ms_median']:.1f} ms > {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
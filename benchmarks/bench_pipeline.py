@@ -0,0 +1,366 @@
+"""Benchmark per tahap untuk semua implementasi SAW/WP di repo ini.
+
+Pemakaian:
+    python benchmarks/bench_pipeline.py [--n 10 1000 100000 1000000] [--m 4 16 64 256]
+        [--repeat 3] [--output hasil.json] [--compare hasil_commit_lama.json]
+
+Implementasi yang diukur (matriks keputusan sintetis, seed tetap):
+
+* `engine`    : fungsi array `fuzzymadm` (normalize_minmax, saw_scores, wp_scores, rank_min).
+* `fuzzy`     : jalur fuzzy.py, `PipelineCache` baru per ulangan (termasuk hash data).
+* `streamlit` : jalur app `streamlit`, `fuzzymadm.frames` tanpa cache.
+* `sawwp`     : jalur sawwp.py, SAW crisp dengan normalisasi rasio (x/max, min/x).
+* `reference` : salinan kode loop baseline fuzzy.py/streamlit dan rumus pandas
+  baseline sawwp.py; hanya dijalankan bila n*m <= --reference-max-cells.
+
+Setiap tahap (normalize, saw, wp, rank, export; `fuzzy` juga rerun dari
+cache) diukur terpisah: waktu terbaik dari --repeat ulangan dan puncak memori
+(tracemalloc, satu run terpisah agar tidak memengaruhi waktu). Hasil numerik dicek: skor SAW keluarga min-max
+(engine/fuzzy/streamlit) dan rasio (sawwp) dibandingkan dengan `reference`
+(atau `engine` bila reference dilewati), nilai V WP semua implementasi sama.
+Exit code 1 bila ada ketidaksesuaian atau regresi melewati --threshold.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fuzzymadm import (  # noqa: E402
+    TYPES, normalize_minmax, normalize_ratio, rank_min, rank_ordinal, saw_crisp, saw_scores, wp_scores,
+)
+
+STAGES = ("normalize", "saw", "wp", "rank", "export", "rerun")
+RTOL = 1e-9
+
+
+class Timer:
+    """Menjalankan satu tahap: puncak memori lalu waktu terbaik dari `repeat` ulangan."""
+
+    def __init__(self, repeat, memory=True):
+        self.repeat = repeat
+        self.memory = memory
+        self.stages = {}
+
+    def __call__(self, stage, fn, repeat=None):
+        peak = None
+        if self.memory:
+            tracemalloc.start()
+            out = fn()
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        best = np.inf
+        for _ in range(repeat or self.repeat):
+            t0 = time.perf_counter()
+            out = fn()
+            best = min(best, time.perf_counter() - t0)
+        self.stages[stage] = {"seconds": best, "peak_mb": peak}
+        return out
+
+
+def make_case(n, m, seed):
+    """Matriks sintetis (nilai 1..100, 2 desimal), tipe mengulang pola TYPES, bobot Dirichlet."""
+    import pandas as pd
+
+    rng = np.random.default_rng([seed, n, m])
+    X = rng.uniform(1, 100, size=(n, m)).round(2)
+    types = [TYPES[j % len(TYPES)] for j in range(m)]
+    weights = rng.dirichlet(np.ones(m))
+    df = pd.DataFrame(X, index=[f"A{i}" for i in range(n)], columns=[f"C{j + 1}" for j in range(m)])
+    return df, types, weights
+
+
+# ---------- implementasi ----------
+
+def run_engine(case, timer, fmt):
+    df, types, weights = case
+    X = df.to_numpy()
+    R = timer("normalize", lambda: normalize_minmax(X, types))
+    scores, _ = timer("saw", lambda: saw_scores(R, weights))
+    _, V, _ = timer("wp", lambda: wp_scores(X, weights, types))
+    saw_rank, wp_rank = timer("rank", lambda: (rank_min(scores), rank_min(V)))
+    return {"family": "minmax", "saw": scores, "saw_rank": saw_rank, "V": V, "wp_rank": wp_rank}
+
+
+def _export_frames(df, normal, tfn_total, res_saw, res_wp, fmt):
+    import pandas as pd
+
+    from fuzzymadm.export import export_bytes
+
+    tfn_df = tfn_total.to_frame()
+    saw = pd.concat([df, normal.add_prefix("Norm_"), tfn_df.add_prefix("TFN_"), res_saw], axis=1)
+    return len(export_bytes(saw, fmt)) + len(export_bytes(res_wp, fmt))
+
+
+def _frames_result(res_saw, res_wp):
+    return {"family": "minmax", "saw": res_saw["Score"].to_numpy(), "saw_rank": res_saw["Rank"].to_numpy(),
+            "V": res_wp["V"].to_numpy(), "wp_rank": res_wp["Rank"].to_numpy()}
+
+
+def run_fuzzy(case, timer, fmt):
+    from fuzzymadm.cache import PipelineCache
+
+    df, types, weights = case
+    data_key = PipelineCache()._data_key(df, types)
+
+    def cold(prefill=()):
+        # Cache baru per ulangan agar yang diukur adalah run pertama (hash + hitung);
+        # `prefill` = hasil tahap sebelumnya yang sudah ada di cache.
+        cache = PipelineCache()
+        for key, value in prefill:
+            cache.put(key, value)
+        return cache
+
+    normal = timer("normalize", lambda: cold().normalize_saw(df, types))
+    prefill = [(("normalize", *data_key), normal)]
+    res_saw, _, tfn_total = timer("saw", lambda: cold(prefill).saw_calc(df, weights, types))
+    res_wp = timer("wp", lambda: cold().wp_calc(df, weights, types))
+    timer("export", lambda: _export_frames(df, normal, tfn_total, res_saw, res_wp, fmt))
+
+    # Rerun Streamlit dengan data & bobot sama: semua tahap dari cache (tetap hash data)
+    warm = PipelineCache()
+    warm.saw_calc(df, weights, types), warm.wp_calc(df, weights, types)
+    timer("rerun", lambda: (warm.saw_calc(df, weights, types), warm.wp_calc(df, weights, types)))
+    return _frames_result(res_saw, res_wp)
+
+
+def run_streamlit(case, timer, fmt):
+    from fuzzymadm.frames import normalize_saw, saw_from_normal, wp_calc
+
+    df, types, weights = case
+    normal = timer("normalize", lambda: normalize_saw(df, types))
+    res_saw, tfn_total = timer("saw", lambda: saw_from_normal(normal, weights))
+    res_wp = timer("wp", lambda: wp_calc(df, weights, types))
+    timer("export", lambda: _export_frames(df, normal, tfn_total, res_saw, res_wp, fmt))
+    return _frames_result(res_saw, res_wp)
+
+
+def run_sawwp(case, timer, fmt):
+    df, types, weights = case
+    X = df.to_numpy(dtype=float)
+    R = timer("normalize", lambda: normalize_ratio(X, types))
+    scores = timer("saw", lambda: saw_crisp(R, weights))
+    _, V, _ = timer("wp", lambda: wp_scores(X, weights, types))
+    saw_rank, wp_rank = timer("rank", lambda: (rank_ordinal(scores), rank_ordinal(V)))
+    return {"family": "ratio", "saw": scores, "saw_rank": saw_rank, "V": V, "wp_rank": wp_rank}
+
+
+def _ref_normalize(df, types):
+    import pandas as pd
+
+    res = pd.DataFrame(index=df.index, columns=df.columns, dtype=float)
+    for i, col in enumerate(df.columns):
+        min_val, max_val = df[col].min(), df[col].max()
+        if max_val == min_val:
+            res[col] = 1.0
+        elif types[i] == "benefit":
+            res[col] = (df[col] - min_val) / (max_val - min_val)
+        else:
+            res[col] = (max_val - df[col]) / (max_val - min_val)
+    return res
+
+
+def _ref_saw(normal, weights):
+    scores = []
+    for idx in normal.index:
+        total = np.array([0.0, 0.0, 0.0])
+        for j, col in enumerate(normal.columns):
+            v = normal.loc[idx, col]
+            total += np.array([max(0, v - 0.1), v, min(1, v + 0.1)]) * weights[j]
+        scores.append(total.mean())
+    return np.array(scores)
+
+
+def _ref_wp(df, weights, types):
+    S = []
+    for idx in df.index:
+        nilai_S = 1.0
+        for j, col in enumerate(df.columns):
+            x_ij = df.loc[idx, col]
+            nilai_S *= x_ij ** (weights[j] if types[j] == "benefit" else -weights[j])
+        S.append(nilai_S)
+    S = np.array(S)
+    return S / S.sum()
+
+
+def _ref_ratio(df, types, weights):
+    """Rumus pandas baseline sawwp.py: normalisasi rasio lalu Sum(w * r)."""
+    norm = df.copy()
+    for j, c in enumerate(df.columns):
+        norm[c] = df[c] / df[c].max() if types[j] == "benefit" else df[c].min() / df[c]
+    return sum(norm[c] * weights[j] for j, c in enumerate(df.columns)).to_numpy()
+
+
+def run_reference(case, timer, fmt):
+    import pandas as pd
+
+    df, types, weights = case
+    normal = timer("normalize", lambda: _ref_normalize(df, types), repeat=1)
+    scores = timer("saw", lambda: _ref_saw(normal, weights), repeat=1)
+    V = timer("wp", lambda: _ref_wp(df, weights, types), repeat=1)
+    ranks = timer("rank", lambda: tuple(pd.Series(s).rank(ascending=False, method="min").astype(int).to_numpy()
+                                        for s in (scores, V)), repeat=1)
+    ratio = _ref_ratio(df, types, weights)
+    return {"family": "minmax", "saw": scores, "saw_rank": ranks[0], "V": V, "wp_rank": ranks[1],
+            "ratio": ratio, "ratio_rank": rank_ordinal(ratio)}
+
+
+IMPLEMENTATIONS = {
+    "engine": run_engine,
+    "fuzzy": run_fuzzy,
+    "streamlit": run_streamlit,
+    "sawwp": run_sawwp,
+    "reference": run_reference,
+}
+
+
+# ---------- pengecekan kesesuaian ----------
+
+def ranks_agree(score, rank, rank_ref):
+    """Ranking sama, kecuali seri pada skor (beda urutan karena pembulatan float)."""
+    bad = rank != rank_ref
+    if not bad.any():
+        return True
+    desc = np.sort(score)[::-1]
+    return bool(np.allclose(score[bad], desc[rank_ref[bad] - 1], rtol=RTOL, atol=0))
+
+
+def compare(name, out, ref, score_key, rank_key, ref_score_key=None, ref_rank_key=None):
+    a, b = out[score_key], ref[ref_score_key or score_key]
+    return {
+        "check": f"{name}.{score_key}",
+        "max_abs_diff": float(np.max(np.abs(a - b))) if len(a) else 0.0,
+        "ok": bool(np.allclose(a, b, rtol=RTOL, atol=1e-15)
+                   and ranks_agree(a, out[rank_key], ref[ref_rank_key or rank_key])),
+    }
+
+
+def agreement(outputs):
+    ref = outputs.get("reference")
+    base = ref or outputs["engine"]
+    checks = []
+    for name, out in outputs.items():
+        if out is base:
+            continue
+        if out["family"] == "minmax":
+            checks.append(compare(name, out, base, "saw", "saw_rank"))
+        elif ref is not None:
+            checks.append(compare(name, out, ref, "saw", "saw_rank", "ratio", "ratio_rank"))
+        checks.append(compare(name, out, base, "V", "wp_rank"))
+    return checks
+
+
+# ---------- perbandingan antar commit ----------
+
+def regressions(old, new, threshold, min_seconds=1e-3):
+    """Tahap yang melambat lebih dari `threshold` kali dibanding hasil lama."""
+    def index(doc):
+        return {(r["impl"], r["n"], r["m"], s): v["seconds"]
+                for r in doc["results"] for s, v in r["stages"].items()}
+
+    before, after = index(old), index(new)
+    out = []
+    for key, t_new in after.items():
+        t_old = before.get(key)
+        if t_old is not None and t_new > min_seconds and t_new > threshold * t_old:
+            out.append({"impl": key[0], "n": key[1], "m": key[2], "stage": key[3],
+                        "old_s": t_old, "new_s": t_new, "ratio": t_new / t_old})
+    return out
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--n", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000])
+    ap.add_argument("--m", type=int, nargs="+", default=[4, 16, 64, 256])
+    ap.add_argument("--impl", nargs="+", choices=list(IMPLEMENTATIONS), default=list(IMPLEMENTATIONS))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--max-cells", type=int, default=10_000_000,
+                    help="lewati kombinasi dengan n*m lebih besar (default: %(default)s)")
+    ap.add_argument("--reference-max-cells", type=int, default=50_000,
+                    help="batas n*m untuk implementasi loop `reference` (default: %(default)s)")
+    ap.add_argument("--export-format", choices=("csv", "xlsx", "parquet"), default="csv")
+    ap.add_argument("--no-memory", action="store_true", help="tanpa pengukuran tracemalloc")
+    ap.add_argument("-o", "--output", default=None, help="simpan hasil JSON")
+    ap.add_argument("--compare", default=None, help="JSON hasil commit lain untuk deteksi regresi")
+    ap.add_argument("--threshold", type=float, default=1.25,
+                    help="rasio waktu baru/lama yang dianggap regresi (default: %(default)s)")
+    args = ap.parse_args(argv)
+
+    import pandas as pd
+
+    doc = {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "results": [],
+        "agreement": [],
+        "skipped": [],
+    }
+    for n in args.n:
+        for m in args.m:
+            if n * m > args.max_cells:
+                doc["skipped"].append({"n": n, "m": m, "reason": "max_cells"})
+                continue
+            case = make_case(n, m, args.seed)
+            outputs = {}
+            for name in args.impl:
+                if name == "reference" and n * m > args.reference_max_cells:
+                    doc["skipped"].append({"impl": name, "n": n, "m": m, "reason": "reference_max_cells"})
+                    continue
+                timer = Timer(args.repeat, memory=not args.no_memory)
+                outputs[name] = IMPLEMENTATIONS[name](case, timer, args.export_format)
+                row = {"impl": name, "n": n, "m": m, "stages": timer.stages,
+                       "total_seconds": sum(s["seconds"] for s in timer.stages.values())}
+                doc["results"].append(row)
+                print(f"{name:>10} n={n:>8} m={m:>4} " + " ".join(
+                    f"{s}={timer.stages[s]['seconds'] * 1e3:.2f}ms" for s in STAGES if s in timer.stages),
+                    file=sys.stderr)
+            if "engine" in outputs or "reference" in outputs:
+                for check in agreement(outputs):
+                    doc["agreement"].append({"n": n, "m": m, **check})
+                    if not check["ok"]:
+                        print(f"  TIDAK SESUAI n={n} m={m}: {check}", file=sys.stderr)
+
+    status = 0
+    if not all(c["ok"] for c in doc["agreement"]):
+        status = 1
+    if args.compare:
+        with open(args.compare) as fh:
+            doc["regressions"] = regressions(json.load(fh), doc, args.threshold)
+        for r in doc["regressions"]:
+            print(f"  REGRESI {r['impl']} n={r['n']} m={r['m']} {r['stage']}: "
+                  f"{r['old_s'] * 1e3:.2f} -> {r['new_s'] * 1e3:.2f} ms ({r['ratio']:.2f}x)", file=sys.stderr)
+        if doc["regressions"]:
+            status = 1
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(doc, fh, indent=2)
+    else:
+        print(json.dumps(doc, indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Uji beban layanan HTTP micro-batching (fuzzymadm.service) dalam satu proses.
+
+Pemakaian:
+    python benchmarks/bench_service.py [--n 20000] [--clients 64] [--requests 50]
+                                       [--top-k 10] [--max-wait-ms 2]
+
+Setiap klien memakai satu koneksi keep-alive dan mengirim permintaan
+/saw dan /wp bergantian dengan bobot acak. Hasil: throughput sisi klien
+serta latensi p50/p99 dan ukuran batch dari /metrics. Setiap respons
+dicek sama dengan perhitungan langsung `frames.saw_calc` / `frames.wp_calc`.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzymadm.criteria import CRITERIA_NAMES, TYPES  # noqa: E402
+from fuzzymadm.service import Dataset, RankingService  # noqa: E402
+
+
+async def post(reader, writer, path, body):
+    data = json.dumps(body).encode()
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(data)}\r\n\r\n"
+                 .encode() + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        key, _, value = line.decode().partition(":")
+        if key.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port, jobs, out):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for path, body in jobs:
+        out.append((path, body, await post(reader, writer, path, body)))
+    writer.close()
+
+
+def check(df, responses, k):
+    from fuzzymadm.frames import saw_calc, wp_calc
+
+    bad = 0
+    for path, body, (status, res) in responses:
+        w = np.asarray(body["weights"]) / np.sum(body["weights"])
+        ref = saw_calc(df, w)[0] if path == "/saw" else wp_calc(df, w)
+        col = "Score" if path == "/saw" else "V"
+        top = ref[ref["Rank"] <= k].sort_values("Rank", kind="stable")
+        ok = (status == 200 and res["alternatives"] == [str(i) for i in top.index]
+              and np.allclose(res[col], top[col], rtol=1e-9))
+        bad += not ok
+    return bad
+
+
+async def run(args):
+    rng = np.random.default_rng(args.seed)
+    import pandas as pd
+
+    df = pd.DataFrame(rng.uniform(1, 100, (args.n, len(CRITERIA_NAMES))), columns=CRITERIA_NAMES,
+                      index=[f"A{i}" for i in range(args.n)])
+    service = RankingService(args.max_batch, args.max_wait_ms / 1000)
+    service.register(Dataset.from_frame("bench", df, TYPES))
+    ready = asyncio.get_running_loop().create_future()
+    server = asyncio.create_task(service.serve("127.0.0.1", 0, ready.set_result))
+    port = (await ready).sockets[0].getsockname()[1]
+
+    jobs = [[("/saw" if (c + i) % 2 else "/wp",
+              {"dataset": "bench", "weights": rng.uniform(0.05, 1, len(CRITERIA_NAMES)).tolist(),
+               "top_k": args.top_k})
+             for i in range(args.requests)] for c in range(args.clients)]
+    responses = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*[client(port, j, responses) for j in jobs])
+    seconds = time.perf_counter() - t0
+
+    server.cancel()
+    service.close()
+    report = {"n": args.n, "clients": args.clients, "requests": len(responses),
+              "seconds": seconds, "req_per_sec": len(responses) / seconds,
+              **service.metrics.snapshot()}
+    report["mismatches"] = check(df, responses, args.top_k) if args.check else None
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--clients", type=int, default=64)
+    ap.add_argument("--requests", type=int, default=50, help="permintaan per klien")
+    ap.add_argument("--top-k", type=int, default=10)
+    ap.add_argument("--max-batch", type=int, default=256)
+    ap.add_argument("--max-wait-ms", type=float, default=2.0)
+    ap.add_argument("--no-check", dest="check", action="store_false")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", default=None, help="simpan hasil sebagai JSON")
+    args = ap.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print(f"{report['requests']:,} permintaan, {report['seconds']:.2f} s "
+          f"({report['req_per_sec']:,.0f} req/s), n={args.n:,}")
+    for name, m in report["endpoints"].items():
+        print(f"  /{name:<8} p50={m['p50_ms']:.1f} ms  p99={m['p99_ms']:.1f} ms")
+    for name, b in report["batches"].items():
+        print(f"  batch {name:<4} {b['batches']} batch, rata-rata {b['mean_size']:.1f}, "
+              f"maks {b['max_size']}")
+    if report["mismatches"] is not None:
+        print(f"  cek hasil: {report['mismatches']} berbeda dari frames.saw_calc/wp_calc")
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
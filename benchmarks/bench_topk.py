@@ -0,0 +1,67 @@
+"""Membandingkan top-k (partial selection) dengan ranking penuh.
+
+Pemakaian:
+    python benchmarks/bench_topk.py [--n 1000000] [--k 10 50] [--repeat 5]
+
+Skor dibuat dari nilai crisp bulat (banyak seri) agar penanganan seri ikut
+teruji; hasil top-k dicek sama dengan `rank(method='min')`.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzymadm import normalize_minmax, rank_min, saw_scores, top_k, TYPES  # noqa: E402
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--n", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--k", type=int, nargs="+", default=[10, 50])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    weights = np.array([0.35, 0.30, 0.15, 0.20])
+    results = []
+    for n in args.n:
+        X = rng.integers(1, 101, size=(n, 4)).astype(float)
+        scores, _ = saw_scores(normalize_minmax(X, TYPES), weights)
+        t_full, full = best_of(lambda: rank_min(scores), args.repeat)
+        row = {"n": n, "rank_min_s": t_full}
+        try:
+            import pandas as pd
+
+            series = pd.Series(scores)
+            row["pandas_rank_s"], _ = best_of(
+                lambda: series.rank(ascending=False, method="min").astype(int), args.repeat)
+        except ImportError:
+            pass
+        for k in args.k:
+            t_top, (idx, rank) = best_of(lambda: top_k(scores, k), args.repeat)
+            expected = np.flatnonzero(full <= k)
+            assert set(idx) == set(expected) and np.array_equal(rank, full[idx]), (n, k)
+            row[f"top_{k}_s"] = t_top
+            row[f"top_{k}_speedup"] = t_full / t_top
+        results.append(row)
+        print(json.dumps(row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
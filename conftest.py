@@ -0,0 +1 @@
+"""Root pytest: menjadikan paket `fuzzymadm` dapat diimpor tanpa instalasi."""
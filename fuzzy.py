@@ -1,8 +1,29 @@
+import os
+
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from io import BytesIO
+
+from fuzzymadm import DEFAULT_SPREAD, DEFAULT_WEIGHTS, DEFUZZIFY_METHODS, TYPES, normalize_weights
+from fuzzymadm.frames import (
+    acceptability_frame,
+    frame_digest,
+    group_calc,
+    incremental_frames,
+    rater_ranks_frame,
+    stability_frame,
+)
+from fuzzymadm.group import GROUP_AGGREGATIONS
+from fuzzymadm.incremental import IncrementalRanker
+from fuzzymadm.ingest import content_hash, ingest_upload
+from fuzzymadm.missing import MISSING_POLICIES, impute_missing
+from fuzzymadm.store import open_store
+from fuzzymadm.sensitivity import sample_weights, saw_sensitivity, wp_sensitivity
+from fuzzymadm.stability import saw_stability, wp_stability
+from fuzzymadm.ui.charts import comparison_chart
+from fuzzymadm.ui.export import download_section
+from fuzzymadm.ui.profiling import debug_panel, start_rerun
+from fuzzymadm.ui.shared import get_pipeline_cache, memory_report, session_data
+from fuzzymadm.ui.table import results_table
 
 st.set_page_config(page_title="Fuzzy MADM - Cloud Computing", layout="wide")
 
@@ -42,12 +63,13 @@ DEFAULT_DF = pd.DataFrame({
     "Skalabilitas": [100, 100, 80, 80, 60], # Crisp C4
 }, index=DEFAULT_PROVIDERS)
 
-if "df" not in st.session_state:
-    st.session_state.df = DEFAULT_DF.copy()
+# Data default dibekukan sekali per proses dan dipakai bersama semua sesi;
+# sesi baru mendapat salinan pribadi saat data diedit/diunggah (copy-on-write).
+data = session_data("default", DEFAULT_DF)
 
 # ---------- Sidebar ----------
 st.sidebar.header("📌 Menu Navigasi")
-page = st.sidebar.radio("Pilih halaman", ["Home", "Input Data", "Fuzzy SAW", "Fuzzy WP", "Perbandingan", "Tentang"])
+page = st.sidebar.radio("Pilih halaman", ["Home", "Input Data", "Fuzzy SAW", "Fuzzy WP", "Perbandingan", "Sensitivitas", "Kelompok", "Tentang"])
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### ⚖ Bobot Kriteria (Berdasarkan Normalisasi wj)")
@@ -59,136 +81,173 @@ w3 = st.sidebar.slider("Keamanan (C3)", 0.0, 1.0, 0.15, 0.01)
 w4 = st.sidebar.slider("Skalabilitas (C4)", 0.0, 1.0, 0.20, 0.01)
 
 # Normalisasi Bobot (untuk memastikan total = 1)
-ws_raw = np.array([w1, w2, w3, w4])
-ws = ws_raw / ws_raw.sum() if ws_raw.sum() != 0 else np.array([0.35, 0.30, 0.15, 0.20])
+ws = normalize_weights([w1, w2, w3, w4], DEFAULT_WEIGHTS)
+
+st.sidebar.markdown("---")
+st.sidebar.markdown("### 🔺 Parameter TFN")
+spread = st.sidebar.slider("Spread TFN (±)", 0.0, 0.5, DEFAULT_SPREAD, 0.01,
+                           help="TFN = (max(0, r - spread), r, min(1, r + spread)).")
+defuzz_method = st.sidebar.selectbox(
+    "Defuzzifikasi", DEFUZZIFY_METHODS,
+    format_func={"mean": "Rata-rata (a+m+b)/3", "centroid": "Centroid",
+                 "graded_mean": "Graded mean (a+4m+b)/6"}.get,
+)
 
-# Tipe Kriteria (Cost/Benefit)
+st.sidebar.markdown("---")
+incremental_mode = st.sidebar.checkbox(
+    "⚡ Mode inkremental",
+    value=False,
+    help="Hanya baris yang diedit yang dihitung ulang; normalisasi penuh hanya jika min/max kolom bergeser.",
+)
+prefilter = st.sidebar.checkbox(
+    "✂ Prefilter Pareto (skyline)",
+    value=False,
+    help="Alternatif yang terdominasi (kalah atau sama di semua kriteria) dibuang sebelum "
+         "perankingan. Skor sama dengan tanpa prefilter (normalisasi memakai rentang data penuh), "
+         "Rank dihitung di antara alternatif skyline. Tidak dipakai di mode inkremental.",
+)
+skyline_status = st.sidebar.empty()
+missing_policy = st.sidebar.selectbox(
+    "Nilai kosong (NaN)", MISSING_POLICIES,
+    format_func={"none": "Biarkan (SAW = 0, WP = NaN)", "skip": "Lewati kriteria (bobot baris dinormalisasi ulang)",
+                 "median": "Isi median kolom", "penalty": "Isi nilai terburuk kolom"}.get,
+    help="Cara menangani sel kriteria yang kosong (lihat fuzzymadm/missing.py).",
+)
+# median/penalty diisi sekali sebelum prefilter; mesin SAW/WP hanya perlu tahu "skip"
+engine_missing = "skip" if missing_policy == "skip" else "none"
+# Waktu per tahap untuk rerun ini (panel debug di akhir sidebar, lihat fuzzymadm/ui/profiling.py)
+timer, profiler = start_rerun(page)
+
+@st.cache_resource
+def get_catalog(path):
+    """Store katalog bersama (memory map read-only), dibuka sekali per proses server."""
+    store = open_store(path)
+    get_pipeline_cache().pin(store.digest)
+    return store
+
+# Katalog besar (mis. semua kombinasi region/instance) dibuat dengan
+# `python -m fuzzymadm store katalog.csv dir_store` lalu FUZZYMADM_CATALOG=dir_store.
+catalog = None
+CATALOG_PATH = os.environ.get("FUZZYMADM_CATALOG")
+if CATALOG_PATH:
+    try:
+        catalog = get_catalog(CATALOG_PATH)
+    except (OSError, ValueError) as e:
+        st.sidebar.error(f"Katalog {CATALOG_PATH} tidak dapat dibuka: {e}")
+use_catalog = catalog is not None and st.sidebar.radio(
+    "Sumber data", ["Data sesi", "Katalog bersama"],
+    help="Katalog bersama dibaca langsung dari disk dan dipakai semua sesi tanpa salinan.",
+) == "Katalog bersama"
+criteria_types = catalog.types if use_catalog else TYPES
+
+# Tipe Kriteria (Cost/Benefit) diambil dari fuzzymadm.TYPES:
 # C1=Biaya (Cost), C2=Kinerja (Benefit), C3=Keamanan (Benefit), C4=Skalabilitas (Benefit)
-TYPES = ["cost", "benefit", "benefit", "benefit"]
 # Pastikan nama kolom sesuai dengan DataFrame
 CRITERIA_NAMES = DEFAULT_DF.columns.tolist()
 
 # ---------- FUNCTIONS ----------
-
-# Fungsi Fuzzy TFN (Triangular Fuzzy Number)
-def tri(v):
-    """Menghitung TFN (a, m, b) dari nilai ternormalisasi v.
-       Menggunakan range 0.1."""
-    if pd.isna(v):
-        return np.array([0.0, 0.0, 0.0]) # Handle NaN gracefully
-    return np.array([max(0, v - 0.1), v, min(1, v + 0.1)])
-
-def normalize_saw(df):
-    """Normalisasi Fuzzy SAW (Min-Max Normalization)."""
-    res = pd.DataFrame(index=df.index, columns=df.columns, dtype=float)
-    
-    # Ambil nilai Crisp, jika ada kolom Crisp C1, Crisp C2, dll.
-    # Jika tidak ada, gunakan kolom yang tersedia
-    
-    # Hanya bekerja pada data Crisp yang ada di DataFrame
-    for i, col in enumerate(df.columns):
-        if i >= len(TYPES):
-            # Jika ada kolom lebih, abaikan (misal: kolom nama)
-            continue
-
-        min_val = df[col].min()
-        max_val = df[col].max()
-        
-        # Hindari pembagian dengan nol
-        if max_val == min_val:
-            res[col] = 1.0
-            continue
-
-        if TYPES[i] == "benefit":
-            res[col] = (df[col] - min_val) / (max_val - min_val)
-        else: # cost
-            res[col] = (max_val - df[col]) / (max_val - min_val)
-    
-    return res
-
-def saw_calc(df_crisp, weights):
-    """Perhitungan Fuzzy SAW."""
-    # 1. Normalisasi
-    normal = normalize_saw(df_crisp)
-    
-    tfn_total = {}
-    scores = []
-    
-    # 2. Pembentukan TFN Agregat (TFN V_i = Sum(w_j * R_ij))
-    for idx in normal.index:
-        # Inisialisasi TFN V_i = [a, m, b]
-        total = np.array([0.0, 0.0, 0.0])
-        
-        for j, col in enumerate(normal.columns):
-            if j >= len(weights):
-                continue # Skip if more columns than weights
-            
-            # Mendapatkan nilai ternormalisasi (R_ij)
-            normalized_value = normal.loc[idx, col]
-            
-            # Mendapatkan TFN dari R_ij
-            t = tri(normalized_value)
-            
-            # TFN * Bobot (w_j * R_ij) - Perkalian skalar
-            total += t * weights[j]
-            
-        tfn_total[idx] = total
-        
-        # 3. Defuzzifikasi (menggunakan rata-rata TFN)
-        # Score = (a + m + b) / 3
-        scores.append(total.mean())
-        
-    res = pd.DataFrame({"Score": scores}, index=normal.index)
-    res["Rank"] = res["Score"].rank(ascending=False, method='min').astype(int)
-    return res, normal, tfn_total
-
-def wp_calc(df_crisp, weights):
-    """Perhitungan Weighted Product (WP)"""
-    
-    # 1. Hitung Vektor Bobot Pangkat (w_j / Sum(w_j)) sudah dilakukan di ws
-    
-    S = [] # Nilai Vektor S (S_i)
-    
-    # 2. Hitung Nilai S_i = Product(x_ij ^ wj)
-    for idx in df_crisp.index:
-        nilai_S = 1.0
-        for j, col in enumerate(df_crisp.columns):
-            if j >= len(weights):
-                continue
-            
-            # Ambil nilai Crisp (x_ij)
-            x_ij = df_crisp.loc[idx, col]
-            
-            if TYPES[j] == "benefit":
-                # Benefit: S_i *= x_ij ^ wj
-                nilai_S *= x_ij ** weights[j]
-            else:
-                # Cost: S_i *= x_ij ^ (-wj)
-                nilai_S *= x_ij ** (-weights[j])
-        
-        S.append(nilai_S)
-
-    S = np.array(S)
-    
-    # 3. Hitung Vektor V (V_i = S_i / Sum(S))
-    sum_S = S.sum()
-    if sum_S == 0:
-        V = np.zeros_like(S)
+# Perhitungan normalize_saw, saw_calc dan wp_calc ada di paket fuzzymadm
+# (lihat fuzzymadm/frames.py); halaman ini hanya menampilkan hasilnya.
+
+pipeline = get_pipeline_cache()
+
+def get_incremental_results(df_crisp):
+    """Hasil SAW & WP dari IncrementalRanker di session state.
+       Ranker dibuat ulang bila baris/kolom (tambah/hapus alternatif) atau parameter TFN berubah."""
+    X = impute_missing(df_crisp.to_numpy(dtype=float), TYPES, missing_policy)
+    ranker = st.session_state.get("ranker")
+    if (ranker is None or not st.session_state.ranker_index.equals(df_crisp.index)
+            or st.session_state.ranker_columns != list(df_crisp.columns)
+            or (ranker.spread, ranker.method) != (spread, defuzz_method)):
+        ranker = IncrementalRanker(X, ws, TYPES, spread=spread, method=defuzz_method)
+        st.session_state.ranker = ranker
+        st.session_state.ranker_index = df_crisp.index.copy()
+        st.session_state.ranker_columns = list(df_crisp.columns)
     else:
-        V = S / sum_S
-
-    res = pd.DataFrame({"S": S, "V": V}, index=df_crisp.index)
-    res["Rank"] = res["V"].rank(ascending=False, method='min').astype(int)
-    return res
+        ranker.set_weights(ws).update(X)
+    return incremental_frames(ranker, df_crisp.index, df_crisp.columns)
+
+def data_digest(df_crisp):
+    """Kunci cache data: hash katalog/data bersama (tanpa hashing ulang) atau hash isi DataFrame."""
+    if use_catalog:
+        return catalog.digest
+    if data.is_shared:
+        return data.digest
+    with timer.stage("hash"):
+        return frame_digest(df_crisp)
+
+def use_incremental():
+    """IncrementalRanker tidak mendukung bobot per baris dari kebijakan "skip"."""
+    return incremental_mode and not use_catalog and missing_policy != "skip"
+
+def imputed(df_crisp, digest):
+    """(data, digest) dengan NaN diisi sesuai kebijakan median/penalty (lihat fuzzymadm/missing.py)."""
+    with timer.stage("impute"):
+        return pipeline.impute_frame(df_crisp, criteria_types, missing_policy, digest)
+
+def prefiltered(df_crisp, digest):
+    """(data, digest, info): hanya alternatif skyline bila prefilter aktif (lihat fuzzymadm/skyline.py)."""
+    if not prefilter:
+        return df_crisp, digest, None
+    with timer.stage("skyline"):
+        sky, info = pipeline.skyline_filter(df_crisp, criteria_types, digest=digest)
+    skyline_status.caption(f"Skyline: {info['kept']:,} dari {info['rows']:,} alternatif, "
+                           f"{info['pruned']:,} terdominasi dipangkas.")
+    return sky, f"{digest}:skyline", info
+
+def compute_saw(df_crisp):
+    """(hasil, normalisasi, TFN agregat) Fuzzy SAW sesuai mode yang dipilih."""
+    if use_incremental():
+        with timer.stage("incremental_update"):
+            res_saw, normal, tfn_total, _ = get_incremental_results(df_crisp)
+        return res_saw, normal, tfn_total
+    data, digest, info = prefiltered(*imputed(df_crisp, data_digest(df_crisp)))
+    # Normalisasi memakai min/max data penuh agar skor sama dengan tanpa prefilter
+    bounds = info["bounds"] if info else None
+    with timer.stage("normalize_saw"):
+        pipeline.normalize_saw(data, criteria_types, digest=digest, bounds=bounds)
+    with timer.stage("saw_calc"):
+        return pipeline.saw_calc(data, ws, criteria_types, digest=digest, spread=spread,
+                                 method=defuzz_method, bounds=bounds, missing=engine_missing)
+
+def compute_wp(df_crisp):
+    """Hasil WP (S, V, Rank) sesuai mode yang dipilih."""
+    if use_incremental():
+        with timer.stage("incremental_update"):
+            return get_incremental_results(df_crisp)[3]
+    df_crisp, full_digest = imputed(df_crisp, data_digest(df_crisp))
+    data, digest, info = prefiltered(df_crisp, full_digest)
+    lo = lse = None
+    if info:
+        # V = S / Sum(S) tetap dijumlahkan atas seluruh alternatif
+        lo = info["bounds"][0]
+        with timer.stage("wp_total"):
+            lse = pipeline.wp_log_total(df_crisp, ws, criteria_types, digest=full_digest,
+                                        missing=engine_missing)
+    with timer.stage("wp_calc"):
+        return pipeline.wp_calc(data, ws, criteria_types, digest=digest, lo=lo, lse=lse,
+                                missing=engine_missing)
 
 # Helper function untuk mendapatkan data
 def get_processed_data():
     """Mengambil data dari session state dan melakukan validasi/konversi."""
-    df = st.session_state.df.copy()
+    if use_catalog:
+        # Katalog sudah numerik dan tervalidasi saat dibuat; tanpa salinan
+        if catalog.criteria != CRITERIA_NAMES:
+            st.warning(f"Kriteria katalog {catalog.criteria} tidak sesuai dengan {CRITERIA_NAMES}.")
+            return pd.DataFrame()
+        return catalog.to_frame()
+
+    if data.is_shared:
+        # Data bersama sudah numerik dan read-only; dipakai tanpa salinan
+        return data.frame
+
+    df = data.frame.copy()
     
     # Coba konversi semua data menjadi numerik, menangani error
     try:
-        df = df.apply(pd.to_numeric, errors='coerce')
+        with timer.stage("to_numeric"):
+            df = df.apply(pd.to_numeric, errors='coerce')
         # Hapus baris atau kolom yang seluruhnya NaN setelah konversi (jika ada input data kotor)
         df.dropna(axis=0, how='all', inplace=True)
         df.dropna(axis=1, how='all', inplace=True)
@@ -226,61 +285,56 @@ if page == "Home":
 elif page == "Input Data":
     st.header("📝 Input / Edit Data Alternatif (Nilai Crisp)")
     st.markdown('<div class="card">', unsafe_allow_html=True)
+
+    if use_catalog:
+        st.info(f"Sumber data: katalog bersama `{CATALOG_PATH}` — {len(catalog):,} alternatif, "
+                f"{catalog.X.dtype}, read-only. Pilih 'Data sesi' di sidebar untuk mengedit data.")
+        results_table(catalog.to_frame(), key="tbl_catalog", decimals=2)
+    else:
+        uploaded_file = st.file_uploader(
+            "Upload file Excel (.xlsx) atau CSV (.csv)",
+            type=["csv", "xlsx"]
+        )
     
-    uploaded_file = st.file_uploader(
-        "Upload file Excel (.xlsx) atau CSV (.csv)",
-        type=["csv", "xlsx"]
-    )
-    
-    if uploaded_file is not None:
-        try:
-            if uploaded_file.name.endswith('.csv'):
-                uploaded_df = pd.read_csv(uploaded_file, index_col=0)
-            else: # xlsx
-                # Menggunakan baris ke-14 (indeks 13) sebagai header, sesuai format file Anda
-                uploaded_df = pd.read_excel(uploaded_file, header=13, index_col=1)
-                
-                # Coba ambil hanya kolom Crisp C1, C2, C3, C4
-                # Di file Anda, kolom Crisp C1, C2, C3, C4 berada di kolom 'Crisp C1', 'Crisp C2', 'Crisp C3', 'Crisp C4'
-                # Kolom ke-4, ke-7, ke-10, ke-13 (indeks 4, 7, 10, 13)
-                # Dari snippet: [A1, AWS, $150/bln, Cukup Mahal, 60], [95/100, Sangat Baik, 100]...
-                # Kolom yang kita butuhkan adalah Crisp C1 (indeks 4), Crisp C2 (indeks 7), Crisp C3 (indeks 10), Crisp C4 (indeks 13)
-                
-                # Baca ulang dengan skiprows dan usecols jika diperlukan, tapi mari kita coba filter setelah read_excel
-                if 'Crisp C1' in uploaded_df.columns:
-                    # Ini adalah format dari file Anda
-                    col_map = {
-                        'Crisp C1': 'Biaya',
-                        'Crisp C2': 'Kinerja',
-                        'Crisp C3': 'Keamanan',
-                        'Crisp C4': 'Skalabilitas'
-                    }
-                    uploaded_df = uploaded_df[list(col_map.keys())].rename(columns=col_map)
-                else:
-                    # Asumsi user upload file CSV sederhana dengan kolom pertama sebagai index
-                    st.info("Asumsi kolom 1-4 adalah Biaya, Kinerja, Keamanan, Skalabilitas.")
-                    uploaded_df = uploaded_df.iloc[:, :4]
-                    uploaded_df.columns = CRITERIA_NAMES
-                    
-            st.session_state.df = uploaded_df
-            st.success("File berhasil diunggah dan data dimuat.")
-            
-        except Exception as e:
-            st.error(f"Terjadi error saat memproses file: {e}. Pastikan file memiliki format yang benar (misal, Crisp C1, C2, C3, C4 berada di kolom yang diharapkan).")
-            # Kembali ke default jika gagal
-            st.session_state.df = DEFAULT_DF.copy()
+        if uploaded_file is not None:
+            # File di-parse sekali per isi (hash); rerun berikutnya tidak memuat ulang
+            # sehingga hasil edit di tabel tidak tertimpa. Parsing disimpan sebagai
+            # sidecar kolumnar (lihat fuzzymadm/ingest.py).
+            # `data` tetap SessionFrame; isi file mentah disimpan di `raw`
+            raw = uploaded_file.getvalue()
+            digest = content_hash(raw)
+            if st.session_state.get("upload_hash") != digest:
+                try:
+                    uploaded_df, info = ingest_upload(uploaded_file.name, raw, CRITERIA_NAMES, digest=digest)
+                    if info["layout"] == "positional":
+                        st.info("Asumsi kolom 1-4 adalah Biaya, Kinerja, Keamanan, Skalabilitas.")
+                    data.replace(uploaded_df)
+                    st.session_state.upload_hash = digest
+                    st.session_state.upload_info = info
+                    st.success("File berhasil diunggah dan data dimuat.")
+
+                except Exception as e:
+                    st.error(f"Terjadi error saat memproses file: {e}. Pastikan file memiliki format yang benar (misal, Crisp C1, C2, C3, C4 berada di kolom yang diharapkan).")
+                    # Kembali ke default jika gagal
+                    data.reset()
+                    st.session_state.upload_hash = None
+
+            info = st.session_state.get("upload_info")
+            if info and info["hash"] == digest:
+                st.caption(f"Ingest: {info['rows']} baris dari {info['source']} "
+                           f"({info['layout']}) dalam {info['seconds'] * 1e3:.1f} ms")
 
     
-    st.subheader("Tabel Data Crisp (Untuk diedit/diperiksa)")
-    edited = st.data_editor(
-        st.session_state.df,
-        num_rows="dynamic",
-        use_container_width=True,
-    )
-    st.session_state.df = edited
-
-    st.download_button("⬇ Download data (.csv)", edited.to_csv().encode('utf-8'),
-                       file_name="data_crisp_input.csv")
+        st.subheader("Tabel Data Crisp (Untuk diedit/diperiksa)")
+        edited = st.data_editor(
+            data.frame,
+            num_rows="dynamic",
+            use_container_width=True,
+        )
+        data.update(edited)
+
+        st.download_button("⬇ Download data (.csv)", edited.to_csv().encode('utf-8'),
+                           file_name="data_crisp_input.csv")
     st.markdown("</div>", unsafe_allow_html=True)
 
 elif page == "Fuzzy SAW":
@@ -295,32 +349,34 @@ elif page == "Fuzzy SAW":
             st.error("Jumlah kolom data Crisp tidak sesuai dengan jumlah bobot (harus 4 kriteria).")
         else:
             try:
-                res_saw, normal, tfn_total = saw_calc(df_crisp, ws)
+                res_saw, normal, tfn_total = compute_saw(df_crisp)
     
                 st.markdown('<div class="card">', unsafe_allow_html=True)
                 st.subheader("Matriks Normalisasi Fuzzy SAW")
-                st.dataframe(normal.style.format("{:.6f}"), use_container_width=True)
+                with timer.stage("render"):
+                    results_table(normal, key="tbl_saw_normal")
                 # 
                 st.markdown("</div>", unsafe_allow_html=True)
     
                 st.markdown('<div class="card">', unsafe_allow_html=True)
                 st.subheader("TFN Agregat (a, m, b) - Vektor V_i")
-                tfn_df = pd.DataFrame.from_dict(tfn_total, orient='index', columns=["a", "m", "b"])
-                st.dataframe(tfn_df.style.format("{:.6f}"), use_container_width=True)
+                with timer.stage("render"):
+                    tfn_df = tfn_total.to_frame()
+                    results_table(tfn_df, key="tbl_saw_tfn")
                 st.markdown("</div>", unsafe_allow_html=True)
     
                 st.markdown('<div class="card">', unsafe_allow_html=True)
                 st.subheader("Skor Defuzzifikasi & Ranking")
-                st.dataframe(res_saw.style.format("{:.6f}"), use_container_width=True)
+                with timer.stage("render"):
+                    results_table(res_saw, key="tbl_saw", sort_by="Rank")
     
-                out = pd.concat([df_crisp, normal.add_prefix("Norm_"), tfn_df.add_prefix("TFN_"), res_saw], axis=1)
-                buf = BytesIO()
-                out.to_excel(buf, index=True, engine="openpyxl")
-                buf.seek(0)
-    
-                st.download_button("⬇ Download hasil SAW (.xlsx)", data=buf,
-                                   file_name="hasil_fuzzy_saw.xlsx",
-                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+                # File ekspor baru dibuat saat diminta dan di-cache berdasarkan hash hasil
+                with timer.stage("export"):
+                    download_section(
+                        [df_crisp, tfn_df, res_saw],
+                        lambda: pd.concat([df_crisp, normal.add_prefix("Norm_"), tfn_df.add_prefix("TFN_"), res_saw], axis=1),
+                        basename="hasil_fuzzy_saw", label="hasil SAW", key="export_saw",
+                    )
                 st.markdown("</div>", unsafe_allow_html=True)
             except Exception as e:
                 st.error(f"Terjadi kesalahan saat perhitungan SAW: {e}")
@@ -338,21 +394,17 @@ elif page == "Fuzzy WP":
             st.error("Jumlah kolom data Crisp tidak sesuai dengan jumlah bobot (harus 4 kriteria).")
         else:
             try:
-                res_wp = wp_calc(df_crisp, ws)
+                res_wp = compute_wp(df_crisp)
     
                 st.markdown('<div class="card">', unsafe_allow_html=True)
                 st.subheader("Hasil WP (Vektor S, Vektor V, Ranking)")
-                st.dataframe(res_wp.style.format("{:.6f}"), use_container_width=True)
+                with timer.stage("render"):
+                    results_table(res_wp, key="tbl_wp", sort_by="Rank")
                 # 
     
-                buf = BytesIO()
-                res_wp.to_excel(buf, index=True, engine="openpyxl")
-                buf.seek(0)
-    
-                st.download_button("⬇ Download hasil WP (.xlsx)",
-                                   data=buf,
-                                   file_name="hasil_wp.xlsx",
-                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+                with timer.stage("export"):
+                    download_section([res_wp], lambda: res_wp,
+                                     basename="hasil_wp", label="hasil WP", key="export_wp")
                 st.markdown("</div>", unsafe_allow_html=True)
             except Exception as e:
                 st.error(f"Terjadi kesalahan saat perhitungan WP: {e}")
@@ -365,26 +417,24 @@ elif page == "Perbandingan":
         st.warning("Data Crisp tidak tersedia atau tidak valid. Harap periksa halaman Input Data.")
     else:
         try:
-            res_saw, _, _ = saw_calc(df_crisp, ws)
-            res_wp = wp_calc(df_crisp, ws)
+            res_saw, _, _ = compute_saw(df_crisp)
+            res_wp = compute_wp(df_crisp)
     
             # Ganti nama kolom untuk perbandingan
             compare = pd.DataFrame({"Fuzzy SAW Score": res_saw["Score"], "WP Vektor V": res_wp["V"]})
     
             st.markdown('<div class="card">', unsafe_allow_html=True)
             st.subheader("Tabel Perbandingan Skor")
-            st.dataframe(compare.style.format("{:.6f}"), use_container_width=True)
+            with timer.stage("render"):
+                results_table(compare, key="tbl_compare", sort_by="Fuzzy SAW Score", ascending=False)
             st.markdown("</div>", unsafe_allow_html=True)
     
             st.markdown('<div class="card">', unsafe_allow_html=True)
             st.subheader("Grafik Perbandingan")
     
-            fig, ax = plt.subplots(figsize=(10, 5))
-            compare.plot(kind='bar', ax=ax, rot=0)
-            ax.set_ylabel("Skor Keputusan")
-            ax.set_title("Perbandingan Skor Fuzzy SAW vs WP")
-            ax.grid(axis='y', linestyle='--', alpha=0.7)
-            st.pyplot(fig)
+            # PNG di-cache per hash hasil; figure tidak disimpan di pyplot (lihat fuzzymadm/charts.py)
+            with timer.stage("chart"):
+                comparison_chart(compare, key="chart_compare")
     
             top_saw = compare["Fuzzy SAW Score"].idxmax()
             top_wp = compare["WP Vektor V"].idxmax()
@@ -400,6 +450,133 @@ elif page == "Perbandingan":
             st.error(f"Terjadi kesalahan saat perhitungan perbandingan: {e}")
 
 
+elif page == "Sensitivitas":
+    st.header("🎲 Analisis Sensitivitas Bobot")
+
+    df_crisp = get_processed_data()
+    if df_crisp.empty:
+        st.warning("Data Crisp tidak tersedia atau tidak valid. Harap periksa halaman Input Data.")
+    else:
+        st.subheader("📏 Interval Stabilitas Bobot (analitik)")
+        st.write("Rentang tiap bobot (bobot lain diskalakan ulang agar total 1) di mana alternatif "
+                 "teratas tidak berubah. Di batas, *Pengganti* menyamai skor pemimpin.")
+        try:
+            # "skip" tidak linear terhadap bobot; di sini diperlakukan seperti "none"
+            X = impute_missing(df_crisp.to_numpy(dtype=float), criteria_types, missing_policy)
+            with timer.stage("stability"):
+                stab_saw = saw_stability(X, ws, criteria_types, spread, defuzz_method)
+                stab_wp = wp_stability(X, ws, criteria_types)
+            col_saw, col_wp = st.columns(2)
+            with col_saw:
+                st.caption(f"Fuzzy SAW — pemimpin: *{df_crisp.index[stab_saw['leader']]}*")
+                st.dataframe(stability_frame(stab_saw, df_crisp.index, df_crisp.columns),
+                             use_container_width=True)
+            with col_wp:
+                st.caption(f"WP — pemimpin: *{df_crisp.index[stab_wp['leader']]}*")
+                st.dataframe(stability_frame(stab_wp, df_crisp.index, df_crisp.columns),
+                             use_container_width=True)
+        except Exception as e:
+            st.error(f"Terjadi kesalahan saat menghitung interval stabilitas: {e}")
+
+        st.subheader("Monte Carlo")
+        st.write("Ribuan vektor bobot diambil dari distribusi Dirichlet di sekitar bobot sidebar, "
+                 "lalu seluruhnya dinilai sekaligus. *b1* = proporsi sampel di mana alternatif menjadi ranking 1.")
+        col_k, col_c, col_seed = st.columns(3)
+        with col_k:
+            n_samples = st.number_input("Jumlah sampel bobot (K)", 100, 50_000, 10_000, 100)
+        with col_c:
+            concentration = st.slider("Konsentrasi Dirichlet", 5.0, 500.0, 50.0, 5.0,
+                                      help="Semakin besar, sampel semakin dekat dengan bobot sidebar.")
+        with col_seed:
+            seed = st.number_input("Seed", 0, 2**31 - 1, 0)
+
+        if st.button("🚀 Jalankan Analisis Sensitivitas", type="primary"):
+            try:
+                X = impute_missing(df_crisp.to_numpy(dtype=float), criteria_types, missing_policy)
+                W = sample_weights(ws, int(n_samples), concentration, rng=int(seed))
+                with timer.stage("sensitivity_saw", samples=len(W)):
+                    res_sens = saw_sensitivity(X, ws, criteria_types, W=W, spread=spread, method=defuzz_method)
+                    acc_saw = acceptability_frame(res_sens, df_crisp.index)
+                with timer.stage("sensitivity_wp", samples=len(W)):
+                    acc_wp = acceptability_frame(wp_sensitivity(X, ws, criteria_types, W=W), df_crisp.index)
+
+                col_saw, col_wp = st.columns(2)
+                with col_saw:
+                    st.subheader("Fuzzy SAW")
+                    results_table(acc_saw, key="tbl_acc_saw", decimals=4)
+                    st.bar_chart(acc_saw["b1"].head(20))
+                with col_wp:
+                    st.subheader("WP")
+                    results_table(acc_wp, key="tbl_acc_wp", decimals=4)
+                    st.bar_chart(acc_wp["b1"].head(20))
+            except Exception as e:
+                st.error(f"Terjadi kesalahan saat analisis sensitivitas: {e}")
+
+elif page == "Kelompok":
+    st.header("👥 Keputusan Kelompok (Banyak Penilai)")
+    st.write("Setiap penilai mengunggah satu file (format sama dengan halaman Input Data). "
+             "Nilai per sel diagregasi menjadi TFN (min, rata-rata, max) antar penilai, "
+             "menggantikan spread tetap, lalu Fuzzy SAW & WP kelompok dihitung sekaligus.")
+
+    files = st.file_uploader("Upload penilaian (satu file per penilai)", type=["csv", "xlsx"],
+                             accept_multiple_files=True, key="group_files")
+    if not files:
+        st.info("Unggah file penilaian (satu file per penilai) untuk memulai.")
+    else:
+        raters = {}
+        for f in files:
+            try:
+                data_f = f.getvalue()
+                rater_df, _ = ingest_upload(f.name, data_f, CRITERIA_NAMES, digest=content_hash(data_f))
+                raters[os.path.splitext(f.name)[0]] = rater_df.apply(pd.to_numeric, errors="coerce")
+            except Exception as e:
+                st.error(f"File {f.name} tidak dapat dibaca: {e}")
+
+        col_how, col_w = st.columns(2)
+        with col_how:
+            how = st.radio("Agregasi nilai tengah", GROUP_AGGREGATIONS, horizontal=True,
+                           format_func={"mean": "Rata-rata", "geometric": "Rata-rata geometrik"}.get)
+        with col_w:
+            per_rater = st.toggle("Bobot per penilai", value=False,
+                                  help="Tanpa ini semua penilai memakai bobot sidebar.")
+        group_weights = ws
+        if per_rater and raters:
+            weight_table = st.data_editor(
+                pd.DataFrame([ws] * len(raters), index=list(raters), columns=CRITERIA_NAMES),
+                use_container_width=True, key="group_weights",
+            )
+            group_weights = weight_table.fillna(0).to_numpy(dtype=float)
+
+        if raters:
+            try:
+                with timer.stage("group", raters=len(raters)):
+                    g_saw, g_tfn, g_wp = group_calc(raters, group_weights, TYPES, how, defuzz_method)
+                    g_ranks = rater_ranks_frame(raters, group_weights, TYPES, spread, defuzz_method)
+                st.caption(f"{len(raters)} penilai x {len(g_saw):,} alternatif x "
+                           f"{len(CRITERIA_NAMES)} kriteria")
+
+                col_saw, col_wp = st.columns(2)
+                with col_saw:
+                    st.subheader("Fuzzy SAW Kelompok")
+                    results_table(g_saw, key="tbl_group_saw", sort_by="Rank")
+                with col_wp:
+                    st.subheader("WP Kelompok")
+                    results_table(g_wp, key="tbl_group_wp", sort_by="Rank")
+
+                st.subheader("TFN Agregat Kelompok (a, m, b)")
+                results_table(g_tfn.to_frame(), key="tbl_group_tfn")
+                st.subheader("Ranking Fuzzy SAW per Penilai")
+                results_table(g_ranks, key="tbl_group_ranks")
+
+                download_section(
+                    [g_saw, g_wp, g_ranks],
+                    lambda: pd.concat([g_saw.add_prefix("SAW_"), g_wp.add_prefix("WP_"),
+                                       g_ranks.add_prefix("Rank_")], axis=1),
+                    basename="hasil_kelompok", label="hasil kelompok", key="export_group",
+                )
+            except Exception as e:
+                st.error(f"Terjadi kesalahan saat perhitungan kelompok: {e}")
+
 elif page == "Tentang":
     st.header("ℹ Tentang Aplikasi")
     st.markdown("""
@@ -411,3 +588,17 @@ elif page == "Tentang":
 
     Dibuat menggunakan *Python + Streamlit* untuk antarmuka web interaktif.
     """)
+
+# ---------- Statistik Cache ----------
+with st.sidebar.expander("🗄 Cache Perhitungan"):
+    cache_stats = pipeline.stats()
+    st.caption(f"{cache_stats['items']} item, {cache_stats['bytes'] / 2**20:.1f} / "
+               f"{cache_stats['max_bytes'] / 2**20:.0f} MB, {cache_stats['evictions']} eviksi")
+    if cache_stats["stages"]:
+        st.dataframe(pd.DataFrame(cache_stats["stages"]).T, use_container_width=True)
+    if incremental_mode and "ranker" in st.session_state:
+        st.caption(f"Mode inkremental — jumlah pembaruan: {st.session_state.ranker.counts}")
+
+# ---------- Panel Debug ----------
+memory_report(timer)
+debug_panel(timer, profiler)
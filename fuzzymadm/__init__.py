@@ -0,0 +1,65 @@
+"""Mesin perhitungan Fuzzy MADM (SAW & WP) tanpa Streamlit.
+
+Hanya bergantung pada NumPy. Adapter pandas (`normalize_saw`, `saw_calc`,
+`wp_calc` versi DataFrame) ada di `fuzzymadm.frames` dan hanya dimuat
+bila dibutuhkan.
+"""
+from .criteria import CRITERIA_NAMES, DEFAULT_WEIGHTS, TYPES, normalize_weights
+from .crisp import (
+    DEFAULT_CRISP_TABLES,
+    convert_column,
+    convert_matrix,
+    konversi_crips,
+    load_crisp_tables,
+)
+from .normalize import minmax_bounds, normalize_minmax, normalize_ratio
+from .ranking import rank_min, rank_ordinal, top_k, top_k_mask
+from .saw import defuzzify_mean, saw_aggregate, saw_crisp, saw_scores, saw_tfn
+from .tfn import DEFAULT_SPREAD, DEFUZZIFY_METHODS, TFNArray, defuzzify, tri
+from .wp import (
+    NONPOSITIVE_POLICIES,
+    log_sum_exp,
+    wp_aggregate,
+    wp_exponents,
+    wp_log_matrix,
+    wp_log_s,
+    wp_scores,
+    wp_vector,
+)
+
+__all__ = [
+    "CRITERIA_NAMES",
+    "DEFAULT_CRISP_TABLES",
+    "DEFAULT_SPREAD",
+    "DEFAULT_WEIGHTS",
+    "DEFUZZIFY_METHODS",
+    "NONPOSITIVE_POLICIES",
+    "TFNArray",
+    "TYPES",
+    "convert_column",
+    "convert_matrix",
+    "defuzzify",
+    "defuzzify_mean",
+    "konversi_crips",
+    "load_crisp_tables",
+    "log_sum_exp",
+    "minmax_bounds",
+    "normalize_minmax",
+    "normalize_ratio",
+    "normalize_weights",
+    "rank_min",
+    "rank_ordinal",
+    "saw_aggregate",
+    "saw_crisp",
+    "saw_scores",
+    "saw_tfn",
+    "top_k",
+    "top_k_mask",
+    "tri",
+    "wp_aggregate",
+    "wp_exponents",
+    "wp_log_matrix",
+    "wp_log_s",
+    "wp_scores",
+    "wp_vector",
+]
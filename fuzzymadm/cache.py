@@ -0,0 +1,248 @@
+"""Cache hasil perhitungan berbasis hash isi data.
+
+`LRUCache` menyimpan nilai dengan batas memori (byte) dan eviksi LRU.
+`PipelineCache` membagi pipeline menjadi tahap-tahap yang di-cache
+terpisah: normalisasi dan matriks log WP hanya bergantung pada data,
+sedangkan agregasi SAW/WP bergantung pada data + bobot. Menggeser slider
+bobot cukup mengulang tahap agregasi.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .criteria import TYPES
+from .tfn import DEFAULT_SPREAD, TFNArray
+
+
+def array_digest(*arrays):
+    """Hash isi beberapa array (dtype, shape dan byte) untuk kunci cache."""
+    h = hashlib.blake2b(digest_size=16)
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(f"{a.dtype.str}{a.shape}".encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def nbytes(obj):
+    """Perkiraan memori sebuah nilai cache (array, TFNArray, DataFrame, dict, tuple)."""
+    if isinstance(obj, (np.ndarray, TFNArray)):
+        return obj.nbytes
+    if hasattr(obj, "memory_usage"):  # pandas DataFrame/Series
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(nbytes(v) for v in obj.values())
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(nbytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+class LRUCache:
+    """Cache LRU thread-safe dengan batas total byte dan jumlah item.
+
+    Statistik hit/miss dicatat per tahap (elemen pertama kunci).
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, max_items=None):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.evictions = 0
+        self.hits = {}
+        self.misses = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        stage = key[0] if isinstance(key, tuple) else key
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits[stage] = self.hits.get(stage, 0) + 1
+                return self._data[key][0]
+            self.misses[stage] = self.misses.get(stage, 0) + 1
+            return default
+
+    def put(self, key, value):
+        size = nbytes(value)
+        with self._lock:
+            if key in self._data:
+                self.bytes -= self._data.pop(key)[1]
+            if size > self.max_bytes:
+                return value  # terlalu besar untuk di-cache
+            self._data[key] = (value, size)
+            self.bytes += size
+            while self._data and (self.bytes > self.max_bytes or
+                                  (self.max_items is not None and len(self._data) > self.max_items)):
+                _, (_, old) = self._data.popitem(last=False)
+                self.bytes -= old
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, fn):
+        """Ambil dari cache atau hitung `fn()` lalu simpan."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = self.put(key, fn())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Ringkasan hit/miss per tahap dan pemakaian memori."""
+        stages = sorted(set(self.hits) | set(self.misses))
+        return {
+            "items": len(self._data),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "stages": {s: {"hits": self.hits.get(s, 0), "misses": self.misses.get(s, 0)}
+                       for s in stages},
+        }
+
+
+class PipelineCache(LRUCache):
+    """Cache bertahap untuk `saw_calc`/`wp_calc` versi DataFrame.
+
+    Hasil yang dikembalikan dipakai bersama antar pemanggil; jangan diubah
+    di tempat (salin dulu bila perlu). Tahap data (`PINNED_STAGES`) untuk
+    digest yang di-`pin` (dataset bersama) disimpan di luar LRU dan tidak
+    pernah dieviksi.
+    """
+
+    PINNED_STAGES = ("normalize", "wp_log", "skyline")
+
+    def __init__(self, max_bytes=256 * 2**20, max_items=None):
+        super().__init__(max_bytes, max_items)
+        self._pinned_digests = set()
+        self._pinned = {}
+
+    def pin(self, digest):
+        """Sematkan hasil tahap data untuk `digest` (mis. `SharedFrame.digest`)."""
+        with self._lock:
+            self._pinned_digests.add(digest)
+
+    def get_or_compute(self, key, fn):
+        if key[0] not in self.PINNED_STAGES or key[1] not in self._pinned_digests:
+            return super().get_or_compute(key, fn)
+        with self._lock:
+            if key in self._pinned:
+                self.hits[key[0]] = self.hits.get(key[0], 0) + 1
+                return self._pinned[key]
+            self.misses[key[0]] = self.misses.get(key[0], 0) + 1
+        value = fn()
+        with self._lock:
+            return self._pinned.setdefault(key, value)
+
+    def clear(self):
+        super().clear()
+        with self._lock:
+            self._pinned.clear()
+
+    def stats(self):
+        out = super().stats()
+        with self._lock:
+            out["pinned_items"] = len(self._pinned)
+            out["pinned_bytes"] = sum(nbytes(v) for v in self._pinned.values())
+        return out
+
+    def _data_key(self, df_crisp, types, digest=None):
+        from .frames import frame_digest
+
+        return digest or frame_digest(df_crisp), tuple(types)
+
+    def impute_frame(self, df_crisp, types=TYPES, policy="median", digest=None):
+        """Data dengan NaN diisi (lihat `frames.impute_frame`): (DataFrame, digest).
+
+        Digest hasil = digest data asli + kebijakan, sehingga tahap berikutnya
+        tidak perlu meng-hash ulang data yang sudah diisi.
+        """
+        from .frames import impute_frame
+        from .missing import IMPUTE_POLICIES
+
+        if policy not in IMPUTE_POLICIES:
+            return df_crisp, digest
+        digest, _ = self._data_key(df_crisp, types, digest)
+        filled = self.get_or_compute(("impute", digest, tuple(types), policy),
+                                     lambda: impute_frame(df_crisp, types, policy))
+        return filled, f"{digest}:{policy}"
+
+    def normalize_saw(self, df_crisp, types=TYPES, data_key=None, digest=None, bounds=None):
+        from .frames import normalize_saw
+
+        data_key = data_key or self._data_key(df_crisp, types, digest)
+        key = ("normalize", *data_key) + (() if bounds is None else (array_digest(*bounds),))
+        return self.get_or_compute(key, lambda: normalize_saw(df_crisp, types, bounds))
+
+    def saw_calc(self, df_crisp, weights, types=TYPES, digest=None, spread=DEFAULT_SPREAD,
+                 method="mean", bounds=None, missing="none"):
+        """Sama seperti `frames.saw_calc`, dengan normalisasi di-cache terpisah.
+
+        `digest` (mis. `MatrixStore.digest`) menggantikan hash isi DataFrame.
+        """
+        from .frames import saw_from_normal
+
+        df_crisp, digest = self.impute_frame(df_crisp, types, missing, digest)
+        data_key = self._data_key(df_crisp, types, digest)
+        normal = self.normalize_saw(df_crisp, types, data_key, bounds=bounds)
+        if bounds is not None:
+            data_key += (array_digest(*bounds),)
+        key = ("saw", *data_key, array_digest(np.asarray(weights, dtype=float)), spread, method,
+               missing == "skip")
+        res, tfn_total = self.get_or_compute(
+            key, lambda: saw_from_normal(normal, weights, spread, method, missing))
+        return res, normal, tfn_total
+
+    def wp_calc(self, df_crisp, weights, types=TYPES, nonpositive="clip", digest=None,
+                lo=None, lse=None, missing="none"):
+        """Sama seperti `frames.wp_calc`, dengan matriks log di-cache terpisah."""
+        from .frames import wp_from_log, wp_log_frame
+
+        w = np.asarray(weights, dtype=float)
+        df_crisp, digest = self.impute_frame(df_crisp, types, missing, digest)
+        data_key = self._data_key(df_crisp, types, digest)
+        if lo is not None:
+            data_key += (array_digest(lo),)
+        # Matriks log hanya bergantung pada data dan pola bobot nol
+        active = tuple(w[:df_crisp.shape[1]] != 0)
+        logx = self.get_or_compute(("wp_log", *data_key, nonpositive, active),
+                                   lambda: wp_log_frame(df_crisp, w, types, nonpositive, lo))
+        key = ("wp", *data_key, nonpositive, array_digest(w), lse, missing == "skip")
+        return self.get_or_compute(
+            key, lambda: wp_from_log(df_crisp.index, logx, w, types, lse, missing))
+
+    def skyline_filter(self, df_crisp, types=TYPES, digest=None):
+        """Sama seperti `frames.skyline_filter`, di-cache per data.
+
+        Hasil tahap data ini disematkan bersama dataset yang di-`pin`.
+        """
+        from .frames import skyline_filter
+
+        data_key = self._data_key(df_crisp, types, digest)
+        return self.get_or_compute(("skyline", *data_key), lambda: skyline_filter(df_crisp, types))
+
+    def wp_log_total(self, df_crisp, weights, types=TYPES, nonpositive="clip", digest=None,
+                     missing="none"):
+        """log(Sum S) seluruh data (lihat `frames.wp_log_total`), di-cache per bobot."""
+        from .frames import wp_log_total
+
+        w = np.asarray(weights, dtype=float)
+        df_crisp, digest = self.impute_frame(df_crisp, types, missing, digest)
+        key = ("wp_total", *self._data_key(df_crisp, types, digest), nonpositive, array_digest(w),
+               missing == "skip")
+        return self.get_or_compute(
+            key, lambda: wp_log_total(df_crisp, w, types, nonpositive, missing))
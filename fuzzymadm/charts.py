@@ -0,0 +1,133 @@
+"""Grafik perbandingan SAW vs WP, dirender langsung ke PNG.
+
+Figure dibuat dengan `matplotlib.figure.Figure` (bukan pyplot), sehingga
+tidak terdaftar di state global pyplot dan langsung dibersihkan setelah
+dirender; yang disimpan/di-cache hanya bytes PNG. Untuk n besar grafik
+batang per alternatif diganti top-N, scatter skor atau plot ranking
+dengan titik yang di-downsample. Membutuhkan matplotlib dan pandas.
+"""
+from io import BytesIO
+
+import numpy as np
+
+from .ranking import rank_min
+
+CHART_MODES = ("auto", "bar", "top", "scatter", "rank")
+# Mode "auto": batang per alternatif sampai BAR_MAX alternatif, selebihnya scatter
+BAR_MAX = 30
+TOP_N = 20
+MAX_POINTS = 5000
+
+
+def choose_mode(n, mode="auto"):
+    if mode == "auto":
+        return "bar" if n <= BAR_MAX else "scatter"
+    if mode not in CHART_MODES:
+        raise ValueError(f"mode harus salah satu dari {CHART_MODES}, bukan {mode!r}")
+    return mode
+
+
+def top_union(saw, wp, k):
+    """Indeks alternatif yang masuk k teratas SAW atau WP."""
+    return np.union1d(np.flatnonzero(rank_min(saw) <= k), np.flatnonzero(rank_min(wp) <= k))
+
+
+def downsample(n, max_points, keep=()):
+    """Indeks titik yang digambar: semua `keep` + sampel berjarak rata dari sisanya.
+
+    Deterministik (tanpa acak) sehingga hasil cache konsisten.
+    """
+    if n <= max_points:
+        return np.arange(n)
+    keep = np.asarray(keep, dtype=np.intp)
+    rest = np.setdiff1d(np.arange(n), keep, assume_unique=True)
+    k = max(max_points - len(keep), 0)
+    step = rest[np.linspace(0, len(rest) - 1, k).astype(np.intp)] if k else rest[:0]
+    return np.union1d(keep, step)
+
+
+def _figure(figsize):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+
+def comparison_figure(compare, mode="auto", top_n=TOP_N, max_points=MAX_POINTS):
+    """Figure perbandingan; kolom pertama `compare` = skor SAW, kedua = V WP."""
+    saw_col, wp_col = compare.columns[:2]
+    saw = compare[saw_col].to_numpy(dtype=float)
+    wp = compare[wp_col].to_numpy(dtype=float)
+    n = len(compare)
+    mode = choose_mode(n, mode)
+
+    if mode == "bar":
+        fig, ax = _figure((10, 5) if n <= BAR_MAX else (min(4 + 0.25 * n, 30), 5))
+        compare.iloc[:, :2].plot(kind="bar", ax=ax, rot=0 if n <= 10 else 90)
+        ax.set_ylabel("Skor Keputusan")
+        ax.set_title("Perbandingan Skor Fuzzy SAW vs WP")
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        fig.tight_layout()
+        return fig
+
+    if mode == "top":
+        # V WP berjumlah 1 (~1/n per alternatif), jadi diberi sumbu y sendiri
+        sub = compare.iloc[top_union(saw, wp, top_n)].sort_values(saw_col, ascending=False)
+        x = np.arange(len(sub))
+        fig, ax = _figure((min(4 + 0.3 * len(sub), 30), 5))
+        ax.bar(x - 0.2, sub[saw_col], width=0.4, color="tab:blue", label=saw_col)
+        ax2 = ax.twinx()
+        ax2.bar(x + 0.2, sub[wp_col], width=0.4, color="tab:orange", label=wp_col)
+        ax.set_xticks(x, [str(i) for i in sub.index], rotation=90)
+        ax.set_ylabel(saw_col)
+        ax2.set_ylabel(wp_col)
+        ax.set_title(f"Top-{top_n} Fuzzy SAW / WP ({len(sub)} dari {n:,} alternatif)")
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        handles, labels = ax.get_legend_handles_labels()
+        handles2, labels2 = ax2.get_legend_handles_labels()
+        ax.legend(handles + handles2, labels + labels2, loc="lower right")
+        fig.tight_layout()
+        return fig
+
+    best = top_union(saw, wp, min(top_n, 10))
+    idx = downsample(n, max_points, keep=best)
+    note = f" ({len(idx):,} dari {n:,} titik)" if len(idx) < n else ""
+    fig, ax = _figure((8, 6))
+    if mode == "scatter":
+        x, y, xlabel, ylabel = saw, wp, saw_col, wp_col
+        ax.set_title(f"Skor Fuzzy SAW vs WP{note}")
+    else:
+        x, y = rank_min(saw).astype(float), rank_min(wp).astype(float)
+        xlabel, ylabel = "Ranking Fuzzy SAW", "Ranking WP"
+        lim = max(n, 1)
+        ax.plot([1, lim], [1, lim], color="grey", linestyle="--", linewidth=1)
+        ax.set_title(f"Ranking Fuzzy SAW vs WP{note}")
+        if n > 100:
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+    ax.scatter(x[idx], y[idx], s=8 if len(idx) > 500 else 20, alpha=0.5, linewidths=0)
+    ax.scatter(x[best], y[best], s=30, color="tab:red", label=f"top-{min(top_n, 10)} SAW/WP")
+    if len(best) <= 10:
+        for i in best:
+            ax.annotate(str(compare.index[i]), (x[i], y[i]), fontsize=8,
+                        xytext=(3, 3), textcoords="offset points")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(linestyle="--", alpha=0.5)
+    ax.legend(loc="best")
+    fig.tight_layout()
+    return fig
+
+
+def figure_png(fig, dpi=100):
+    """Render `fig` ke bytes PNG lalu kosongkan figure (melepas artist & buffer)."""
+    buf = BytesIO()
+    try:
+        fig.savefig(buf, format="png", dpi=dpi)
+    finally:
+        fig.clear()
+    return buf.getvalue()
+
+
+def comparison_png(compare, mode="auto", top_n=TOP_N, max_points=MAX_POINTS, dpi=100):
+    return figure_png(comparison_figure(compare, mode, top_n, max_points), dpi)
@@ -0,0 +1,248 @@
+"""Antarmuka baris perintah: `python -m fuzzymadm <perintah> ...`."""
+import argparse
+import json
+import sys
+
+from .criteria import CRITERIA_NAMES, DEFAULT_WEIGHTS, TYPES, normalize_weights
+from .wp import NONPOSITIVE_POLICIES
+
+
+def _csv_list(text):
+    return [s.strip() for s in text.split(",") if s.strip()]
+
+
+def _float_list(text):
+    return [float(s) for s in _csv_list(text)]
+
+
+def _add_model_args(p):
+    """Argumen kriteria/bobot yang dipakai bersama oleh beberapa perintah."""
+    p.add_argument("--criteria", type=_csv_list, default=CRITERIA_NAMES,
+                   help="nama kolom kriteria, dipisah koma (default: %(default)s)")
+    p.add_argument("--types", type=_csv_list, default=TYPES,
+                   help="cost/benefit per kriteria (default: %(default)s)")
+    p.add_argument("--weights", type=_float_list, default=list(DEFAULT_WEIGHTS),
+                   help="bobot per kriteria, dinormalisasi agar total 1 (default: %(default)s)")
+    p.add_argument("--nonpositive", choices=NONPOSITIVE_POLICIES, default="clip",
+                   help="penanganan nilai <= 0 pada WP (default: %(default)s)")
+
+
+def _check_model(ap, args):
+    if not (len(args.criteria) == len(args.types) == len(args.weights)):
+        ap.error("--criteria, --types dan --weights harus sama panjang")
+    if set(args.types) - {"cost", "benefit"}:
+        ap.error("--types hanya boleh berisi 'cost' atau 'benefit'")
+    args.weights = normalize_weights(args.weights)
+
+
+def _check_rank(ap, args):
+    _check_model(ap, args)
+    if args.top_k is not None and args.top_k < 1:
+        ap.error("--top-k harus >= 1")
+    if args.chunksize < 1:
+        ap.error("--chunksize harus >= 1")
+
+
+def cmd_rank(args):
+    from .stream import rank_file
+
+    report = rank_file(
+        args.input, args.output, method=args.method, criteria=args.criteria,
+        types=args.types, weights=args.weights, index_col=args.index_col,
+        chunksize=args.chunksize, top_k=args.top_k, nonpositive=args.nonpositive,
+        in_fmt=args.input_format, out_fmt=args.output_format, log=sys.stderr,
+    )
+    print(f"Total: {report['rows']:,} baris, {report['seconds']:.2f} s "
+          f"({report['rows_per_sec']:,.0f} baris/detik)", file=sys.stderr)
+    if args.report:
+        with open(args.report, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+def load_table(path, criteria):
+    """Membaca CSV/Parquet (kolom pertama/index = nama alternatif) ke DataFrame kriteria."""
+    import pandas as pd
+
+    from .stream import file_format
+
+    if file_format(path) == "parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, index_col=0)
+    return df[list(criteria)].apply(pd.to_numeric, errors="coerce")
+
+
+def cmd_scenarios(args):
+    from .scenarios import expand_jobs, run_scenarios
+
+    with open(args.config) as fh:
+        cfg = json.load(fh)
+    criteria = cfg.get("criteria", CRITERIA_NAMES)
+    types = cfg.get("types", TYPES)
+    datasets = {name: load_table(path, criteria) for name, path in cfg["datasets"].items()}
+    if "jobs" in cfg:
+        jobs = [{"types": types, **job} for job in cfg["jobs"]]
+    else:
+        jobs = expand_jobs(datasets, cfg["weights"], cfg.get("methods", ("saw", "wp")), types)
+    for job in jobs:
+        job["weights"] = list(normalize_weights(job["weights"]))
+
+    results, report = run_scenarios(datasets, jobs, workers=args.workers, top_k=args.top_k)
+    if args.output == "-":
+        results.to_csv(sys.stdout, index=False)
+    elif args.output.lower().endswith((".parquet", ".pq")):
+        results.to_parquet(args.output, index=False)
+    else:
+        results.to_csv(args.output, index=False)
+    if args.report:
+        report.to_csv(args.report, index=False)
+
+    failed = report[report["status"] != "ok"]
+    print(f"{len(report)} skenario, {len(failed)} gagal, {report.attrs['wall_seconds']:.2f} s "
+          f"(total waktu job {report['seconds'].sum():.2f} s)", file=sys.stderr)
+    for _, row in failed.iterrows():
+        print(f"  GAGAL {row['scenario']}: {row['error']}", file=sys.stderr)
+    return 1 if len(failed) else 0
+
+
+def cmd_store(args):
+    from .store import write_store
+    from .stream import iter_chunks
+
+    def chunks():
+        return iter_chunks(args.input, args.criteria, args.index_col, args.chunksize,
+                           args.input_format)
+
+    # Tahap 1 hanya menghitung baris agar file .npy bisa dialokasikan sekali
+    index_name, rows = None, 0
+    for index_name, _, X in chunks():
+        rows += len(X)
+    store = write_store(args.output, ((index, X) for _, index, X in chunks()), rows,
+                        args.criteria, args.types, args.dtype, index_name)
+    print(f"{store!r} digest={store.digest}", file=sys.stderr)
+    return 0
+
+
+def _check_store(ap, args):
+    if len(args.criteria) != len(args.types):
+        ap.error("--criteria dan --types harus sama panjang")
+    if set(args.types) - {"cost", "benefit"}:
+        ap.error("--types hanya boleh berisi 'cost' atau 'benefit'")
+    if args.chunksize < 1:
+        ap.error("--chunksize harus >= 1")
+
+
+def cmd_serve(args):
+    import asyncio
+    import os
+
+    from .service import Dataset, RankingService
+    from .store import open_store
+
+    service = RankingService(args.max_batch, args.max_wait_ms / 1000, args.workers)
+    for name, path in args.dataset:
+        if os.path.isdir(path):
+            ds = Dataset.from_store(name, open_store(path))
+        else:
+            ds = Dataset.from_frame(name, load_table(path, args.criteria), args.types)
+        service.register(ds)
+        print(f"dataset {name!r}: {len(ds):,} alternatif dari {path}", file=sys.stderr)
+
+    def ready(server):
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Melayani di http://{host}:{port} (Ctrl+C untuk berhenti)", file=sys.stderr)
+
+    try:
+        asyncio.run(service.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+def _dataset_arg(text):
+    name, sep, path = text.partition("=")
+    if not sep or not name or not path:
+        raise argparse.ArgumentTypeError("format: NAMA=PATH")
+    return name, path
+
+
+def _check_serve(ap, args):
+    if len(args.criteria) != len(args.types):
+        ap.error("--criteria dan --types harus sama panjang")
+    if set(args.types) - {"cost", "benefit"}:
+        ap.error("--types hanya boleh berisi 'cost' atau 'benefit'")
+    if args.max_batch < 1 or args.max_wait_ms < 0:
+        ap.error("--max-batch harus >= 1 dan --max-wait-ms >= 0")
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog="python -m fuzzymadm",
+                                 description="Perangkingan Fuzzy SAW / WP tanpa Streamlit.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("rank", help="ranking file CSV/Parquet besar per chunk (dua tahap)")
+    p.add_argument("input", help="file CSV atau Parquet")
+    p.add_argument("-o", "--output", default="-", help="file hasil .csv/.parquet, '-' = stdout")
+    p.add_argument("--method", choices=("saw", "wp"), default="saw")
+    p.add_argument("--index-col", default=None,
+                   help="kolom nama alternatif (default: kolom pertama)")
+    p.add_argument("--chunksize", type=int, default=100_000)
+    p.add_argument("--top-k", type=int, default=None,
+                   help="hanya tulis k alternatif terbaik beserta Rank")
+    p.add_argument("--input-format", choices=("csv", "parquet"), default=None)
+    p.add_argument("--output-format", choices=("csv", "parquet"), default=None)
+    p.add_argument("--report", default=None, help="simpan ringkasan waktu (JSON)")
+    _add_model_args(p)
+    p.set_defaults(func=cmd_rank, check=_check_rank)
+
+    p = sub.add_parser("scenarios", help="jalankan banyak skenario (dataset x bobot x metode) paralel")
+    p.add_argument("config", help="file JSON: datasets, weights, methods atau jobs")
+    p.add_argument("-o", "--output", default="-", help="tabel hasil .csv/.parquet, '-' = stdout")
+    p.add_argument("--report", default=None, help="simpan status & waktu per job (CSV)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="jumlah proses (default: jumlah CPU, 0 = tanpa pool)")
+    p.add_argument("--top-k", type=int, default=None,
+                   help="hanya simpan alternatif dengan Rank <= k per skenario")
+    p.set_defaults(func=cmd_scenarios, check=lambda ap, args: None)
+
+    p = sub.add_parser("store", help="ubah CSV/Parquet menjadi store memory-mapped (read-only)")
+    p.add_argument("input", help="file CSV atau Parquet")
+    p.add_argument("output", help="direktori store tujuan")
+    p.add_argument("--dtype", choices=("float32", "float64"), default="float64")
+    p.add_argument("--index-col", default=None,
+                   help="kolom nama alternatif (default: kolom pertama)")
+    p.add_argument("--chunksize", type=int, default=100_000)
+    p.add_argument("--input-format", choices=("csv", "parquet"), default=None)
+    p.add_argument("--criteria", type=_csv_list, default=CRITERIA_NAMES,
+                   help="nama kolom kriteria, dipisah koma (default: %(default)s)")
+    p.add_argument("--types", type=_csv_list, default=TYPES,
+                   help="cost/benefit per kriteria (default: %(default)s)")
+    p.set_defaults(func=cmd_store, check=_check_store)
+
+    p = sub.add_parser("serve", help="layanan HTTP/JSON lokal SAW/WP dengan micro-batching")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--dataset", type=_dataset_arg, action="append", default=[],
+                   metavar="NAMA=PATH",
+                   help="file CSV/Parquet atau direktori store; boleh diulang")
+    p.add_argument("--max-batch", type=int, default=256,
+                   help="maksimum permintaan per batch (default: %(default)s)")
+    p.add_argument("--max-wait-ms", type=float, default=2.0,
+                   help="waktu tunggu pengumpulan batch (default: %(default)s ms)")
+    p.add_argument("--workers", type=int, default=None, help="jumlah thread perhitungan")
+    p.add_argument("--criteria", type=_csv_list, default=CRITERIA_NAMES,
+                   help="kolom kriteria untuk file CSV/Parquet (default: %(default)s)")
+    p.add_argument("--types", type=_csv_list, default=TYPES,
+                   help="cost/benefit per kriteria (default: %(default)s)")
+    p.set_defaults(func=cmd_serve, check=_check_serve)
+    return ap
+
+
+def main(argv=None):
+    ap = build_parser()
+    args = ap.parse_args(argv)
+    args.check(ap, args)
+    return args.func(args)
@@ -0,0 +1,78 @@
+"""Konversi nilai crips (raw data) ke skala 1..4 berbasis tabel ambang.
+
+Setiap kriteria memiliki tabel {"kind", "thresholds", "scores"}:
+
+* kind "cost"   : batas atas inklusif; x <= thresholds[0] -> scores[0],
+                  x <= thresholds[1] -> scores[1], ..., sisanya scores[-1].
+* kind "benefit": batas bawah inklusif; x >= thresholds[-1] -> scores[-1],
+                  ..., x < thresholds[0] -> scores[0].
+
+`thresholds` harus naik dan `len(scores) == len(thresholds) + 1`. Konversi
+seluruh kolom dilakukan sekaligus dengan `np.searchsorted` (semantik
+`np.digitize`).
+"""
+import json
+
+import numpy as np
+
+DEFAULT_CRISP_TABLES = {
+    # C1 Biaya (Cost) - Input: Harga ($/bln)
+    "C1": {"kind": "cost", "thresholds": [50, 100, 150], "scores": [4, 3, 2, 1]},
+    # C2, C3, C4 (Benefit) - Input: Skor (0-100)
+    "C2": {"kind": "benefit", "thresholds": [60, 80, 90], "scores": [1, 2, 3, 4]},
+    "C3": {"kind": "benefit", "thresholds": [60, 80, 90], "scores": [1, 2, 3, 4]},
+    "C4": {"kind": "benefit", "thresholds": [60, 80, 90], "scores": [1, 2, 3, 4]},
+}
+
+
+def validate_table(table):
+    """Memeriksa satu tabel ambang; melempar ValueError bila tidak valid."""
+    if table.get("kind") not in ("cost", "benefit"):
+        raise ValueError(f"kind harus 'cost' atau 'benefit', bukan {table.get('kind')!r}")
+    t = np.asarray(table["thresholds"], dtype=float)
+    if len(table["scores"]) != len(t) + 1:
+        raise ValueError("jumlah scores harus = jumlah thresholds + 1")
+    if np.any(np.diff(t) <= 0):
+        raise ValueError("thresholds harus naik tegas")
+    return table
+
+
+def load_crisp_tables(path):
+    """Membaca tabel ambang per kriteria dari file JSON."""
+    with open(path) as fh:
+        tables = json.load(fh)
+    return {code: validate_table(t) for code, t in tables.items()}
+
+
+def convert_column(values, table):
+    """Konversi satu kolom nilai crips sekaligus (binary search).
+
+    NaN mendapat skor cabang terakhir (`else`) seperti `konversi_crips`:
+    scores[-1] untuk cost dan scores[0] untuk benefit.
+    """
+    x = np.asarray(values, dtype=float)
+    t = np.asarray(table["thresholds"], dtype=float)
+    scores = np.asarray(table["scores"])
+    if table["kind"] == "cost":
+        idx = np.searchsorted(t, x, side="left")  # NaN -> len(t) -> scores[-1]
+    else:
+        idx = np.searchsorted(t, x, side="right")
+        idx[np.isnan(x)] = 0
+    return scores[idx]
+
+
+def convert_matrix(X, codes, tables=DEFAULT_CRISP_TABLES):
+    """Konversi matriks (n x m) dengan tabel `tables[codes[j]]` per kolom."""
+    X = np.asarray(X, dtype=float)
+    cols = [convert_column(X[:, j], tables[code]) for j, code in enumerate(codes)]
+    return np.column_stack(cols) if cols else np.empty((len(X), 0))
+
+
+def konversi_crips(kode, nilai, tables=DEFAULT_CRISP_TABLES):
+    """
+    Konversi nilai crips (raw data) ke nilai bobot (1, 2, 3, 4).
+    Mengembalikan None bila kode kriteria tidak dikenal.
+    """
+    if kode not in tables:
+        return None
+    return convert_column(np.array([nilai]), tables[kode])[0].item()
@@ -0,0 +1,18 @@
+"""Definisi kriteria default (Crisp C1..C4) dan utilitas bobot."""
+import numpy as np
+
+# C1=Biaya (Cost), C2=Kinerja (Benefit), C3=Keamanan (Benefit), C4=Skalabilitas (Benefit)
+CRITERIA_NAMES = ["Biaya", "Kinerja", "Keamanan", "Skalabilitas"]
+TYPES = ["cost", "benefit", "benefit", "benefit"]
+
+# Bobot kriteria (C1=0.35, C2=0.3, C3=0.15, C4=0.2)
+DEFAULT_WEIGHTS = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def normalize_weights(raw, default=DEFAULT_WEIGHTS):
+    """Normalisasi bobot agar total = 1; kembali ke `default` jika total 0."""
+    raw = np.asarray(raw, dtype=float)
+    total = raw.sum()
+    if total == 0:
+        return np.array(default, dtype=float)
+    return raw / total
@@ -0,0 +1,81 @@
+"""Ekspor hasil ke XLSX/CSV/Parquet, dibuat hanya saat diminta.
+
+XLSX ditulis dengan workbook openpyxl mode write-only (baris dialirkan per
+chunk, memori penulis konstan). CSV dan Parquet melewati openpyxl sama
+sekali. `ExportCache` menyimpan byte hasil ekspor berkunci hash isi tabel,
+sehingga rerun dengan hasil yang sama tidak membangun file lagi.
+"""
+import importlib.util
+from io import BytesIO
+
+from .cache import LRUCache
+
+MIME_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Jumlah baris per chunk saat mengalirkan baris ke penulis
+CHUNK_ROWS = 10_000
+
+
+def available_formats():
+    """Format ekspor yang dependensinya terpasang."""
+    fmts = ["csv"]
+    if importlib.util.find_spec("openpyxl"):
+        fmts.insert(0, "xlsx")
+    if importlib.util.find_spec("pyarrow"):
+        fmts.append("parquet")
+    return fmts
+
+
+def _write_xlsx(df, fh):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append([df.index.name or ""] + [str(c) for c in df.columns])
+    for start in range(0, len(df), CHUNK_ROWS):
+        chunk = df.iloc[start:start + CHUNK_ROWS].reset_index()
+        # NaN tidak didukung Excel -> sel kosong, sama seperti DataFrame.to_excel
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(fh)
+
+
+def write_export(df, fh, fmt="xlsx"):
+    """Menulis `df` (dengan index) ke file/buffer `fh` dalam format `fmt`."""
+    if fmt == "xlsx":
+        _write_xlsx(df, fh)
+    elif fmt == "csv":
+        df.to_csv(fh, index=True, chunksize=CHUNK_ROWS)
+    elif fmt == "parquet":
+        df.to_parquet(fh, index=True)
+    else:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt!r} (pilih {list(MIME_TYPES)}).")
+
+
+def export_bytes(df, fmt="xlsx"):
+    """Hasil ekspor `df` sebagai bytes."""
+    if fmt == "csv":
+        return df.to_csv(index=True).encode("utf-8")
+    buf = BytesIO()
+    write_export(df, buf, fmt)
+    return buf.getvalue()
+
+
+class ExportCache(LRUCache):
+    """Cache bytes ekspor berkunci hash isi tabel sumber."""
+
+    def get_export(self, frames, fmt, build):
+        """Bytes ekspor untuk `frames` (list DataFrame sumber).
+
+        `build()` menyusun DataFrame yang diekspor dan hanya dipanggil bila
+        kombinasi isi `frames` + format belum ada di cache.
+        """
+        from .frames import frame_digest
+
+        key = ("export", fmt, *(frame_digest(f) for f in frames))
+        return self.get_or_compute(key, lambda: export_bytes(build(), fmt))
@@ -0,0 +1,309 @@
+"""Adapter pandas untuk mesin NumPy.
+
+Modul ini mengimpor pandas, sehingga tidak ikut dimuat oleh
+`import fuzzymadm`. Fungsi-fungsinya menghasilkan DataFrame yang sama
+dengan yang ditampilkan halaman-halaman Streamlit.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .crisp import DEFAULT_CRISP_TABLES, convert_matrix
+from .criteria import TYPES
+from .missing import check_missing_policy, impute_missing, saw_tfn_skip, wp_log_s_skip
+from .normalize import minmax_bounds, normalize_minmax, normalize_ratio
+from .ranking import rank_min, rank_ordinal, top_k
+from .saw import saw_crisp, saw_scores
+from .tfn import DEFAULT_SPREAD, TFNArray
+from .skyline import skyline_mask
+from .wp import (
+    log_sum_exp,
+    wp_aggregate,
+    wp_exponents,
+    wp_log_matrix,
+    wp_log_s,
+    wp_scores,
+    wp_vector,
+)
+
+
+def frame_digest(df):
+    """Hash isi DataFrame (nilai, index dan nama kolom) untuk kunci cache."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def impute_frame(df, types=TYPES, policy="median"):
+    """Isi NaN `df` sesuai kebijakan "median"/"penalty" (lihat fuzzymadm.missing).
+
+    Kebijakan lain, atau data tanpa NaN, mengembalikan `df` itu sendiri.
+    """
+    check_missing_policy(policy)
+    X = df.to_numpy(dtype=float)
+    filled = impute_missing(X, types, policy)
+    if filled is X:
+        return df
+    return pd.DataFrame(filled, index=df.index, columns=df.columns)
+
+
+def normalize_saw(df, types=TYPES, bounds=None):
+    """Normalisasi Fuzzy SAW (Min-Max Normalization).
+
+    `bounds` = (min, max) per kolom bila rentang berasal dari data yang
+    lebih besar dari `df` (mis. setelah `skyline_filter`).
+    """
+    lo, hi = bounds if bounds is not None else (None, None)
+    R = normalize_minmax(df.to_numpy(dtype=float), types, lo, hi)
+    return pd.DataFrame(R, index=df.index, columns=df.columns)
+
+
+def saw_from_normal(normal, weights, spread=DEFAULT_SPREAD, method="mean", missing="none"):
+    """Tahap agregasi Fuzzy SAW dari matriks yang sudah dinormalisasi.
+
+    TFN agregat dikembalikan sebagai `TFNArray` berlabel nama alternatif
+    (`tfn_total.to_frame()` untuk tabel a, m, b). `missing="skip"` melewati
+    sel NaN dan menormalisasi ulang bobot per baris.
+    """
+    if missing == "skip":
+        tfn_total = TFNArray(saw_tfn_skip(normal.to_numpy(), weights, spread), normal.index)
+        scores = tfn_total.defuzzify(method)
+    else:
+        scores, total = saw_scores(normal.to_numpy(), weights, spread, method)
+        tfn_total = TFNArray(total.data, normal.index)
+
+    res = pd.DataFrame({"Score": scores}, index=normal.index)
+    res["Rank"] = rank_min(scores)
+    return res, tfn_total
+
+
+def saw_calc(df_crisp, weights, types=TYPES, spread=DEFAULT_SPREAD, method="mean", bounds=None,
+             missing="none"):
+    """Perhitungan Fuzzy SAW. Mengembalikan (hasil, normalisasi, TFNArray agregat).
+
+    `spread` = lebar TFN di sekitar nilai ternormalisasi, `method` = cara
+    defuzzifikasi (lihat `fuzzymadm.tfn.defuzzify`), `missing` = kebijakan
+    nilai NaN (lihat `fuzzymadm.missing`).
+    """
+    df_crisp = impute_frame(df_crisp, types, missing)
+    normal = normalize_saw(df_crisp, types, bounds)
+    res, tfn_total = saw_from_normal(normal, weights, spread, method, missing)
+    return res, normal, tfn_total
+
+
+def wp_log_frame(df_crisp, weights, types=TYPES, nonpositive="clip", lo=None):
+    """Tahap data WP: matriks log(x_ij) (lihat fuzzymadm.wp.wp_log_matrix)."""
+    X = df_crisp.to_numpy(dtype=float)
+    m = min(X.shape[1], len(weights))
+    active = np.asarray(weights, dtype=float)[:m] != 0
+    return wp_log_matrix(X[:, :m], active, nonpositive, lo=lo)
+
+
+def wp_log_total(df_crisp, weights, types=TYPES, nonpositive="clip", missing="none"):
+    """log(Sum S) seluruh alternatif `df_crisp`, untuk V dari sebagian baris."""
+    df_crisp = impute_frame(df_crisp, types, missing)
+    if missing == "skip":
+        log_S = wp_log_s_skip(wp_log_frame(df_crisp, weights, types, nonpositive), weights, types)
+    else:
+        log_S = wp_log_s(df_crisp.to_numpy(dtype=float), weights, types, nonpositive)
+    return np.nan if np.isnan(log_S).any() else log_sum_exp(log_S)
+
+
+def wp_from_log(index, logx, weights, types=TYPES, lse=None, missing="none"):
+    """Tahap bobot WP: log S = log X @ w*, lalu V dengan log-sum-exp.
+
+    `lse` = log(Sum S) seluruh data bila `logx` hanya sebagian alternatif.
+    `missing="skip"` menormalisasi ulang pangkat per baris atas sel non-NaN.
+    """
+    if missing == "skip":
+        log_S = wp_log_s_skip(logx, weights, types)
+    else:
+        log_S = wp_aggregate(logx, wp_exponents(np.asarray(weights, dtype=float)[:logx.shape[1]],
+                                                types))
+    with np.errstate(over="ignore", under="ignore"):
+        S = np.exp(log_S)
+
+    res = pd.DataFrame({"S": S, "V": wp_vector(log_S, lse)}, index=index)
+    # Ranking memakai log S agar tetap benar walaupun S underflow/overflow
+    res["Rank"] = rank_min(log_S)
+    return res
+
+
+def wp_calc(df_crisp, weights, types=TYPES, nonpositive="clip", lo=None, lse=None,
+            missing="none"):
+    """Perhitungan Weighted Product (WP) di ruang log (lihat fuzzymadm.wp).
+
+    Nilai crisp <= 0 ditangani sesuai `nonpositive` ("clip", "shift", "raise"),
+    nilai NaN sesuai `missing` (lihat fuzzymadm.missing).
+    `lo` (min per kolom) dan `lse` (log Sum S) dari data penuh dipakai bila
+    `df_crisp` hanya sebagian alternatif (mis. setelah `skyline_filter`).
+    """
+    df_crisp = impute_frame(df_crisp, types, missing)
+    logx = wp_log_frame(df_crisp, weights, types, nonpositive, lo)
+    return wp_from_log(df_crisp.index, logx, weights, types, lse, missing)
+
+
+def skyline_filter(df_crisp, types=TYPES):
+    """Prefilter Pareto: (DataFrame tanpa alternatif terdominasi, info).
+
+    info = {"rows", "kept", "pruned", "bounds"}; `bounds` = (min, max) per
+    kolom dari data penuh, diteruskan ke `saw_calc`/`normalize_saw` (dan
+    min ke `wp_calc(lo=...)`) agar skor sama dengan tanpa prefilter.
+    """
+    X = df_crisp.to_numpy(dtype=float)
+    keep = skyline_mask(X, types)
+    kept = int(keep.sum())
+    info = {"rows": len(X), "kept": kept, "pruned": len(X) - kept, "bounds": minmax_bounds(X)}
+    return df_crisp[keep], info
+
+
+def incremental_frames(ranker, index, columns):
+    """DataFrame hasil dari `IncrementalRanker`: (hasil SAW, normalisasi, TFN, hasil WP)."""
+    normal = pd.DataFrame(ranker.R, index=index, columns=columns)
+    res_saw = pd.DataFrame({"Score": ranker.saw, "Rank": ranker.saw_rank}, index=index)
+    tfn_total = TFNArray(ranker.tfn, index)
+    res_wp = pd.DataFrame({"S": ranker.S, "V": ranker.V, "Rank": ranker.wp_rank}, index=index)
+    return res_saw, normal, tfn_total, res_wp
+
+
+def saw_top_k(df_crisp, weights, k, types=TYPES):
+    """Hanya alternatif Fuzzy SAW dengan Rank <= k (Score, Rank), urut menurut Rank."""
+    R = normalize_minmax(df_crisp.to_numpy(dtype=float), types)
+    scores, _ = saw_scores(R, weights)
+    idx, rank = top_k(scores, k)
+    return pd.DataFrame({"Score": scores[idx], "Rank": rank}, index=df_crisp.index[idx])
+
+
+def wp_top_k(df_crisp, weights, k, types=TYPES, nonpositive="clip"):
+    """Hanya alternatif WP dengan Rank <= k (S, V, Rank), urut menurut Rank."""
+    logx = wp_log_frame(df_crisp, weights, types, nonpositive)
+    log_S = wp_aggregate(logx, wp_exponents(np.asarray(weights, dtype=float)[:logx.shape[1]], types))
+    idx, rank = top_k(log_S, k)
+    with np.errstate(over="ignore", under="ignore"):
+        S = np.exp(log_S[idx])
+    V = wp_vector(log_S[idx], log_sum_exp(log_S)) if not np.isnan(log_S).any() else np.full(len(idx), np.nan)
+    return pd.DataFrame({"S": S, "V": V, "Rank": rank}, index=df_crisp.index[idx])
+
+
+def acceptability_frame(result, index, ranks=3):
+    """Tabel rank-acceptability: kolom b1..b{ranks} dan Mean Rank, urut menurut b1."""
+    acc = result["acceptability"][:, :ranks]
+    df = pd.DataFrame(acc, index=index, columns=[f"b{r + 1}" for r in range(acc.shape[1])])
+    df["Mean Rank"] = result["mean_rank"]
+    return df.sort_values(["b1", "Mean Rank"], ascending=[False, True])
+
+
+def stability_frame(result, index, criteria):
+    """Tabel interval stabilitas bobot per kriteria (lihat fuzzymadm.stability).
+
+    Kolom Pengganti berisi alternatif yang menyamai pemimpin di batas
+    tersebut (kosong bila pemimpin tidak berganti dalam [0, 1]).
+    """
+    def names(pos):
+        return [index[i] if i >= 0 else None for i in pos]
+
+    return pd.DataFrame({
+        "Bobot": result["weights"],
+        "Batas Bawah": result["lower"],
+        "Batas Atas": result["upper"],
+        "Pengganti Bawah": names(result["lower_by"]),
+        "Pengganti Atas": names(result["upper_by"]),
+    }, index=pd.Index(list(criteria)[:len(result["weights"])], name="Kriteria"))
+
+
+def stack_raters(frames, criteria=None):
+    """Tumpuk DataFrame penilai (dict nama -> df) menjadi array (K, n, m).
+
+    Baris dan kolom disejajarkan dengan frame pertama (atau `criteria`);
+    alternatif yang tidak dinilai seorang penilai menjadi NaN.
+    """
+    frames = dict(frames)
+    if not frames:
+        raise ValueError("minimal satu penilai dibutuhkan")
+    first = next(iter(frames.values()))
+    columns = list(criteria) if criteria is not None else list(first.columns)
+    X = np.stack([df.reindex(index=first.index, columns=columns).to_numpy(dtype=float)
+                  for df in frames.values()])
+    return X, first.index, columns
+
+
+def group_calc(frames, weights, types=TYPES, how="mean", method="mean", nonpositive="clip"):
+    """Fuzzy SAW & WP kelompok (lihat fuzzymadm.group).
+
+    `weights` = bobot bersama (m,) atau per penilai (K, m), urutan sama
+    dengan `frames`. Mengembalikan (hasil SAW, TFNArray agregat, hasil WP).
+    """
+    from .group import group_saw, group_wp_log_s
+
+    X, index, _ = stack_raters(frames)
+    scores, tfn = group_saw(X, weights, types, how, method)
+    res_saw = pd.DataFrame({"Score": scores, "Rank": rank_min(scores)}, index=index)
+    log_S = group_wp_log_s(X, weights, types, how, nonpositive)
+    with np.errstate(over="ignore", under="ignore"):
+        S = np.exp(log_S)
+    res_wp = pd.DataFrame({"S": S, "V": wp_vector(log_S), "Rank": rank_min(log_S)}, index=index)
+    return res_saw, TFNArray(tfn.data, index), res_wp
+
+
+def rater_ranks_frame(frames, weights, types=TYPES, spread=DEFAULT_SPREAD, method="mean"):
+    """Rank Fuzzy SAW tiap penilai (kolom = nama penilai) untuk melihat konsensus."""
+    from .group import rater_saw_scores
+    from .sensitivity import rank_min_rows
+
+    frames = dict(frames)
+    X, index, _ = stack_raters(frames)
+    ranks = rank_min_rows(rater_saw_scores(X, weights, types, spread, method))
+    return pd.DataFrame(ranks.T, index=index, columns=list(frames))
+
+
+def alternatives_frame(df, criteria):
+    """Hasil `ingest_upload` -> tabel kolom "Alternatif" (dari index) + `criteria`.
+
+    Kolom numerik pertama sebanyak `criteria` dipakai berurutan.
+    """
+    if df.shape[1] < len(criteria):
+        raise ValueError(f"hanya {df.shape[1]} kolom numerik, dibutuhkan {len(criteria)}")
+    out = df.iloc[:, :len(criteria)].set_axis(criteria, axis=1)
+    out.insert(0, "Alternatif", df.index.astype(str))
+    return out.reset_index(drop=True)
+
+
+def crisp_saw_wp(df_raw, criteria, weights, types, crisp=False, tables=DEFAULT_CRISP_TABLES):
+    """SAW & WP crisp (sawwp.py) untuk tabel kolom "Alternatif" + `criteria`.
+
+    Baris dengan nilai kosong dilewati, nilai raw dikonversi ke skala 1-4
+    (kecuali `crisp=True`) dan ranking memakai `rank_ordinal`. Mengembalikan
+    dict: valid, saw_norm, saw, wp (urutan data), compare (urut Ranking_SAW)
+    dan skipped (jumlah baris yang dilewati).
+    """
+    valid = df_raw.dropna(subset=criteria).reset_index(drop=True)
+    valid["Alternatif"] = valid["Alternatif"].fillna("").astype(str)
+    if not crisp:
+        valid[criteria] = convert_matrix(valid[criteria].to_numpy(dtype=float), criteria, tables)
+    X = valid[criteria].to_numpy(dtype=float)
+
+    # SAW: benefit x / max(x), cost min(x) / x, lalu V_i = Sum(w_j * r_ij)
+    saw_norm = valid.copy()
+    saw_norm[criteria] = normalize_ratio(X, types)
+    saw = saw_norm.copy()
+    saw["Skor_SAW"] = saw_crisp(saw_norm[criteria].to_numpy(), weights)
+    saw["Ranking"] = rank_ordinal(saw["Skor_SAW"].to_numpy())
+
+    # WP di ruang log (S_i bisa underflow/overflow, V_i tidak)
+    S, V, _ = wp_scores(X, weights, types)
+    wp = pd.DataFrame({"S_i": S, "Skor_WP": V, "Ranking": rank_ordinal(V)},
+                      index=pd.Index(valid["Alternatif"], name="Alternatif"))
+
+    # Digabung per posisi baris (nama alternatif boleh kembar)
+    compare = pd.DataFrame({
+        "Alternatif": valid["Alternatif"],
+        "Ranking_SAW": saw["Ranking"],
+        "Ranking_WP": wp["Ranking"].to_numpy(),
+    })
+    compare["Selisih"] = compare["Ranking_WP"] - compare["Ranking_SAW"]
+    compare = compare.sort_values("Ranking_SAW").reset_index(drop=True)
+    compare.index = pd.RangeIndex(1, len(compare) + 1, name="No.")
+    return {"valid": valid, "saw_norm": saw_norm, "saw": saw, "wp": wp, "compare": compare,
+            "skipped": len(df_raw) - len(valid)}
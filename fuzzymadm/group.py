@@ -0,0 +1,127 @@
+"""Keputusan kelompok: agregasi penilaian banyak penilai (decision maker).
+
+Penilaian K penilai ditumpuk menjadi array (K, n, m) dan diagregasi per
+sel menjadi TFN:
+
+* mean      : (min, rata-rata, max) antar penilai
+* geometric : (min, rata-rata geometrik, max) antar penilai
+
+TFN ini menggantikan spread tetap `tri(v, 0.1)`. Bobot per penilai
+(K, m) diagregasi dengan cara yang sama menjadi bobot TFN (m, 3).
+Agregasi berjalan per penilai dengan akumulator min/jumlah/max berukuran
+(n, m), sehingga memori tambahan tidak bergantung pada K; hanya NumPy.
+"""
+import numpy as np
+
+from .criteria import TYPES
+from .normalize import normalize_minmax
+from .tfn import DEFAULT_SPREAD, TFNArray, defuzzify, tri
+from .wp import wp_log_s
+
+GROUP_AGGREGATIONS = ("mean", "geometric")
+
+
+def _check_how(how):
+    if how not in GROUP_AGGREGATIONS:
+        raise ValueError(f"agregasi harus salah satu dari {GROUP_AGGREGATIONS}, bukan {how!r}")
+
+
+def aggregate_tfn(X, how="mean"):
+    """TFN (n, m, 3) dari tumpukan penilaian crisp X (K, n, m).
+
+    NaN (penilai tidak menilai sel tersebut) diabaikan; sel tanpa nilai
+    dari penilai mana pun menjadi NaN. "geometric" membutuhkan nilai > 0.
+    """
+    _check_how(how)
+    X = np.asarray(X, dtype=float)
+    if X.ndim != 3:
+        raise ValueError(f"penilaian kelompok harus berukuran (K, n, m), bukan {X.shape}")
+    lo = np.full(X.shape[1:], np.nan)
+    hi = np.full(X.shape[1:], np.nan)
+    total = np.zeros(X.shape[1:])
+    count = np.zeros(X.shape[1:])
+    for k, Xk in enumerate(X):
+        ok = ~np.isnan(Xk)
+        if how == "geometric":
+            if (Xk[ok] <= 0).any():
+                raise ValueError(f"rata-rata geometrik membutuhkan nilai > 0 (penilai ke-{k + 1})")
+            Xk = np.log(Xk)
+        lo = np.fmin(lo, X[k])
+        hi = np.fmax(hi, X[k])
+        total += np.where(ok, Xk, 0.0)
+        count += ok
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mid = total / count
+    if how == "geometric":
+        mid = np.exp(mid)
+    return np.stack([lo, mid, hi], axis=-1)
+
+
+def aggregate_weights(weights, m, how="mean"):
+    """Bobot TFN (m, 3) dari bobot bersama (m,) atau per penilai (K, m).
+
+    Bobot setiap penilai dinormalisasi agar total 1 sebelum diagregasi.
+    """
+    _check_how(how)
+    W = np.atleast_2d(np.asarray(weights, dtype=float))[:, :m]
+    total = W.sum(axis=1, keepdims=True)
+    if (W < 0).any() or (total == 0).any():
+        raise ValueError("bobot setiap penilai harus >= 0 dan tidak semuanya 0")
+    W = W / total
+    if how == "geometric":
+        with np.errstate(divide="ignore"):
+            mid = np.exp(np.log(W).mean(axis=0))
+    else:
+        mid = W.mean(axis=0)
+    return np.stack([W.min(axis=0), mid, W.max(axis=0)], axis=-1)
+
+
+def normalize_tfn(T, types=TYPES):
+    """Normalisasi min-max fuzzy per kriteria untuk matriks TFN (n, m, 3).
+
+    Rentang kolom = [min a_ij, max b_ij]; cost dibalik (a, m, b) -> (hi-b, hi-m, hi-a).
+    Kolom dengan rentang 0 bernilai 1.0, sel NaN menjadi TFN (0, 0, 0).
+    """
+    T = np.asarray(T, dtype=float)
+    lo = np.nanmin(T[..., 0], axis=0) if len(T) else np.full(T.shape[1], np.nan)
+    hi = np.nanmax(T[..., 2], axis=0) if len(T) else np.full(T.shape[1], np.nan)
+    span = hi - lo
+    cost = np.asarray(types[:T.shape[1]]) == "cost"
+    with np.errstate(invalid="ignore", divide="ignore"):
+        R = np.where(cost[:, None], hi[:, None] - T[..., ::-1], T - lo[:, None]) / span[:, None]
+    R = np.where((span == 0)[:, None], 1.0, R)
+    return np.nan_to_num(R, nan=0.0)
+
+
+def group_saw(X, weights, types=TYPES, how="mean", method="mean"):
+    """Fuzzy SAW kelompok. Mengembalikan (Score, TFNArray agregat).
+
+    V_i = Sum_j w~_j (x) r~_ij dengan perkalian TFN non-negatif per komponen.
+    """
+    T = normalize_tfn(aggregate_tfn(X, how), types)
+    W = aggregate_weights(weights, T.shape[1], how)
+    tfn = TFNArray(np.einsum("njt,jt->nt", T, W))
+    return tfn.defuzzify(method), tfn
+
+
+def group_wp_log_s(X, weights, types=TYPES, how="geometric", nonpositive="clip"):
+    """log S WP kelompok dari nilai tengah agregat dan bobot tengah agregat.
+
+    Dengan "geometric" dan bobot bersama, S kelompok = rata-rata geometrik
+    S masing-masing penilai.
+    """
+    mid = aggregate_tfn(X, how)[..., 1]
+    w = aggregate_weights(weights, mid.shape[1], how)[:, 1]
+    return wp_log_s(mid, w / w.sum(), types, nonpositive)
+
+
+def rater_saw_scores(X, weights, types=TYPES, spread=DEFAULT_SPREAD, method="mean"):
+    """Skor Fuzzy SAW masing-masing penilai (K, n), dengan bobot per penilai."""
+    X = np.asarray(X, dtype=float)
+    K, n, m = X.shape
+    W = np.broadcast_to(np.atleast_2d(np.asarray(weights, dtype=float))[:, :m], (K, m))
+    W = W / W.sum(axis=1, keepdims=True)
+    scores = np.empty((K, n))
+    for k in range(K):
+        scores[k] = defuzzify(tri(normalize_minmax(X[k], types), spread), method) @ W[k]
+    return scores
@@ -0,0 +1,195 @@
+"""Perangkingan ulang inkremental saat hanya sebagian baris berubah.
+
+`IncrementalRanker` menyimpan min/max per kriteria beserta jumlah
+kemunculannya. Edit yang tidak menggeser min/max suatu kolom hanya
+menghitung ulang baris yang berubah (normalisasi, TFN, skor SAW, log S
+WP) dan memperbarui ranking dengan aturan delta O(n) tanpa sort. Edit
+yang menggeser min/max menormalisasi ulang kolom tersebut untuk semua
+baris.
+"""
+import numpy as np
+
+from .criteria import TYPES
+from .normalize import minmax_bounds, normalize_minmax
+from .ranking import rank_min
+from .saw import saw_aggregate
+from .tfn import DEFAULT_SPREAD, defuzzify, tri
+from .wp import wp_aggregate, wp_exponents, wp_log_matrix, wp_vector
+
+# Di atas jumlah baris berubah ini ranking dihitung ulang penuh (sort)
+RANK_DELTA_MAX_ROWS = 32
+
+
+def changed_rows(old, new):
+    """Indeks baris yang berbeda antara dua matriks (NaN == NaN dianggap sama)."""
+    old = np.asarray(old, dtype=float)
+    new = np.asarray(new, dtype=float)
+    diff = (old != new) & ~(np.isnan(old) & np.isnan(new))
+    return np.flatnonzero(diff.any(axis=1))
+
+
+def _update_ranks(rank, scores, rows, new):
+    """Mengganti skor `rows` dengan `new` dan memperbarui ranking `method='min'`.
+
+    Setiap penggantian O(n): baris lain naik/turun satu peringkat bila skor
+    lama/baru baris tersebut lebih besar darinya.
+    """
+    for i, s in zip(rows, new):
+        o = scores[i]
+        scores[i] = s
+        rank += (s > scores).astype(rank.dtype) - (o > scores)
+        rank[i] = 1 + np.count_nonzero(scores > s)
+
+
+class IncrementalRanker:
+    """Hasil Fuzzy SAW dan WP yang dapat diperbarui per baris.
+
+    Atribut publik: `X`, `lo`, `hi`, `R` (normalisasi), `tfn` (n x 3),
+    `saw` (skor, defuzzifikasi `method`), `saw_rank`, `log_s`, `wp_rank`. `V` dihitung saat diminta.
+    `last_update` berisi "init", "noop", "rows", "bounds" atau "weights".
+    """
+
+    def __init__(self, X, weights, types=TYPES, nonpositive="clip", spread=DEFAULT_SPREAD,
+                 method="mean"):
+        self.types = list(types)
+        self.nonpositive = nonpositive
+        self.spread = spread
+        self.method = method
+        self.weights = np.asarray(weights, dtype=float)
+        self.counts = {"rows": 0, "bounds": 0, "weights": 0}
+        self._build(np.array(X, dtype=float))
+        self.last_update = "init"
+
+    # ---------- perhitungan penuh ----------
+    def _build(self, X):
+        self.X = X
+        self.lo, self.hi = minmax_bounds(X)
+        self._count_bounds()
+        self.R = normalize_minmax(X, self.types, self.lo, self.hi)
+        self.logx = wp_log_matrix(X[:, :self.m], self.weights[:self.m] != 0,
+                                  self.nonpositive, lo=self.lo)
+        self._aggregate()
+
+    def _count_bounds(self):
+        """Jumlah kemunculan min/max per kolom (untuk mendeteksi pergeseran)."""
+        self.n_lo = (self.X == self.lo).sum(axis=0)
+        self.n_hi = (self.X == self.hi).sum(axis=0)
+
+    def _aggregate(self):
+        self.tfn = self._tfn_rows(self.R)
+        self.saw = defuzzify(self.tfn, self.method)
+        self.saw_rank = rank_min(self.saw)
+        self.log_s = wp_aggregate(self.logx, self.expo)
+        self.wp_rank = rank_min(self.log_s)
+
+    def _tfn_rows(self, R):
+        # Reduksi yang sama dengan saw_tfn: skor identik dengan saw_calc
+        return saw_aggregate(tri(R[:, :self.m], self.spread), self.weights[:self.m])
+
+    @property
+    def m(self):
+        return min(self.X.shape[1], len(self.weights))
+
+    @property
+    def expo(self):
+        return wp_exponents(self.weights[:self.m], self.types)
+
+    @property
+    def V(self):
+        return wp_vector(self.log_s)
+
+    @property
+    def S(self):
+        with np.errstate(over="ignore", under="ignore"):
+            return np.exp(self.log_s)
+
+    # ---------- pembaruan ----------
+    def set_weights(self, weights):
+        """Mengganti bobot: normalisasi dan matriks log dipakai ulang."""
+        weights = np.asarray(weights, dtype=float)
+        if np.array_equal(weights, self.weights):
+            return self
+        zero_pattern_changed = not np.array_equal(weights[:self.m] != 0, self.weights[:self.m] != 0)
+        self.weights = weights
+        if zero_pattern_changed:
+            self.logx = wp_log_matrix(self.X[:, :self.m], self.weights[:self.m] != 0,
+                                      self.nonpositive, lo=self.lo)
+        self._aggregate()
+        self.counts["weights"] += 1
+        self.last_update = "weights"
+        return self
+
+    def update(self, X_new):
+        """Menerima matriks baru berukuran sama dan memperbarui baris yang berubah."""
+        X_new = np.asarray(X_new, dtype=float)
+        if X_new.shape != self.X.shape:
+            raise ValueError("Ukuran matriks berubah; buat IncrementalRanker baru.")
+        rows = changed_rows(self.X, X_new)
+        if len(rows) == 0:
+            self.last_update = "noop"
+            return self
+        return self.update_rows(rows, X_new[rows])
+
+    def _moved_columns(self, rows, new):
+        """Kolom yang min/max-nya bergeser akibat penggantian baris `rows`."""
+        old = self.X[rows]
+        lo, hi = self.lo, self.hi
+        with np.errstate(invalid="ignore"):
+            outside = (new < lo).any(axis=0) | (new > hi).any(axis=0)
+        # Kolom yang sebelumnya kosong (semua NaN) mendapat nilai pertama
+        filled = np.isnan(lo) & (~np.isnan(new)).any(axis=0)
+        # Semua kemunculan min/max lama tergantikan
+        lost_lo = self.n_lo - (old == lo).sum(axis=0) + (new == lo).sum(axis=0) <= 0
+        lost_hi = self.n_hi - (old == hi).sum(axis=0) + (new == hi).sum(axis=0) <= 0
+        return outside | filled | ((lost_lo | lost_hi) & ~np.isnan(lo))
+
+    def update_rows(self, rows, values):
+        """Mengganti baris `rows` dengan `values` (k x m)."""
+        rows = np.asarray(rows, dtype=int)
+        values = np.asarray(values, dtype=float).reshape(len(rows), self.X.shape[1])
+
+        if self._moved_columns(rows, values).any():
+            # min/max bergeser: normalisasi ulang seluruh matriks
+            old_lo = self.lo
+            self.X[rows] = values
+            self.lo, self.hi = minmax_bounds(self.X)
+            self._count_bounds()
+            self.R = normalize_minmax(self.X, self.types, self.lo, self.hi)
+            if self.nonpositive == "shift" and not np.array_equal(old_lo, self.lo, equal_nan=True):
+                self.logx = wp_log_matrix(self.X[:, :self.m], self.weights[:self.m] != 0,
+                                          self.nonpositive, lo=self.lo)
+            else:
+                self.logx[rows] = self._log_rows(values)
+            self._aggregate()
+            self.counts["bounds"] += 1
+            self.last_update = "bounds"
+            return self
+
+        old = self.X[rows]
+        self.n_lo += (values == self.lo).sum(axis=0) - (old == self.lo).sum(axis=0)
+        self.n_hi += (values == self.hi).sum(axis=0) - (old == self.hi).sum(axis=0)
+        self.X[rows] = values
+        self.R[rows] = normalize_minmax(values, self.types, self.lo, self.hi)
+        self.logx[rows] = self._log_rows(values)
+
+        # Skor baris dihitung dengan urutan penjumlahan yang sama seperti _aggregate
+        tfn = self._tfn_rows(self.R[rows])
+        self.tfn[rows] = tfn
+        self._rerank(self.saw, self.saw_rank, rows, defuzzify(tfn, self.method))
+        self._rerank(self.log_s, self.wp_rank, rows, wp_aggregate(self.logx[rows], self.expo))
+        self.counts["rows"] += 1
+        self.last_update = "rows"
+        return self
+
+    def _log_rows(self, values):
+        return wp_log_matrix(values[:, :self.m], self.weights[:self.m] != 0,
+                             self.nonpositive, lo=self.lo)
+
+    @staticmethod
+    def _rerank(scores, rank, rows, new):
+        """Memperbarui skor dan ranking di tempat (delta O(n) atau sort penuh)."""
+        if len(rows) > RANK_DELTA_MAX_ROWS or np.isnan(new).any() or np.isnan(scores[rows]).any():
+            scores[rows] = new
+            rank[:] = rank_min(scores)
+        else:
+            _update_ranks(rank, scores, rows, new)
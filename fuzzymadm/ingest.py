@@ -0,0 +1,277 @@
+"""Ingest file unggahan (CSV/XLSX) sekali, lalu simpan sidecar kolumnar.
+
+File diidentifikasi dengan hash isinya. Pada unggahan pertama file
+di-parse dan hanya kolom yang dibutuhkan yang dibaca: kolom nama
+alternatif dan 'Crisp C1'..'Crisp C4' (format Excel dengan header di
+baris ke-14), atau kolom 1-4 bila format tersebut tidak ditemukan. Posisi
+baris header dan kolom nama pada XLSX dapat diatur (`header_row`,
+`index_col`), mis. 0/0 untuk tabel polos.
+Hasilnya (float64) disimpan sebagai sidecar `.npz` sehingga pemuatan
+berikutnya tidak perlu parsing openpyxl/CSV lagi. Sidecar yang lama tidak
+dipakai atau melebihi batas ukuran direktori dihapus (`prune_sidecars`).
+
+Modul ini membutuhkan pandas; XLSX membutuhkan openpyxl.
+"""
+import glob
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+from io import BytesIO
+
+import numpy as np
+
+from .criteria import CRITERIA_NAMES
+
+CRISP_COLUMNS = ["Crisp C1", "Crisp C2", "Crisp C3", "Crisp C4"]
+# Default template fuzzy.py: baris ke-14 (indeks 13) sebagai header,
+# kolom ke-2 (indeks 1) sebagai nama alternatif
+XLSX_HEADER_ROW = 13
+XLSX_INDEX_COL = 1
+
+# Naikkan bila isi/format sidecar berubah agar sidecar lama tidak dipakai
+SIDECAR_VERSION = 2
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "FUZZYMADM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "fuzzymadm-ingest"))
+# Batas direktori sidecar: total ukuran dan umur sejak terakhir dipakai (detik)
+SIDECAR_MAX_BYTES = 512 * 2**20
+SIDECAR_MAX_AGE = 7 * 24 * 3600
+# Prefix file sementara save_sidecar (sisa proses yang mati ikut dibersihkan)
+PARTIAL_PREFIX = ".partial-"
+
+
+def content_hash(data):
+    """Hash isi file (bytes) untuk kunci sidecar."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_csv(data, criteria):
+    import pandas as pd
+
+    header = pd.read_csv(BytesIO(data), nrows=0).columns
+    if all(c in header for c in CRISP_COLUMNS):
+        df = pd.read_csv(BytesIO(data), usecols=[header[0], *CRISP_COLUMNS], index_col=0)
+        return df[CRISP_COLUMNS].set_axis(criteria, axis=1), "crisp"
+    # Hanya kolom nama + len(criteria) kolom pertama yang dibaca
+    df = pd.read_csv(BytesIO(data), usecols=range(min(len(header), len(criteria) + 1)),
+                     index_col=0)
+    return df, "csv"
+
+
+def _parse_xlsx(data, criteria, header_row=XLSX_HEADER_ROW, index_col=XLSX_INDEX_COL):
+    """Membaca lembar pertama langsung dengan openpyxl (read-only).
+
+    Baris header dibaca sekali, lalu baris data hanya sampai kolom terakhir
+    yang dipakai (`max_col`); hanya sel kolom nama dan kolom kriteria yang
+    diambil, tanpa DataFrame selebar seluruh lembar.
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        header_rows = ws.iter_rows(min_row=header_row + 1, max_row=header_row + 1,
+                                   values_only=True)
+        header = ["" if h is None else str(h) for h in next(header_rows, ())]
+        if all(c in header for c in CRISP_COLUMNS):
+            pos = [header.index(c) for c in CRISP_COLUMNS]
+            layout = "crisp"
+        else:
+            # Asumsi kolom 1-4 (selain kolom nama) adalah Biaya, Kinerja, Keamanan, Skalabilitas
+            pos = [i for i in range(len(header)) if i != index_col][:len(criteria)]
+            layout = "positional"
+        if len(pos) < len(criteria):
+            raise ValueError(f"hanya {len(pos)} kolom kriteria ditemukan, dibutuhkan {len(criteria)}")
+        # Kolom di kanan kolom terakhir yang dipakai tidak pernah dibaca
+        rows = ws.iter_rows(min_row=header_row + 2, max_col=max(*pos, index_col) + 1,
+                            values_only=True)
+
+        def cell(row, i):
+            return row[i] if i < len(row) else None
+
+        names, values = [], []
+        for row in rows:
+            if all(v is None for v in row):
+                continue  # baris kosong dilewati seperti pd.read_excel
+            names.append(cell(row, index_col))
+            values.append([cell(row, i) for i in pos])
+    finally:
+        wb.close()
+    index_name = header[index_col] if index_col < len(header) else None
+    df = pd.DataFrame(values, index=pd.Index(names, name=index_name or None), columns=criteria)
+    return df, layout
+
+
+def parse_upload(name, data, criteria=CRITERIA_NAMES, header_row=XLSX_HEADER_ROW,
+                 index_col=XLSX_INDEX_COL):
+    """Parsing file unggahan menjadi DataFrame numerik. Mengembalikan (df, layout).
+
+    layout: "crisp" (kolom 'Crisp C1..C4' ditemukan), "positional" (XLSX,
+    kolom 1-4) atau "csv" (CSV biasa, kolom 1..len(criteria)). `header_row`
+    dan `index_col` (0-based) hanya berlaku untuk XLSX; CSV selalu memakai
+    baris dan kolom pertama.
+    """
+    import pandas as pd
+
+    if name.lower().endswith(".csv"):
+        df, layout = _parse_csv(data, criteria)
+    else:
+        df, layout = _parse_xlsx(data, criteria, header_row, index_col)
+    df = df.apply(pd.to_numeric, errors="coerce").astype("float64")
+    if layout == "csv":
+        df = df.dropna(axis=1, how="all")
+    return df, layout
+
+
+def sidecar_path(digest, criteria=CRITERIA_NAMES, cache_dir=DEFAULT_CACHE_DIR,
+                 header_row=XLSX_HEADER_ROW, index_col=XLSX_INDEX_COL):
+    """Lokasi sidecar: hasil parse bergantung pada isi file, `criteria`, tata letak
+    XLSX (`header_row`, `index_col`) dan format sidecar."""
+    layout = [[str(c) for c in criteria], int(header_row), int(index_col)]
+    key = hashlib.blake2b(repr(layout).encode(), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, f"{digest}-{key}.v{SIDECAR_VERSION}.npz")
+
+
+def _encode_index(index):
+    """Index -> (values, kinds) tanpa pickle.
+
+    Index numerik/datetime disimpan apa adanya (kinds = None). Index object
+    disimpan sebagai teks dengan satu kode tipe per label: s (str), i (int),
+    f (float), b (bool), n (None), N (NaN); tipe lain menjadi teks.
+    """
+    if index.dtype.kind in "iufbM":
+        return index.to_numpy(), None
+    kinds, values = [], []
+    for v in index:
+        if v is None:
+            kinds.append("n"), values.append("")
+        elif isinstance(v, (bool, np.bool_)):
+            kinds.append("b"), values.append(str(int(v)))
+        elif isinstance(v, (int, np.integer)):
+            kinds.append("i"), values.append(str(v))
+        elif isinstance(v, (float, np.floating)):
+            kinds.append("N" if np.isnan(v) else "f"), values.append(repr(float(v)))
+        else:
+            kinds.append("s"), values.append(str(v))
+    return np.asarray(values, dtype=str), np.asarray("".join(kinds))
+
+
+def _decode_index(values, kinds, name):
+    import pandas as pd
+
+    if kinds is None:
+        return pd.Index(values, name=name)
+    decode = {"s": str, "i": int, "f": float, "b": lambda v: bool(int(v)),
+              "n": lambda v: None, "N": lambda v: np.nan}
+    # pd.Index(list) menebak dtype dengan cara yang sama seperti saat parse pertama
+    return pd.Index([decode[k](v) for k, v in zip(kinds, values)], name=name)
+
+
+def save_sidecar(path, df, layout):
+    """Menyimpan DataFrame numerik sebagai .npz (ditulis atomik)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=PARTIAL_PREFIX, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            index, kinds = _encode_index(df.index)
+            np.savez(fh, values=df.to_numpy(dtype="float64"),
+                     index=index, **({} if kinds is None else {"index_kinds": kinds}),
+                     columns=np.asarray([str(c) for c in df.columns], dtype=str),
+                     index_name=np.asarray(str(df.index.name or "")),
+                     layout=np.asarray(layout))
+        os.replace(tmp, path)
+    except BaseException:
+        # Disk penuh, data tidak bisa di-encode, dsb.: jangan tinggalkan file setengah jadi
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_sidecar(path):
+    """Memuat sidecar .npz menjadi (DataFrame, layout)."""
+    import pandas as pd
+
+    with np.load(path, allow_pickle=False) as z:
+        kinds = str(z["index_kinds"]) if "index_kinds" in z else None
+        index = _decode_index(z["index"], kinds, str(z["index_name"]) or None)
+        df = pd.DataFrame(z["values"], index=index, columns=list(z["columns"]))
+        return df, str(z["layout"])
+
+
+def prune_sidecars(cache_dir=DEFAULT_CACHE_DIR, max_bytes=SIDECAR_MAX_BYTES,
+                   max_age=SIDECAR_MAX_AGE, now=None):
+    """Hapus sidecar yang tidak dipakai lebih dari `max_age` detik, lalu yang
+    paling lama tidak dipakai sampai total ukuran <= `max_bytes`.
+
+    Waktu pakai = mtime (diperbarui saat sidecar dimuat). Mengembalikan
+    jumlah file yang dihapus.
+    """
+    now = time.time() if now is None else now
+    cache_dir = glob.escape(os.fspath(cache_dir))
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir, "*.v*.npz")):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    partials = glob.glob(os.path.join(cache_dir, PARTIAL_PREFIX + "*"))
+    removed = 0
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for mtime, size, path in entries:
+        if now - mtime <= max_age and total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+        total -= size
+    for path in partials:
+        try:
+            if now - os.stat(path).st_mtime > max_age:
+                os.unlink(path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def ingest_upload(name, data, criteria=CRITERIA_NAMES, cache_dir=DEFAULT_CACHE_DIR, digest=None,
+                  header_row=XLSX_HEADER_ROW, index_col=XLSX_INDEX_COL):
+    """DataFrame dari file unggahan, memakai sidecar bila isinya pernah di-ingest.
+
+    `header_row`/`index_col` diteruskan ke `parse_upload`. Mengembalikan (df, info) dengan info = {hash, source ("sidecar"/"parsed"),
+    layout, seconds, rows}.
+    """
+    t0 = time.perf_counter()
+    digest = digest or content_hash(data)
+    path = sidecar_path(digest, criteria, cache_dir, header_row, index_col)
+    df = None
+    if os.path.exists(path):
+        try:
+            df, layout = load_sidecar(path)
+            source = "sidecar"
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            df = None  # sidecar rusak/terpotong -> parse ulang
+        else:
+            try:
+                os.utime(path)  # waktu pakai terakhir untuk prune_sidecars
+            except OSError:
+                pass
+    if df is None:
+        df, layout = parse_upload(name, data, criteria, header_row, index_col)
+        source = "parsed"
+        try:
+            save_sidecar(path, df, layout)
+            prune_sidecars(cache_dir)
+        except OSError:
+            pass  # direktori cache tidak bisa ditulis; tetap lanjut tanpa sidecar
+    return df, {"hash": digest, "source": source, "layout": layout,
+                "seconds": time.perf_counter() - t0, "rows": len(df)}
@@ -0,0 +1,84 @@
+"""Kebijakan nilai kriteria yang hilang (NaN), berbasis mask tanpa cek per sel.
+
+Mask `np.isnan(X)` dihitung sekali per matriks lalu dipakai sebagai array:
+
+* none    : perilaku lama; SAW: sel hilang = TFN (0, 0, 0), WP: hasil NaN
+* skip    : kriteria yang hilang dilewati, bobot baris tersebut dinormalisasi
+            ulang atas kriteria yang ada (SAW dan WP)
+* median  : sel hilang diisi median kolom
+* penalty : sel hilang diisi nilai terburuk kolom (min untuk benefit,
+            max untuk cost), sehingga r_ij = 0 pada SAW
+"""
+import warnings
+
+import numpy as np
+
+from .criteria import TYPES
+
+MISSING_POLICIES = ("none", "skip", "median", "penalty")
+# Kebijakan yang mengisi X sebelum normalisasi (hasil berupa matriks baru)
+IMPUTE_POLICIES = ("median", "penalty")
+
+
+def check_missing_policy(policy):
+    if policy not in MISSING_POLICIES:
+        raise ValueError(f"Kebijakan missing tidak dikenal: {policy!r} "
+                         f"(pilih salah satu dari {MISSING_POLICIES}).")
+
+
+def impute_missing(X, types=TYPES, policy="median"):
+    """Salinan X dengan NaN diisi sesuai `policy` ("median"/"penalty").
+
+    Kebijakan lain mengembalikan X apa adanya. Kolom yang seluruhnya NaN
+    tetap NaN.
+    """
+    check_missing_policy(policy)
+    X = np.asarray(X, dtype=float)
+    mask = np.isnan(X)
+    if policy not in IMPUTE_POLICIES or not mask.any():
+        return X
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # kolom seluruhnya NaN
+        if policy == "median":
+            fill = np.nanmedian(X, axis=0)
+        else:
+            cost = np.asarray(types[:X.shape[1]]) == "cost"
+            fill = np.where(cost, np.nanmax(X, axis=0), np.nanmin(X, axis=0))
+    return np.where(mask, fill, X)
+
+
+def skip_weights(present, weights):
+    """Bobot per baris (n, m): 0 untuk kriteria yang hilang, sisanya total 1.
+
+    Baris tanpa satu pun kriteria berbobot bernilai NaN.
+    """
+    w = np.asarray(weights, dtype=float)
+    W = present * w
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return W / W.sum(axis=1, keepdims=True)
+
+
+def saw_tfn_skip(R, weights, spread):
+    """Seperti `saw.saw_tfn`, tetapi kriteria NaN dilewati per baris."""
+    from .tfn import tri
+
+    R = np.asarray(R, dtype=float)
+    m = min(R.shape[1], len(weights))
+    R = R[:, :m]
+    W = skip_weights(~np.isnan(R), np.asarray(weights, dtype=float)[:m])
+    return np.einsum("njk,nj->nk", tri(R, spread), W)
+
+
+def wp_log_s_skip(logx, weights, types=TYPES):
+    """log S WP dengan kriteria NaN dilewati: pangkat dinormalisasi ulang per baris.
+
+    log S_i = Sum_{j ada} w*_j log x_ij / Sum_{j ada} w_j.
+    """
+    from .wp import wp_exponents
+
+    logx = np.asarray(logx, dtype=float)
+    m = min(logx.shape[1], len(weights))
+    w = np.asarray(weights, dtype=float)[:m]
+    present = ~np.isnan(logx[:, :m])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (np.where(present, logx[:, :m], 0.0) @ wp_exponents(w, types)) / (present @ w)
@@ -0,0 +1,49 @@
+"""Normalisasi matriks keputusan (n alternatif x m kriteria)."""
+import warnings
+
+import numpy as np
+
+
+def minmax_bounds(X):
+    """Nilai min dan max per kriteria (mengabaikan NaN)."""
+    X = np.asarray(X, dtype=float)
+    if X.shape[0] == 0:
+        nan = np.full(X.shape[1], np.nan)
+        return nan, nan.copy()
+    with warnings.catch_warnings():
+        # Kolom yang seluruhnya NaN menghasilkan NaN, sama seperti pandas
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmin(X, axis=0), np.nanmax(X, axis=0)
+
+
+def normalize_minmax(X, types, lo=None, hi=None):
+    """Normalisasi Fuzzy SAW (Min-Max Normalization).
+
+    benefit: (x - min) / (max - min), cost: (max - x) / (max - min).
+    Kolom dengan max == min bernilai 1.0; kolom di luar `types` bernilai NaN.
+    `lo`/`hi` dapat diberikan bila min/max sudah dihitung (mis. per chunk).
+    """
+    X = np.asarray(X, dtype=float)
+    if lo is None or hi is None:
+        lo, hi = minmax_bounds(X)
+    lo = np.asarray(lo, dtype=float)
+    hi = np.asarray(hi, dtype=float)
+
+    res = np.full(X.shape, np.nan)
+    m = min(X.shape[1], len(types))
+    cost = np.asarray(types[:m]) == "cost"
+    flat = hi[:m] == lo[:m]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        span = hi[:m] - lo[:m]
+        res[:, :m] = np.where(cost, hi[:m] - X[:, :m], X[:, :m] - lo[:m]) / span
+    res[:, :m][:, flat] = 1.0
+    return res
+
+
+def normalize_ratio(X, types):
+    """Normalisasi SAW klasik: benefit x / max(x), cost min(x) / x."""
+    X = np.asarray(X, dtype=float)
+    lo, hi = minmax_bounds(X)
+    cost = np.asarray(types[:X.shape[1]]) == "cost"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cost, lo / X, X / hi)
@@ -0,0 +1,107 @@
+"""Pengukuran waktu dan alokasi memori per tahap pipeline, plus cProfile opsional.
+
+Setiap tahap dicatat sebagai satu record dan satu baris log JSON di logger
+`fuzzymadm.profile`, contoh:
+
+    {"event": "stage", "run": "3f2a...", "stage": "normalize_saw", "seconds": 0.0042,
+     "alloc_kb": 120.5, "peak_kb": 250.1}
+
+Alokasi diukur dengan tracemalloc (hanya bila `trace_memory=True`, karena
+tracemalloc memperlambat semua alokasi selama aktif). Tahap sebaiknya tidak
+bersarang; pada tahap bersarang puncak memori tahap luar tidak akurat.
+"""
+import cProfile
+import io
+import json
+import logging
+import pstats
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+
+logger = logging.getLogger("fuzzymadm.profile")
+
+
+def enable_logging(level=logging.INFO):
+    """Pasang StreamHandler (stderr) pada logger profil bila belum ada."""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(level)
+    return logger
+
+
+class StageTimer:
+    """Pencatat tahap untuk satu run (mis. satu rerun Streamlit)."""
+
+    def __init__(self, trace_memory=False, run_id=None, **context):
+        self.trace_memory = trace_memory
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.context = context
+        self.records = []
+        self._started_tracing = False
+        self.t0 = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """`with timer.stage("saw_calc"): ...` mencatat waktu (dan alokasi) blok."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            start_mem = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            rec = {"stage": name, "seconds": time.perf_counter() - t0, **fields}
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                rec["alloc_kb"] = (current - start_mem) / 1024
+                rec["peak_kb"] = (peak - start_mem) / 1024
+            self.records.append(rec)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(json.dumps({"event": "stage", "run": self.run_id, **self.context, **rec},
+                                       default=str))
+
+    def total(self):
+        """Waktu sejak timer dibuat (detik)."""
+        return time.perf_counter() - self.t0
+
+    def close(self):
+        """Catat ringkasan run dan hentikan tracemalloc bila dimulai oleh timer ini."""
+        summary = {"event": "run", "run": self.run_id, **self.context, "seconds": self.total(),
+                   "stages": len(self.records)}
+        peaks = [r["peak_kb"] for r in self.records if "peak_kb" in r]
+        if peaks:
+            summary["peak_kb"] = max(peaks)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(summary, default=str))
+        return summary
+
+
+class Profiler:
+    """cProfile untuk satu run: `start()`, lalu `stop(path)` menyimpan file .prof."""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+        return self
+
+    def stop(self, path=None, sort="cumulative", limit=30):
+        """Hentikan profiler; kembalikan ringkasan teks `limit` fungsi teratas."""
+        self.profile.disable()
+        if path:
+            self.profile.dump_stats(path)
+        buf = io.StringIO()
+        pstats.Stats(self.profile, stream=buf).sort_stats(sort).print_stats(limit)
+        return buf.getvalue()
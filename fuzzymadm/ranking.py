@@ -0,0 +1,65 @@
+"""Perangkingan alternatif berdasarkan skor (semakin besar semakin baik)."""
+import numpy as np
+
+
+def rank_min(scores):
+    """Ranking descending dengan penanganan seri seperti
+    pandas `rank(ascending=False, method='min')`. NaN diletakkan paling bawah.
+    """
+    s = np.asarray(scores, dtype=float)
+    n = len(s)
+    order = np.argsort(-s, kind="stable")  # NaN di akhir
+    ordered = s[order]
+    # Awal setiap kelompok nilai seri mendapat posisinya (1-based)
+    start = np.empty(n, dtype=bool)
+    start[:1] = True
+    start[1:] = ordered[1:] != ordered[:-1]
+    pos = np.where(start, np.arange(1, n + 1), 0)
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.maximum.accumulate(pos) if n else pos
+    nan = np.isnan(s)
+    rank[nan] = n - np.count_nonzero(nan) + 1
+    return rank
+
+
+def rank_ordinal(scores):
+    """Ranking 1..n sesuai urutan sort descending (seri dipecah oleh urutan data)."""
+    s = np.asarray(scores, dtype=float)
+    order = np.argsort(-s, kind="stable")
+    rank = np.empty(len(s), dtype=int)
+    rank[order] = np.arange(1, len(s) + 1)
+    return rank
+
+
+def top_k_mask(scores, k):
+    """Mask kandidat top-k memakai partial selection (np.partition).
+
+    Semua nilai yang seri dengan nilai ke-k ikut dipertahankan, sehingga
+    jumlah kandidat bisa > k. NaN tidak pernah menjadi kandidat.
+    """
+    s = np.asarray(scores, dtype=float)
+    valid = ~np.isnan(s)
+    n = np.count_nonzero(valid)
+    if k <= 0:
+        return np.zeros(len(s), dtype=bool)
+    if k >= n:
+        return valid
+    kth = np.partition(s[valid] if n < len(s) else s, n - k)[n - k]
+    return s >= kth
+
+
+def top_k(scores, k):
+    """Indeks dan ranking eksak alternatif dengan Rank <= k, tanpa sort penuh.
+
+    Seri ditangani seperti `rank(ascending=False, method='min')`: ranking
+    pemenang sama dengan `rank_min(scores)`, dan semua alternatif yang seri
+    di batas ke-k ikut dikembalikan. Hasil diurutkan menurut Rank lalu
+    urutan data. Kompleksitas O(n + c log c), c = jumlah kandidat.
+    """
+    idx = np.flatnonzero(top_k_mask(scores, k))
+    s = np.asarray(scores, dtype=float)[idx]
+    # Semua alternatif yang lebih besar dari kandidat juga kandidat,
+    # sehingga ranking di antara kandidat = ranking global.
+    rank = rank_min(s)
+    order = np.lexsort((idx, rank))
+    return idx[order], rank[order]
@@ -0,0 +1,44 @@
+"""Simple Additive Weighting (SAW), versi fuzzy (TFN) dan crisp."""
+import numpy as np
+
+from .tfn import DEFAULT_SPREAD, TFNArray, defuzzify, tri
+
+
+def saw_tfn(R, weights, spread=DEFAULT_SPREAD):
+    """TFN agregat V_i = Sum(w_j * R_ij) untuk seluruh alternatif sekaligus.
+
+    Tensor TFN (n x m x 3) dibentuk sekali lalu diagregasi dengan satu
+    einsum. Kolom di luar jumlah bobot diabaikan. Hasil shape (n, 3).
+    """
+    R = np.asarray(R, dtype=float)
+    m = min(R.shape[1], len(weights))
+    return saw_aggregate(tri(R[:, :m], spread), np.asarray(weights, dtype=float)[:m])
+
+
+def saw_aggregate(T, w):
+    """Sum_j w_j * T_ij untuk tensor TFN T (n x m x 3), hasil shape (n, 3).
+
+    Satu-satunya tempat reduksi SAW dilakukan, agar skor yang seri secara
+    matematis juga seri bit per bit di setiap jalur (frames, service,
+    incremental). einsum tanpa BLAS pada array C-contiguous: hasil per baris
+    tidak bergantung pada baris lain yang ikut dihitung.
+    """
+    return np.einsum("njk,j->nk", np.ascontiguousarray(T, dtype=float), w)
+
+
+def defuzzify_mean(tfn):
+    """Defuzzifikasi rata-rata TFN: Score = (a + m + b) / 3."""
+    return defuzzify(tfn, "mean")
+
+
+def saw_scores(R, weights, spread=DEFAULT_SPREAD, method="mean"):
+    """Fuzzy SAW pada matriks ternormalisasi R. Mengembalikan (Score, TFNArray)."""
+    tfn = TFNArray(saw_tfn(R, weights, spread))
+    return tfn.defuzzify(method), tfn
+
+
+def saw_crisp(R, weights):
+    """SAW crisp: V_i = Sum(w_j * r_ij)."""
+    R = np.asarray(R, dtype=float)
+    m = min(R.shape[1], len(weights))
+    return R[:, :m] @ np.asarray(weights, dtype=float)[:m]
@@ -0,0 +1,144 @@
+"""Menjalankan banyak skenario (dataset, bobot, metode) secara paralel.
+
+Matriks keputusan setiap dataset disalin sekali ke shared memory; proses
+worker menempelkannya sebagai array NumPy read-only sehingga DataFrame
+tidak perlu di-pickle per job. Setiap worker menyimpan normalisasi SAW
+per dataset agar dipakai ulang oleh job berikutnya dengan bobot berbeda.
+
+Modul ini membutuhkan pandas untuk tabel hasil.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .criteria import TYPES
+from .normalize import normalize_minmax
+from .ranking import rank_min, top_k as select_top_k
+from .saw import saw_scores
+from .wp import wp_log_s, wp_vector
+
+# State per proses worker: dataset -> (SharedMemory, array) dan cache normalisasi
+_SHARED = {}
+_NORMAL = {}
+
+
+def _attach(specs):
+    """Initializer worker: menempelkan shared memory setiap dataset."""
+    for name, (shm_name, shape) in specs.items():
+        shm = SharedMemory(name=shm_name)
+        X = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        X.flags.writeable = False
+        _SHARED[name] = (shm, X)
+
+
+def _normal(dataset, types):
+    key = (dataset, tuple(types))
+    if key not in _NORMAL:
+        _NORMAL[key] = normalize_minmax(_SHARED[dataset][1], types)
+    return _NORMAL[key]
+
+
+def run_job(job, top_k=None):
+    """Menjalankan satu skenario di proses ini. Tidak pernah melempar exception."""
+    t0 = time.perf_counter()
+    out = {"job": job["job"], "pid": os.getpid()}
+    try:
+        X = _SHARED[job["dataset"]][1]
+        types = job.get("types", TYPES)
+        weights = np.asarray(job["weights"], dtype=float)
+        if len(weights) != X.shape[1]:
+            raise ValueError(f"jumlah bobot ({len(weights)}) != jumlah kriteria ({X.shape[1]})")
+        if job["method"] == "saw":
+            score, _ = saw_scores(_normal(job["dataset"], types), weights)
+            key = score
+        elif job["method"] == "wp":
+            key = wp_log_s(X, weights, types, job.get("nonpositive", "clip"))
+            score = wp_vector(key)
+        else:
+            raise ValueError(f"metode tidak dikenal: {job['method']!r}")
+        if top_k is None:
+            idx, rank = np.arange(len(key)), rank_min(key)
+        else:
+            idx, rank = select_top_k(key, top_k)
+        out.update(status="ok", idx=idx, score=score[idx], rank=rank)
+    except Exception as e:  # dilaporkan per job, tidak menghentikan runner
+        out.update(status="error", error=f"{type(e).__name__}: {e}")
+    out["seconds"] = time.perf_counter() - t0
+    return out
+
+
+def expand_jobs(datasets, weight_sets, methods=("saw", "wp"), types=TYPES):
+    """Produk kartesius dataset x set bobot x metode menjadi daftar job."""
+    return [
+        {"name": f"{d}/{w}/{m}", "dataset": d, "weights": list(weight_sets[w]),
+         "weight_set": w, "method": m, "types": list(types)}
+        for d in datasets for w in weight_sets for m in methods
+    ]
+
+
+def run_scenarios(datasets, jobs, workers=None, top_k=None):
+    """Menjalankan `jobs` atas `datasets` dan mengumpulkan hasilnya.
+
+    datasets : dict nama -> DataFrame (index = nama alternatif, kolom = kriteria)
+    jobs     : list dict dengan kunci dataset, weights, method (opsional: name,
+               types, nonpositive, weight_set)
+    workers  : jumlah proses (None = os.cpu_count(), 0 = jalan di proses ini)
+    top_k    : bila diisi, hanya alternatif dengan Rank <= top_k yang disimpan
+
+    Mengembalikan (hasil, laporan): `hasil` berformat panjang (satu baris per
+    skenario x alternatif), `laporan` berisi status, waktu dan error per job.
+    """
+    import pandas as pd
+
+    jobs = [{**j, "job": i} for i, j in enumerate(jobs)]
+    shms, specs, index = [], {}, {}
+    try:
+        for name, df in datasets.items():
+            X = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+            shm = SharedMemory(create=True, size=max(X.nbytes, 1))
+            shms.append(shm)
+            np.ndarray(X.shape, dtype=np.float64, buffer=shm.buf)[:] = X
+            specs[name] = (shm.name, X.shape)
+            index[name] = df.index
+
+        t0 = time.perf_counter()
+        if workers == 0:
+            _attach(specs)
+            try:
+                outputs = [run_job(j, top_k) for j in jobs]
+            finally:
+                _SHARED.clear()
+                _NORMAL.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                     initargs=(specs,)) as ex:
+                futures = [ex.submit(run_job, j, top_k) for j in jobs]
+                outputs = [f.result() for f in as_completed(futures)]
+        wall = time.perf_counter() - t0
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+    outputs.sort(key=lambda o: o["job"])
+    frames, report = [], []
+    for job, o in zip(jobs, outputs):
+        name = job.get("name", f"job{job['job']}")
+        report.append({"scenario": name, "dataset": job["dataset"], "method": job["method"],
+                       "status": o["status"], "seconds": o["seconds"], "pid": o["pid"],
+                       "error": o.get("error", "")})
+        if o["status"] == "ok":
+            frames.append(pd.DataFrame({
+                "scenario": name, "dataset": job["dataset"], "method": job["method"],
+                "weight_set": job.get("weight_set", ""),
+                "alternative": np.asarray(index[job["dataset"]])[o["idx"]],
+                "score": o["score"], "rank": o["rank"],
+            }))
+    columns = ["scenario", "dataset", "method", "weight_set", "alternative", "score", "rank"]
+    results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    report = pd.DataFrame(report)
+    report.attrs["wall_seconds"] = wall
+    return results, report
@@ -0,0 +1,120 @@
+"""Analisis sensitivitas bobot (Monte Carlo pada simpleks bobot).
+
+Ribuan vektor bobot diambil dari distribusi Dirichlet di sekitar bobot
+saat ini, lalu seluruhnya dinilai sekaligus sebagai satu perkalian
+(K x m) . (m x n):
+
+* Fuzzy SAW: semua metode defuzzifikasi bersifat linear, sehingga
+  Score = W . defuzzify(TFN(R))^T.
+* WP: log S = W* . log(X)^T (ruang log, lihat fuzzymadm.wp).
+
+Hasilnya rank-acceptability index: b[i, r] = proporsi sampel di mana
+alternatif i mendapat ranking r + 1, hanya untuk r < `ranks` sehingga
+memori O(n * ranks), bukan O(n^2).
+"""
+import numpy as np
+
+from .criteria import TYPES
+from .normalize import normalize_minmax
+from .tfn import DEFAULT_SPREAD, defuzzify, tri
+from .wp import wp_log_matrix
+
+# Jumlah sampel bobot yang dinilai per blok, dan batas sel (K_blok x n) per
+# blok agar memori tetap terbatas untuk katalog besar
+BLOCK_SIZE = 1024
+BLOCK_CELLS = 2**22
+# Jumlah kolom rank-acceptability (b1..b{ranks}) yang dihitung
+DEFAULT_RANKS = 3
+
+
+def sample_weights(center, K, concentration=50.0, rng=None):
+    """K vektor bobot dari Dirichlet(concentration * center).
+
+    `concentration=None` berarti seragam di seluruh simpleks. Kriteria dengan
+    bobot 0 tetap 0. Hasil shape (K, m), setiap baris berjumlah 1.
+    """
+    rng = np.random.default_rng(rng)
+    center = np.asarray(center, dtype=float)
+    center = center / center.sum()
+    active = center > 0
+    alpha = np.ones(active.sum()) if concentration is None else concentration * center[active]
+    W = np.zeros((K, len(center)))
+    W[:, active] = rng.dirichlet(alpha, size=K)
+    return W
+
+
+def rank_min_rows(S):
+    """`rank_min` untuk setiap baris matriks skor (K x n) sekaligus.
+
+    NaN di paling bawah dan seri satu sama lain, seperti `rank_min`.
+    """
+    S = np.asarray(S, dtype=float)
+    K, n = S.shape
+    order = np.argsort(-S, axis=1, kind="stable")
+    ordered = np.take_along_axis(S, order, axis=1)
+    start = np.ones((K, n), dtype=bool)
+    start[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    pos = np.where(start, np.arange(1, n + 1), 0)
+    rank = np.empty((K, n), dtype=np.int64)
+    np.put_along_axis(rank, order, np.maximum.accumulate(pos, axis=1), axis=1)
+    nan = np.isnan(S)
+    if nan.any():
+        # NaN != NaN sehingga tiap NaN memulai kelompok sendiri; samakan di sini
+        rank = np.where(nan, n - nan.sum(axis=1, keepdims=True) + 1, rank)
+    return rank
+
+
+def saw_criteria_matrix(X, types=TYPES, spread=DEFAULT_SPREAD, method="mean"):
+    """Matriks (n x m) nilai defuzzifikasi TFN per sel: Score = matriks @ w."""
+    return defuzzify(tri(normalize_minmax(X, types), spread), method)
+
+
+def acceptability(score_fn, W, n, ranks=DEFAULT_RANKS):
+    """Menghitung rank-acceptability dari fungsi skor blok (K_blok x n).
+
+    Hanya ranking 1..`ranks` yang dihitung (hasil n x ranks); `ranks=None`
+    berarti semua ranking (n x n).
+    """
+    r = n if ranks is None else min(ranks, n)
+    counts = np.zeros(n * r, dtype=np.int64)
+    rank_sum = np.zeros(n)
+    block = max(1, min(BLOCK_SIZE, BLOCK_CELLS // max(n, 1)))
+    for start in range(0, len(W), block):
+        rk = rank_min_rows(score_fn(W[start:start + block]))
+        rank_sum += rk.sum(axis=0)
+        top = rk <= r
+        idx = np.broadcast_to(np.arange(n) * r, rk.shape)[top] + (rk[top] - 1)
+        counts += np.bincount(idx, minlength=n * r)
+    K = len(W)
+    return {
+        "samples": K,
+        "acceptability": counts.reshape(n, r) / K,
+        "mean_rank": rank_sum / K,
+    }
+
+
+def saw_sensitivity(X, weights, types=TYPES, K=10_000, concentration=50.0, rng=None, W=None,
+                    spread=DEFAULT_SPREAD, method="mean", ranks=DEFAULT_RANKS):
+    """Rank-acceptability Fuzzy SAW untuk K sampel bobot di sekitar `weights`."""
+    X = np.asarray(X, dtype=float)
+    m = min(X.shape[1], len(weights))
+    C = np.nan_to_num(saw_criteria_matrix(X, types, spread, method)[:, :m])  # NaN -> TFN (0,0,0)
+    if W is None:
+        W = sample_weights(np.asarray(weights, dtype=float)[:m], K, concentration, rng)
+    res = acceptability(lambda Wb: Wb @ C.T, W, len(X), ranks)
+    res["weights"] = W
+    return res
+
+
+def wp_sensitivity(X, weights, types=TYPES, K=10_000, concentration=50.0, rng=None, W=None,
+                   nonpositive="clip", ranks=DEFAULT_RANKS):
+    """Rank-acceptability WP (log S) untuk K sampel bobot di sekitar `weights`."""
+    X = np.asarray(X, dtype=float)
+    m = min(X.shape[1], len(weights))
+    logx = wp_log_matrix(X[:, :m], np.ones(m, dtype=bool), nonpositive)
+    sign = np.where(np.asarray(types[:m]) == "cost", -1.0, 1.0)
+    if W is None:
+        W = sample_weights(np.asarray(weights, dtype=float)[:m], K, concentration, rng)
+    res = acceptability(lambda Wb: (Wb * sign) @ logx.T, W, len(X), ranks)
+    res["weights"] = W
+    return res
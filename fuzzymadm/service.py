@@ -0,0 +1,496 @@
+"""Layanan HTTP/JSON lokal untuk ranking Fuzzy SAW / WP dengan micro-batching.
+
+Hanya memakai pustaka standar (asyncio) dan NumPy. Permintaan yang
+datang hampir bersamaan untuk dataset dan parameter yang sama (hanya
+bobotnya berbeda) dikumpulkan selama `max_wait` detik atau sampai
+`max_batch` permintaan, lalu dihitung dalam satu tugas executor memakai
+matriks turunan yang di-cache:
+
+* Fuzzy SAW: tensor TFN(R) di-cache per (dataset, spread); tiap bobot
+  diagregasi dengan `saw_aggregate` yang sama dengan saw_calc, sehingga
+  skor (dan seri) identik bit per bit.
+* WP: log S = wp_aggregate(log X, w*) seperti wp_calc, log X di-cache per
+  (dataset, nonpositive, pola bobot nol).
+
+Endpoint:
+
+    GET  /health
+    GET  /datasets
+    POST /datasets   {"name", "alternatives", "values", "criteria"?, "types"?}
+    POST /saw        {"dataset", "weights", "top_k"?, "spread"?, "method"?}
+    POST /wp         {"dataset", "weights", "top_k"?, "nonpositive"?}
+    POST /compare    gabungan /saw dan /wp + kesamaan ranking
+    GET  /metrics    jumlah permintaan, latensi p50/p99, ukuran batch
+
+Jalankan dengan `python -m fuzzymadm serve --dataset nama=file.csv`.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .criteria import CRITERIA_NAMES, TYPES
+from .normalize import normalize_minmax
+from .ranking import rank_min, top_k
+from .saw import saw_aggregate
+from .tfn import DEFAULT_SPREAD, DEFUZZIFY_METHODS, defuzzify, tri
+from .wp import (
+    NONPOSITIVE_POLICIES,
+    log_sum_exp,
+    wp_aggregate,
+    wp_exponents,
+    wp_log_matrix,
+    wp_vector,
+)
+
+MAX_BATCH = 256
+MAX_WAIT = 0.002
+# Jumlah latensi/ukuran batch terakhir yang dipakai untuk persentil
+METRIC_WINDOW = 10_000
+MAX_BODY = 64 * 2**20
+# Respons dengan alternatif lebih dari ini di-encode di thread executor
+LARGE_RESPONSE = 1000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """Kesalahan input klien; dikirim sebagai {"error": ...} dengan `status`."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class Dataset:
+    """Matriks keputusan terdaftar beserta matriks turunan yang dipakai ulang.
+
+    `X` boleh berupa memmap (lihat fuzzymadm.store); matriks turunan
+    (tensor TFN untuk SAW, log X untuk WP) dihitung sekali per parameter.
+    """
+
+    def __init__(self, name, X, alternatives, criteria, types):
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != len(criteria):
+            raise ValueError(f"dataset {name!r}: values harus berukuran (n, {len(criteria)})")
+        if len(alternatives) != len(X):
+            raise ValueError(f"dataset {name!r}: jumlah alternatives tidak sama dengan baris values")
+        if len(types) != len(criteria) or set(types) - {"cost", "benefit"}:
+            raise ValueError(f"dataset {name!r}: types harus cost/benefit untuk setiap kriteria")
+        self.name = name
+        self.X = X
+        self.alternatives = [str(a) for a in alternatives]
+        self.criteria = list(criteria)
+        self.types = list(types)
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, name, df, types):
+        return cls(name, df.to_numpy(dtype=float), df.index, df.columns, types)
+
+    @classmethod
+    def from_store(cls, name, store):
+        return cls(name, store.X, store.index, store.criteria, store.types)
+
+    def __len__(self):
+        return len(self.X)
+
+    def _get(self, key, compute):
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = compute()
+            return self._derived[key]
+
+    def saw_tensor(self, spread):
+        """Tensor TFN (n x m x 3) dari R ternormalisasi, untuk bobot w berapa pun."""
+        def compute():
+            R = normalize_minmax(np.asarray(self.X, dtype=float), self.types)
+            return np.ascontiguousarray(tri(R, spread))
+        return self._get(("saw", spread), compute)
+
+    def wp_matrix(self, nonpositive, active):
+        """log X (n x m) untuk pola kriteria aktif `active` (tuple bool)."""
+        return self._get(("wp", nonpositive, active),
+                         lambda: wp_log_matrix(self.X, np.array(active), nonpositive))
+
+    def describe(self):
+        return {"name": self.name, "rows": len(self), "criteria": self.criteria,
+                "types": self.types, "cached": len(self._derived)}
+
+
+class Metrics:
+    """Latensi per endpoint dan ukuran batch per metode (jendela geser)."""
+
+    def __init__(self, window=METRIC_WINDOW):
+        self.window = window
+        self.started = time.time()
+        self.requests = {}
+        self.errors = {}
+        self.latency = {}
+        self.batches = {}
+        self.batch_sizes = {}
+
+    def request(self, endpoint, seconds, ok=True):
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        self.latency.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+
+    def batch(self, method, size):
+        self.batches[method] = self.batches.get(method, 0) + 1
+        self.batch_sizes.setdefault(method, deque(maxlen=self.window)).append(size)
+
+    def snapshot(self):
+        endpoints = {}
+        for name, lat in self.latency.items():
+            ms = np.fromiter(lat, dtype=float) * 1000
+            endpoints[name] = {
+                "requests": self.requests[name], "errors": self.errors.get(name, 0),
+                "mean_ms": float(ms.mean()), "p50_ms": float(np.percentile(ms, 50)),
+                "p99_ms": float(np.percentile(ms, 99)), "max_ms": float(ms.max()),
+            }
+        batches = {}
+        for name, sizes in self.batch_sizes.items():
+            s = np.fromiter(sizes, dtype=float)
+            batches[name] = {"batches": self.batches[name], "mean_size": float(s.mean()),
+                             "p50_size": float(np.percentile(s, 50)), "max_size": int(s.max())}
+        return {"uptime_s": time.time() - self.started, "window": self.window,
+                "endpoints": endpoints, "batches": batches}
+
+
+class Batcher:
+    """Mengumpulkan permintaan berkunci sama lalu menjalankan `run(key, items)` sekali.
+
+    `run` dipanggil di thread executor dan harus mengembalikan satu hasil
+    per item (urutan sama); exception diteruskan ke semua permintaan batch.
+    """
+
+    def __init__(self, name, run, executor, metrics, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.name = name
+        self.run = run
+        self.executor = executor
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = {}
+        self._timers = {}
+
+    async def submit(self, key, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._pending.setdefault(key, [])
+        queue.append((item, future))
+        if len(queue) >= self.max_batch:
+            self._flush(key)
+        elif len(queue) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+        return await future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        self.metrics.batch(self.name, len(batch))
+        items = [item for item, _ in batch]
+        task = asyncio.get_running_loop().run_in_executor(self.executor, self.run, key, items)
+        task.add_done_callback(lambda t: self._deliver(t, batch))
+
+    @staticmethod
+    def _deliver(task, batch):
+        error = task.exception()
+        results = None if error else task.result()
+        for i, (_, future) in enumerate(batch):
+            if future.cancelled():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+
+
+def _floats(a):
+    """Array float -> list JSON (NaN/inf -> null)."""
+    a = np.asarray(a, dtype=float)
+    if np.isfinite(a).all():
+        return a.tolist()
+    return np.where(np.isfinite(a), a, None).tolist()
+
+
+def _encode(payload):
+    return json.dumps(payload).encode()
+
+
+def _columns(ds, cols, rank, idx=None):
+    """Hasil kolom per alternatif; `idx` = posisi baris top-k (urut menurut Rank)."""
+    names = ds.alternatives if idx is None else [ds.alternatives[i] for i in idx]
+    out = {"alternatives": names}
+    out.update({name: _floats(v) for name, v in cols.items()})
+    out["Rank"] = rank.tolist()
+    return out
+
+
+def _select(scores, k):
+    """(idx, rank) top-k, atau (None, rank_min) untuk seluruh alternatif."""
+    return top_k(scores, k) if k else (None, rank_min(scores))
+
+
+def _run_saw(datasets, key, items):
+    name, spread, method = key
+    ds = datasets[name]
+    T = ds.saw_tensor(spread)
+    out = []
+    for w, k in items:
+        s = defuzzify(saw_aggregate(T, w), method)
+        idx, rank = _select(s, k)
+        out.append(_columns(ds, {"Score": s if idx is None else s[idx]}, rank, idx))
+    return out
+
+
+def _run_wp(datasets, key, items):
+    name, nonpositive, active = key
+    ds = datasets[name]
+    logx = ds.wp_matrix(nonpositive, active)
+    out = []
+    for w, k in items:
+        # Reduksi yang sama dengan frames.wp_from_log (seri tetap seri)
+        row = wp_aggregate(logx, wp_exponents(w, ds.types))
+        idx, rank = _select(row, k)
+        if idx is None:
+            ls, V = row, wp_vector(row)
+        else:
+            # V hanya untuk baris top-k, dengan log(Sum S) dari seluruh alternatif
+            ls = row[idx]
+            V = wp_vector(ls, np.nan if np.isnan(row).any() else log_sum_exp(row))
+        with np.errstate(over="ignore", under="ignore"):
+            S = np.exp(ls)
+        out.append(_columns(ds, {"S": S, "V": V}, rank, idx))
+    return out
+
+
+class RankingService:
+    """Registry dataset + batcher SAW/WP + routing endpoint JSON."""
+
+    def __init__(self, max_batch=MAX_BATCH, max_wait=MAX_WAIT, workers=None):
+        self.datasets = {}
+        self.metrics = Metrics()
+        self.executor = ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1),
+                                           thread_name_prefix="fuzzymadm-batch")
+        self.saw = Batcher("saw", lambda key, items: _run_saw(self.datasets, key, items),
+                           self.executor, self.metrics, max_batch, max_wait)
+        self.wp = Batcher("wp", lambda key, items: _run_wp(self.datasets, key, items),
+                          self.executor, self.metrics, max_batch, max_wait)
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/datasets"): self.list_datasets,
+            ("POST", "/datasets"): self.add_dataset,
+            ("POST", "/saw"): self.rank_saw,
+            ("POST", "/wp"): self.rank_wp,
+            ("POST", "/compare"): self.compare,
+            ("GET", "/metrics"): self.get_metrics,
+        }
+
+    def register(self, dataset):
+        self.datasets[dataset.name] = dataset
+        return dataset
+
+    # --- validasi ---------------------------------------------------------
+
+    def _dataset(self, body):
+        name = body.get("dataset")
+        if not isinstance(name, str):
+            raise RequestError("field 'dataset' wajib diisi (string)")
+        if name not in self.datasets:
+            raise RequestError(f"dataset tidak dikenal: {name!r}", 404)
+        return self.datasets[name]
+
+    @staticmethod
+    def _weights(ds, body):
+        try:
+            w = np.asarray(body["weights"], dtype=float)
+        except KeyError:
+            raise RequestError("field 'weights' wajib diisi") from None
+        except (TypeError, ValueError):
+            raise RequestError("'weights' harus berupa list angka") from None
+        m = len(ds.criteria)
+        if w.shape != (m,):
+            raise RequestError(f"'weights' harus berisi {m} angka ({', '.join(ds.criteria)})")
+        if not np.isfinite(w).all() or (w < 0).any() or w.sum() == 0:
+            raise RequestError("'weights' harus >= 0 dan tidak semuanya 0")
+        return w / w.sum()
+
+    @staticmethod
+    def _top_k(body):
+        k = body.get("top_k")
+        if k is not None and (not isinstance(k, int) or isinstance(k, bool) or k < 1):
+            raise RequestError("'top_k' harus bilangan bulat >= 1")
+        return k
+
+    @staticmethod
+    def _saw_key(ds, body):
+        spread = body.get("spread", DEFAULT_SPREAD)
+        method = body.get("method", "mean")
+        if not isinstance(spread, (int, float)) or not 0 <= spread <= 1:
+            raise RequestError("'spread' harus angka 0..1")
+        if method not in DEFUZZIFY_METHODS:
+            raise RequestError(f"'method' harus salah satu dari {DEFUZZIFY_METHODS}")
+        return ds.name, float(spread), method
+
+    @staticmethod
+    def _wp_key(ds, body, w):
+        nonpositive = body.get("nonpositive", "clip")
+        if nonpositive not in NONPOSITIVE_POLICIES:
+            raise RequestError(f"'nonpositive' harus salah satu dari {NONPOSITIVE_POLICIES}")
+        return ds.name, nonpositive, tuple(bool(a) for a in w != 0)
+
+    # --- endpoint -----------------------------------------------------------
+
+    async def health(self, body):
+        return {"status": "ok", "datasets": len(self.datasets)}
+
+    async def list_datasets(self, body):
+        return {"datasets": [ds.describe() for ds in self.datasets.values()]}
+
+    async def add_dataset(self, body):
+        name = body.get("name")
+        if not isinstance(name, str) or not name:
+            raise RequestError("field 'name' wajib diisi")
+        criteria = body.get("criteria", CRITERIA_NAMES)
+        try:
+            X = np.asarray(body["values"], dtype=float)
+            ds = Dataset(name, X, body["alternatives"], criteria, body.get("types", TYPES))
+        except KeyError as exc:
+            raise RequestError(f"field {exc.args[0]!r} wajib diisi") from None
+        except (TypeError, ValueError) as exc:
+            raise RequestError(str(exc)) from None
+        return self.register(ds).describe()
+
+    async def rank_saw(self, body):
+        ds = self._dataset(body)
+        w = self._weights(ds, body)
+        res = await self.saw.submit(self._saw_key(ds, body), (w, self._top_k(body)))
+        return {"dataset": ds.name, "method": "saw", "weights": w.tolist(), **res}
+
+    async def rank_wp(self, body):
+        ds = self._dataset(body)
+        w = self._weights(ds, body)
+        try:
+            res = await self.wp.submit(self._wp_key(ds, body, w), (w, self._top_k(body)))
+        except ValueError as exc:  # nonpositive="raise"
+            raise RequestError(str(exc)) from None
+        return {"dataset": ds.name, "method": "wp", "weights": w.tolist(), **res}
+
+    async def compare(self, body):
+        ds = self._dataset(body)
+        full = {k: v for k, v in body.items() if k != "top_k"}
+        saw, wp = await asyncio.gather(self.rank_saw(full), self.rank_wp(full))
+        rank_saw, rank_wp = np.array(saw["Rank"]), np.array(wp["Rank"])
+        k = self._top_k(body)
+        order = np.lexsort((np.arange(len(ds)), rank_saw))[:k]
+        return {
+            "dataset": ds.name,
+            "weights": saw["weights"],
+            "alternatives": [ds.alternatives[i] for i in order],
+            "Fuzzy SAW": [saw["Score"][i] for i in order],
+            "WP": [wp["V"][i] for i in order],
+            "Rank SAW": rank_saw[order].tolist(),
+            "Rank WP": rank_wp[order].tolist(),
+            "same_leader": bool(set(np.flatnonzero(rank_saw == 1))
+                                & set(np.flatnonzero(rank_wp == 1))),
+            "rank_agreement": float((rank_saw == rank_wp).mean()) if len(ds) else 1.0,
+        }
+
+    async def get_metrics(self, body):
+        return self.metrics.snapshot()
+
+    # --- HTTP -----------------------------------------------------------------
+
+    async def dispatch(self, method, path, raw):
+        """(status, payload) untuk satu permintaan; latensi dicatat per endpoint."""
+        t0 = time.perf_counter()
+        handler = self.routes.get((method, path))
+        status = 200
+        try:
+            if handler is None:
+                paths = {p for _, p in self.routes}
+                raise RequestError(f"{method} {path} tidak dikenal",
+                                   405 if path in paths else 404)
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                raise RequestError("body bukan JSON yang valid") from None
+            if not isinstance(body, dict):
+                raise RequestError("body harus berupa objek JSON")
+            payload = await handler(body)
+        except RequestError as exc:
+            status, payload = exc.status, {"error": str(exc)}
+        except Exception as exc:  # noqa: BLE001 - dikirim ke klien sebagai 500
+            status, payload = 500, {"error": f"{type(exc).__name__}: {exc}"}
+        if handler is not None:
+            self.metrics.request(path.strip("/"), time.perf_counter() - t0, status == 200)
+        return status, payload
+
+    async def handle(self, reader, writer):
+        """Satu koneksi HTTP/1.1 (keep-alive, body dengan Content-Length)."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                try:
+                    method, target, version = line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    k, _, v = h.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    status, payload = 413, {"error": f"body lebih dari {MAX_BODY} byte"}
+                    keep = False
+                else:
+                    raw = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, target.split("?")[0], raw)
+                    keep = (version == "HTTP/1.1"
+                            and headers.get("connection", "").lower() != "close")
+                if len(payload.get("alternatives", ())) > LARGE_RESPONSE:
+                    # Hasil lengkap n besar: serialisasi di thread agar loop tidak macet
+                    data = await asyncio.get_running_loop().run_in_executor(
+                        self.executor, _encode, payload)
+                else:
+                    data = _encode(payload)
+                head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                        f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n")
+                if not keep:
+                    head += "Connection: close\r\n"
+                writer.write(head.encode() + b"\r\n" + data)
+                await writer.drain()
+                if not keep:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, ready=None):
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,155 @@
+"""Dataset bersama antar sesi (read-only) dengan salinan copy-on-write per sesi.
+
+`SharedRegistry` menyimpan dataset yang tidak berubah antar sesi (mis.
+data default aplikasi) satu kali per proses: nilai numerik dibekukan
+(array read-only) dan hash isinya dihitung sekali. Sesi memegang
+`SessionFrame` yang menunjuk ke dataset bersama sampai sesi tersebut
+mengedit data; baru saat itu sesi menyimpan salinan pribadi. Modul ini
+membutuhkan pandas.
+"""
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .cache import nbytes
+
+
+def freeze_frame(df):
+    """Salinan numerik `df` yang array nilainya read-only (tulis -> ValueError)."""
+    df = df.apply(pd.to_numeric)
+    values = np.array(df.to_numpy())
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=df.index.copy(), columns=df.columns.copy(), copy=False)
+
+
+class SharedFrame:
+    """Dataset bersama: DataFrame read-only + hash isi (kunci cache turunan)."""
+
+    __slots__ = ("name", "frame", "digest")
+
+    def __init__(self, name, frame, digest):
+        self.name = name
+        self.frame = frame
+        self.digest = digest
+
+    @property
+    def nbytes(self):
+        return nbytes(self.frame)
+
+    def __repr__(self):
+        return f"SharedFrame({self.name!r}, rows={len(self.frame)}, digest={self.digest[:8]})"
+
+
+class SharedRegistry:
+    """Dataset bersama per proses, berkunci nama. Thread-safe."""
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def get(self, name):
+        return self._items[name]
+
+    def register(self, name, df):
+        """Bekukan dan simpan `df` sebagai `name`; isi yang sama tidak dibuat ulang."""
+        from .frames import frame_digest
+
+        frame = freeze_frame(df)
+        digest = frame_digest(frame)
+        with self._lock:
+            current = self._items.get(name)
+            if current is None or current.digest != digest:
+                current = self._items[name] = SharedFrame(name, frame, digest)
+            return current
+
+    def nbytes(self):
+        return sum(s.nbytes for s in self._items.values())
+
+
+class SessionFrame:
+    """Data satu sesi: dataset bersama sampai diedit, lalu salinan pribadi.
+
+    `frame` boleh dibaca tetapi tidak boleh diubah di tempat; perubahan
+    masuk lewat `update` (hasil editor) atau `replace` (mis. upload file).
+    """
+
+    def __init__(self, shared):
+        self.shared = shared
+        self._private = None
+        self._digest = None
+
+    @property
+    def is_shared(self):
+        return self._private is None
+
+    @property
+    def frame(self):
+        return self.shared.frame if self._private is None else self._private
+
+    @property
+    def digest(self):
+        """Hash isi data sesi; untuk data bersama tanpa hashing ulang."""
+        if self._private is None:
+            return self.shared.digest
+        if self._digest is None:
+            from .frames import frame_digest
+
+            self._digest = frame_digest(self._private)
+        return self._digest
+
+    @property
+    def nbytes(self):
+        """Memori milik sesi ini saja (0 selama memakai data bersama)."""
+        return 0 if self._private is None else nbytes(self._private)
+
+    def update(self, df):
+        """Terapkan hasil edit. Mengembalikan True bila isi data berubah.
+
+        Isi yang sama dengan data bersama kembali memakai data bersama.
+        """
+        if df is self.frame or df.equals(self.frame):
+            return False
+        if df.equals(self.shared.frame):
+            self.reset()
+        else:
+            self.replace(df)
+        return True
+
+    def replace(self, df):
+        """Ganti data sesi dengan salinan pribadi `df`."""
+        self._private = df
+        self._digest = None
+
+    def reset(self):
+        """Kembali ke dataset bersama (salinan pribadi dilepas)."""
+        self._private = None
+        self._digest = None
+
+
+def session_nbytes(state):
+    """Perkiraan memori isi session state (dict-like) milik satu sesi.
+
+    `SessionFrame` hanya dihitung salinan pribadinya; objek lain (mis.
+    `IncrementalRanker`) dihitung dari atribut array/DataFrame-nya.
+    """
+    total = 0
+    for value in state.values():
+        if isinstance(value, SessionFrame):
+            total += value.nbytes
+        elif isinstance(value, (np.ndarray, pd.DataFrame, pd.Series, pd.Index, dict, list, tuple)):
+            total += nbytes(value)
+        elif hasattr(value, "__dict__"):
+            total += sys.getsizeof(value) + sum(
+                nbytes(v) for v in vars(value).values()
+                if isinstance(v, (np.ndarray, pd.DataFrame, pd.Series)))
+        else:
+            total += sys.getsizeof(value)
+    return total
@@ -0,0 +1,83 @@
+"""Prefilter Pareto (skyline): membuang alternatif yang terdominasi.
+
+Alternatif a mendominasi b bila a minimal sama baiknya di semua kriteria
+(arah cost/benefit dari `types`) dan lebih baik di setidaknya satu
+kriteria. Alternatif terdominasi tidak pernah menjadi peringkat 1 untuk
+bobot mana pun, baik di Fuzzy SAW maupun WP.
+
+Algoritme sort-filter-skyline per blok: baris diurutkan menurun menurut
+jumlah nilai (lalu per kolom), sehingga pendominasi selalu datang lebih
+dulu; tiap blok dicek secara vektor terhadap skyline sejauh ini lalu
+terhadap sesamanya. Kompleksitas O(n * s) perbandingan vektor, s = ukuran
+skyline (biasanya kecil), tanpa loop Python per pasangan.
+"""
+import numpy as np
+
+from .criteria import TYPES
+
+# Jumlah baris yang dicek sekaligus dan potongan skyline pembanding
+BLOCK_SIZE = 1024
+SKYLINE_CHUNK = 64
+
+
+def benefit_matrix(X, types=TYPES):
+    """Matriks dengan semua kriteria berarah 'lebih besar lebih baik' (cost dinegasikan)."""
+    X = np.asarray(X, dtype=float)
+    sign = np.where(np.asarray(types[:X.shape[1]]) == "cost", -1.0, 1.0)
+    return X * sign
+
+
+def dominated_by(P, Q):
+    """Mask baris P yang didominasi setidaknya satu baris Q (matriks benefit)."""
+    ge = np.ones((len(P), len(Q)), dtype=bool)
+    gt = np.zeros((len(P), len(Q)), dtype=bool)
+    for k in range(P.shape[1]):
+        ge &= Q[:, k] >= P[:, k, None]
+        gt |= Q[:, k] > P[:, k, None]
+    return (ge & gt).any(axis=1)
+
+
+def skyline_mask(X, types=TYPES, block=BLOCK_SIZE):
+    """Mask alternatif yang tidak terdominasi (skyline).
+
+    Baris dengan NaN tidak dibandingkan dan selalu dipertahankan. Baris
+    yang identik tidak saling mendominasi sehingga semuanya dipertahankan.
+    """
+    B = benefit_matrix(X, types)
+    n, m = B.shape
+    valid = ~np.isnan(B).any(axis=1)
+    keep = ~valid
+    rows = np.flatnonzero(valid)
+    V = B[rows]
+    # Urut menurun menurut jumlah: a mendominasi b -> jumlah(a) > jumlah(b) -> a lebih dulu
+    total = V.sum(axis=1)
+    order = np.argsort(-total, kind="stable")
+    V, rows, total = V[order], rows[order], total[order]
+
+    sky = np.empty((0, m))
+    sky_rows, sky_total = [], []
+    for start in range(0, len(V), block):
+        P = V[start:start + block]
+        pos = np.arange(len(P))
+        # Potongan skyline membesar: titik terkuat (jumlah terbesar) biasanya
+        # sudah memangkas hampir seluruh blok dengan sedikit perbandingan
+        c, size = 0, 4
+        while c < len(sky) and len(pos):
+            pos = pos[~dominated_by(P[pos], sky[c:c + size])]
+            c, size = c + size, min(2 * size, SKYLINE_CHUNK)
+        if len(pos):
+            pos = pos[~dominated_by(P[pos], P[pos])]
+            sky = np.concatenate([sky, P[pos]])
+            sky_rows.append(rows[start + pos])
+            sky_total.append(total[start + pos])
+    if not sky_rows:
+        return keep
+    sky_rows, sky_total = np.concatenate(sky_rows), np.concatenate(sky_total)
+    # Jumlah yang seri karena pembulatan float dapat menaruh pendominasi di blok
+    # berikutnya; hanya kasus itu yang dicek ulang (di dalam kelompok jumlah sama)
+    values, counts = np.unique(sky_total, return_counts=True)
+    for t in values[counts > 1]:
+        group = np.flatnonzero(sky_total == t)
+        sky_rows[group[dominated_by(sky[group], sky[group])]] = -1
+    keep[sky_rows[sky_rows >= 0]] = True
+    return keep
@@ -0,0 +1,95 @@
+"""Interval stabilitas bobot secara analitik (tanpa sampling).
+
+Bobot kriteria j digeser ke t, bobot lain diskalakan ulang proporsional
+agar total tetap 1: w_k(t) = w_k (1 - t) / (1 - w_j). Untuk skor yang
+linear terhadap bobot (Score = C @ w) selisih pemimpin L dengan alternatif
+i juga linear terhadap t:
+
+    d_i(t) = (1 - t) * d_i(0) + t * d_i(1)
+    d_i(1) = C[L, j] - C[i, j]
+    d_i(0) = (D_i - w_j * d_i(1)) / (1 - w_j),   D_i = Score_L - Score_i
+
+sehingga titik kritis t* = d_i(0) / (d_i(0) - d_i(1)) dihitung sekaligus
+untuk semua alternatif dan kriteria (matriks n x m), hanya terhadap
+pemimpin saat ini. Fuzzy SAW memakai C = defuzzifikasi TFN(R) per sel
+(defuzzifikasi linear, lihat fuzzymadm.sensitivity); WP memakai
+C = +-log(x_ij) karena log S = log X @ w* juga linear.
+"""
+import numpy as np
+
+from .criteria import TYPES
+from .normalize import normalize_minmax
+from .tfn import DEFAULT_SPREAD, defuzzify, tri
+from .wp import wp_log_matrix
+
+
+def stability_intervals(C, weights):
+    """Interval bobot tiap kriteria di mana pemimpin `C @ w` tidak berubah.
+
+    Mengembalikan dict:
+
+    * leader          : indeks alternatif teratas saat ini
+    * weights         : bobot ternormalisasi (m,)
+    * lower, upper    : batas bobot (m,); pada batas terjadi seri dengan
+                        alternatif lain, di luar batas pemimpin berganti
+    * lower_by, upper_by : indeks alternatif yang menyamai pemimpin di
+                        batas tersebut, -1 bila tidak ada yang menyamai
+                        pemimpin di dalam [0, 1] (batas = 0 atau 1)
+
+    Alternatif dengan skor NaN diabaikan. Kriteria dengan bobot 1 (bobot
+    lain semuanya 0) tidak dapat diskalakan ulang; intervalnya [0, 1].
+    """
+    C = np.asarray(C, dtype=float)
+    w = np.asarray(weights, dtype=float)[:C.shape[1]]
+    w = w / w.sum()
+    m = len(w)
+    if len(C) == 0:
+        return {"leader": -1, "weights": w, "lower": np.zeros(m), "upper": np.ones(m),
+                "lower_by": np.full(m, -1), "upper_by": np.full(m, -1)}
+    scores = C @ w
+    leader = int(np.argmax(np.where(np.isnan(scores), -np.inf, scores)))
+
+    d1 = C[leader] - C                                   # d_i(1), n x m
+    free = np.where(w < 1, 1 - w, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d0 = ((scores[leader] - scores)[:, None] - w * d1) / free   # d_i(0)
+        slope = d1 - d0
+        t = d0 / -slope
+
+    # Selisih menurun -> batas atas (t > w_j); menaik -> batas bawah (t < w_j)
+    t_up = np.where((slope < 0) & (t <= 1), np.maximum(t, w), np.inf)
+    t_lo = np.where((slope > 0) & (t >= 0), np.minimum(t, w), -np.inf)
+    t_up[leader] = np.inf
+    t_lo[leader] = -np.inf
+
+    upper_by = np.argmin(t_up, axis=0)
+    lower_by = np.argmax(t_lo, axis=0)
+    cols = np.arange(m)
+    upper = t_up[upper_by, cols]
+    lower = t_lo[lower_by, cols]
+    return {
+        "leader": leader,
+        "weights": w,
+        "lower": np.where(np.isfinite(lower), lower, 0.0),
+        "upper": np.where(np.isfinite(upper), upper, 1.0),
+        "lower_by": np.where(np.isfinite(lower), lower_by, -1),
+        "upper_by": np.where(np.isfinite(upper), upper_by, -1),
+    }
+
+
+def saw_stability(X, weights, types=TYPES, spread=DEFAULT_SPREAD, method="mean"):
+    """Interval stabilitas bobot untuk pemimpin Fuzzy SAW (lihat `stability_intervals`)."""
+    X = np.asarray(X, dtype=float)
+    m = min(X.shape[1], len(weights))
+    C = defuzzify(tri(normalize_minmax(X, types)[:, :m], spread), method)
+    return stability_intervals(C, np.asarray(weights, dtype=float)[:m])
+
+
+def wp_stability(X, weights, types=TYPES, nonpositive="clip"):
+    """Interval stabilitas bobot untuk pemimpin WP, dihitung di ruang log S."""
+    X = np.asarray(X, dtype=float)
+    m = min(X.shape[1], len(weights))
+    # Semua kriteria aktif: bobot nol pun boleh digeser naik
+    logx = wp_log_matrix(X[:, :m], np.ones(m, dtype=bool), nonpositive)
+    sign = np.where(np.asarray(types[:m]) == "cost", -1.0, 1.0)
+    return stability_intervals(logx * sign, np.asarray(weights, dtype=float)[:m])
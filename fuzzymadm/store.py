@@ -0,0 +1,124 @@
+"""Penyimpanan matriks keputusan di disk yang dibaca lewat memory map.
+
+Sebuah store adalah direktori berisi:
+
+* `values.npy` : matriks (n x m) float32/float64, dibuka dengan
+  `np.load(mmap_mode="r")` sehingga halaman memori dibagi oleh semua sesi
+  dan proses yang membukanya (read-only, tanpa salinan).
+* `index.npy`  : nama alternatif (array string).
+* `schema.json`: nama kriteria, tipe cost/benefit (seperti `TYPES`),
+  dtype, jumlah baris, nama index dan hash isi.
+
+Mesin SAW/WP menerima `store.X` langsung; untuk float64 tidak ada salinan.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .criteria import CRITERIA_NAMES, TYPES
+
+SCHEMA_FILE = "schema.json"
+VALUES_FILE = "values.npy"
+INDEX_FILE = "index.npy"
+
+
+class MatrixStore:
+    """Store yang sudah dibuka (read-only). Buat dengan `open_store`."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, SCHEMA_FILE)) as fh:
+            self.schema = json.load(fh)
+        self.X = np.load(os.path.join(path, VALUES_FILE), mmap_mode="r")
+        self.index = np.load(os.path.join(path, INDEX_FILE), mmap_mode="r")
+        if self.X.shape != (self.schema["rows"], len(self.schema["criteria"])):
+            raise ValueError(f"Store {path!r} tidak konsisten dengan schema.json")
+
+    @property
+    def criteria(self):
+        return self.schema["criteria"]
+
+    @property
+    def types(self):
+        return self.schema["types"]
+
+    @property
+    def digest(self):
+        return self.schema["digest"]
+
+    def __len__(self):
+        return self.schema["rows"]
+
+    def __repr__(self):
+        return f"MatrixStore({self.path!r}, rows={len(self)}, dtype={self.X.dtype})"
+
+    def to_frame(self):
+        """DataFrame read-only yang berbagi memori dengan memory map (butuh pandas).
+
+        Untuk cache, pakai `store.digest` sebagai kunci data (lihat
+        `PipelineCache`) agar matriks tidak di-hash ulang setiap rerun.
+        """
+        import pandas as pd
+
+        index = pd.Index(np.asarray(self.index), name=self.schema.get("index_name") or None)
+        return pd.DataFrame(self.X, index=index, columns=self.criteria, copy=False)
+
+
+def open_store(path):
+    """Membuka store yang sudah ada."""
+    return MatrixStore(path)
+
+
+def _digest_update(h, X):
+    h.update(np.ascontiguousarray(X).tobytes())
+
+
+def write_store(path, chunks, rows, criteria=CRITERIA_NAMES, types=TYPES,
+                dtype="float64", index_name=None):
+    """Menulis store dari iterator chunk (index, X) tanpa memuat semuanya ke memori.
+
+    `rows` = jumlah baris total (mis. dari tahap scan `fuzzymadm.stream`).
+    """
+    if len(types) != len(criteria):
+        raise ValueError("jumlah types harus sama dengan jumlah kriteria")
+    os.makedirs(path, exist_ok=True)
+    values = np.lib.format.open_memmap(os.path.join(path, VALUES_FILE), mode="w+",
+                                       dtype=np.dtype(dtype), shape=(rows, len(criteria)))
+    names = []
+    h = hashlib.blake2b(digest_size=16)
+    pos = 0
+    for index, X in chunks:
+        if pos + len(X) > rows:
+            raise ValueError("jumlah baris melebihi `rows`")
+        values[pos:pos + len(X)] = X
+        _digest_update(h, values[pos:pos + len(X)])
+        names.extend(str(i) for i in index)
+        pos += len(X)
+    if pos != rows:
+        raise ValueError(f"jumlah baris ({pos}) != rows ({rows})")
+    values.flush()
+    del values
+
+    index = np.asarray(names, dtype=str)
+    np.save(os.path.join(path, INDEX_FILE), index)
+    h.update(index.tobytes())
+    schema = {
+        "criteria": list(criteria),
+        "types": list(types),
+        "dtype": np.dtype(dtype).name,
+        "rows": rows,
+        "index_name": index_name,
+        "digest": h.hexdigest(),
+    }
+    with open(os.path.join(path, SCHEMA_FILE), "w") as fh:
+        json.dump(schema, fh, indent=2)
+    return open_store(path)
+
+
+def store_from_frame(path, df, types=TYPES, dtype="float64"):
+    """Menulis DataFrame (index = nama alternatif) sebagai store."""
+    X = df.to_numpy(dtype=float)
+    return write_store(path, [(df.index, X)], len(df), list(map(str, df.columns)),
+                       types, dtype, index_name=df.index.name)
@@ -0,0 +1,210 @@
+"""Perangkingan katalog besar (CSV/Parquet) per chunk dengan memori terbatas.
+
+Tahap 1 membaca seluruh file sekali untuk menghitung min/max per kriteria
+(input normalisasi SAW) dan, untuk WP, log(Sum(S)). Tahap 2 membaca ulang
+file per chunk, menghitung skor dengan mesin yang sama seperti
+`fuzzymadm.frames`, lalu menulis hasilnya ke CSV/Parquet atau hanya
+menyimpan top-k terbaik.
+
+pandas dibutuhkan untuk CSV dan pyarrow untuk Parquet; keduanya diimpor
+hanya saat dipakai.
+"""
+import sys
+import time
+
+import numpy as np
+
+from .criteria import CRITERIA_NAMES, DEFAULT_WEIGHTS, TYPES
+from .normalize import minmax_bounds, normalize_minmax
+from .ranking import rank_min, top_k_mask
+from .saw import saw_scores
+from .wp import log_sum_exp, wp_log_s, wp_vector
+
+METHODS = ("saw", "wp")
+
+
+def file_format(path, fmt=None):
+    """Format file dari argumen `fmt` atau ekstensi path ("csv"/"parquet")."""
+    if fmt:
+        return fmt
+    return "parquet" if str(path).lower().endswith((".parquet", ".pq")) else "csv"
+
+
+def iter_chunks(path, criteria=CRITERIA_NAMES, index_col=None, chunksize=100_000, fmt=None):
+    """Membaca file per chunk. Menghasilkan (nama_index, index, X float64).
+
+    Hanya kolom index dan kolom kriteria yang dibaca. Nilai non-numerik
+    menjadi NaN (seperti `pd.to_numeric(errors='coerce')`).
+    """
+    criteria = list(criteria)
+    if file_format(path, fmt) == "parquet":
+        import pyarrow.parquet as pq
+
+        pf = pq.ParquetFile(path)
+        if index_col is None:
+            # Parquet dari pandas menyimpan index di metadata (biasanya kolom terakhir)
+            meta = pf.schema_arrow.pandas_metadata or {}
+            named = [c for c in meta.get("index_columns", []) if isinstance(c, str)]
+            index_col = named[0] if named else pf.schema_arrow.names[0]
+        for batch in pf.iter_batches(batch_size=chunksize, columns=[index_col, *criteria]):
+            index = batch.column(index_col).to_numpy(zero_copy_only=False)
+            X = np.column_stack([
+                np.asarray(batch.column(c).to_numpy(zero_copy_only=False), dtype=float)
+                for c in criteria
+            ]) if criteria else np.empty((len(index), 0))
+            yield index_col, index, X
+    else:
+        import pandas as pd
+
+        index_col = index_col or pd.read_csv(path, nrows=0).columns[0]
+        for chunk in pd.read_csv(path, usecols=[index_col, *criteria], chunksize=chunksize):
+            X = chunk[criteria].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+            yield index_col, chunk[index_col].to_numpy(), X
+
+
+class ChunkWriter:
+    """Penulis hasil per chunk ke CSV atau Parquet (memori konstan)."""
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = "csv" if path == "-" else file_format(path, fmt)
+        self._writer = None
+        self._fh = None
+
+    def write(self, columns):
+        """Menulis satu chunk; `columns` adalah dict nama -> array 1-D."""
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.table({k: np.asarray(v) for k, v in columns.items()})
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            import pandas as pd
+
+            first = self._fh is None
+            if first:
+                self._fh = sys.stdout if self.path == "-" else open(self.path, "w", newline="")
+            pd.DataFrame(columns).to_csv(self._fh, index=False, header=first)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._fh is not None and self._fh is not sys.stdout:
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def scan(chunks, method="saw", weights=DEFAULT_WEIGHTS, types=TYPES, nonpositive="clip"):
+    """Tahap 1: jumlah baris, min/max per kriteria dan (WP) log(Sum(S)).
+
+    Untuk kebijakan "shift" log(Sum(S)) bergantung pada min global, sehingga
+    nilainya `None` di sini dan dihitung oleh `scan_wp_lse` setelahnya.
+    """
+    rows, lo, hi, lse = 0, None, None, -np.inf
+    wp_now = method == "wp" and nonpositive != "shift"
+    for _, _, X in chunks:
+        rows += len(X)
+        c_lo, c_hi = minmax_bounds(X)
+        lo = c_lo if lo is None else np.fmin(lo, c_lo)
+        hi = c_hi if hi is None else np.fmax(hi, c_hi)
+        if wp_now:
+            with np.errstate(invalid="ignore"):  # NaN di data -> V NaN, seperti wp_vector
+                lse = np.logaddexp(lse, log_sum_exp(wp_log_s(X, weights, types, nonpositive)))
+    return {"rows": rows, "lo": lo, "hi": hi, "lse": lse if wp_now else None}
+
+
+def scan_wp_lse(chunks, stats, weights=DEFAULT_WEIGHTS, types=TYPES, nonpositive="shift"):
+    """log(Sum(S)) seluruh file memakai min global dari tahap 1."""
+    lse = -np.inf
+    for _, _, X in chunks:
+        with np.errstate(invalid="ignore"):
+            lse = np.logaddexp(lse, log_sum_exp(wp_log_s(X, weights, types, nonpositive, lo=stats["lo"])))
+    return lse
+
+
+def score_chunk(X, stats, method="saw", weights=DEFAULT_WEIGHTS, types=TYPES, nonpositive="clip"):
+    """Tahap 2 untuk satu chunk. Mengembalikan (kolom_hasil, kunci_ranking)."""
+    if method == "saw":
+        R = normalize_minmax(X, types, stats["lo"], stats["hi"])
+        scores, _ = saw_scores(R, weights)
+        return {"Score": scores}, scores
+    log_s = wp_log_s(X, weights, types, nonpositive, lo=stats["lo"])
+    with np.errstate(over="ignore", under="ignore"):
+        S = np.exp(log_s)
+    return {"S": S, "V": wp_vector(log_s, stats["lse"])}, log_s
+
+
+def _merge_top(cand, new, k):
+    """Menggabungkan kandidat top-k dengan chunk baru (lihat `top_k_mask`)."""
+    if cand is not None:
+        new = {c: np.concatenate([cand[c], new[c]]) for c in new}
+    keep = top_k_mask(new["_key"], k)
+    if keep.all():
+        return new
+    return {c: v[keep] for c, v in new.items()}
+
+
+def rank_file(path, output="-", method="saw", criteria=CRITERIA_NAMES, types=TYPES,
+              weights=DEFAULT_WEIGHTS, index_col=None, chunksize=100_000, top_k=None,
+              nonpositive="clip", in_fmt=None, out_fmt=None, log=None):
+    """Pipeline dua tahap lengkap. Mengembalikan ringkasan waktu per tahap.
+
+    Tanpa `top_k` seluruh skor ditulis per chunk (tanpa Rank, karena ranking
+    penuh membutuhkan semua skor). Dengan `top_k` hanya pemenang ditulis,
+    lengkap dengan Rank eksak (seri seperti `method='min'`).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Metode tidak dikenal: {method!r} (pilih {METHODS}).")
+    weights = np.asarray(weights, dtype=float)
+
+    def chunks():
+        return iter_chunks(path, criteria, index_col, chunksize, in_fmt)
+
+    report = {"method": method, "passes": []}
+
+    def timed(name, rows, t0):
+        dt = time.perf_counter() - t0
+        info = {"pass": name, "rows": rows, "seconds": dt, "rows_per_sec": rows / dt if dt else float("inf")}
+        report["passes"].append(info)
+        if log is not None:
+            print(f"[{name}] {rows:,} baris dalam {dt:.2f} s ({info['rows_per_sec']:,.0f} baris/detik)",
+                  file=log)
+
+    t0 = time.perf_counter()
+    stats = scan(chunks(), method, weights, types, nonpositive)
+    timed("scan", stats["rows"], t0)
+    if method == "wp" and stats["lse"] is None:
+        t0 = time.perf_counter()
+        stats["lse"] = scan_wp_lse(chunks(), stats, weights, types, nonpositive)
+        timed("scan-wp", stats["rows"], t0)
+
+    t0 = time.perf_counter()
+    rows, cand = 0, None
+    with ChunkWriter(output, out_fmt) as writer:
+        for name, index, X in chunks():
+            cols, key = score_chunk(X, stats, method, weights, types, nonpositive)
+            rows += len(X)
+            out = {name: index, **cols}
+            if top_k is None:
+                writer.write(out)
+            else:
+                cand = _merge_top(cand, {**out, "_key": key}, top_k)
+        if top_k is not None and cand is not None:
+            rank = rank_min(cand.pop("_key"))
+            order = np.argsort(rank, kind="stable")
+            order = order[rank[order] <= top_k]
+            writer.write({**{c: v[order] for c, v in cand.items()}, "Rank": rank[order]})
+    timed("score", rows, t0)
+
+    report["rows"] = stats["rows"]
+    report["seconds"] = sum(p["seconds"] for p in report["passes"])
+    report["rows_per_sec"] = stats["rows"] / report["seconds"] if report["seconds"] else float("inf")
+    return report
@@ -0,0 +1,128 @@
+"""Triangular Fuzzy Number (TFN)."""
+import numpy as np
+
+DEFAULT_SPREAD = 0.1
+DEFUZZIFY_METHODS = ("mean", "centroid", "graded_mean")
+
+
+def tri(v, spread=DEFAULT_SPREAD):
+    """Menghitung TFN (a, m, b) dari nilai ternormalisasi v.
+
+    Bekerja untuk skalar (hasil shape (3,)) maupun array (hasil shape
+    v.shape + (3,)). NaN menjadi TFN (0, 0, 0).
+    """
+    v = np.asarray(v, dtype=float)
+    t = np.stack([np.maximum(0, v - spread), v, np.minimum(1, v + spread)], axis=-1)
+    t[np.isnan(v)] = 0.0
+    return t
+
+
+def defuzzify(tfn, method="mean"):
+    """Defuzzifikasi TFN (..., 3) menjadi nilai crisp.
+
+    mean        : (a + m + b) / 3
+    centroid    : pusat massa segitiga keanggotaan; untuk TFN sama dengan mean
+    graded_mean : graded mean integration (a + 4m + b) / 6
+    """
+    t = np.asarray(tfn, dtype=float)
+    if method in ("mean", "centroid"):
+        return t.mean(axis=-1)
+    if method == "graded_mean":
+        return (t[..., 0] + 4 * t[..., 1] + t[..., 2]) / 6
+    raise ValueError(f"method harus salah satu dari {DEFUZZIFY_METHODS}, bukan {method!r}")
+
+
+class TFNArray:
+    """Kumpulan n TFN dalam satu array kontigu (n, 3) kolom a, m, b.
+
+    `index` (opsional) berisi label tiap baris, mis. nama alternatif.
+    Operasi aritmetika bekerja per baris sekaligus:
+
+    * `x + y`     : penjumlahan TFN (a1+a2, m1+m2, b1+b2)
+    * `x * w`     : perkalian dengan skalar atau bobot per baris (w >= 0)
+    * `x.defuzzify(method)` : skor crisp shape (n,)
+    """
+
+    __slots__ = ("data", "index")
+
+    def __init__(self, data, index=None):
+        data = np.ascontiguousarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError(f"data TFN harus berukuran (n, 3), bukan {data.shape}")
+        if index is not None and len(index) != len(data):
+            raise ValueError("panjang index tidak sama dengan jumlah TFN")
+        self.data = data
+        self.index = index
+
+    @classmethod
+    def from_values(cls, v, spread=DEFAULT_SPREAD, index=None):
+        """TFN dari nilai ternormalisasi 1-D (lihat `tri`)."""
+        return cls(tri(np.asarray(v, dtype=float).reshape(-1), spread), index)
+
+    @classmethod
+    def zeros(cls, n, index=None):
+        return cls(np.zeros((n, 3)), index)
+
+    @property
+    def a(self):
+        return self.data[:, 0]
+
+    @property
+    def m(self):
+        return self.data[:, 1]
+
+    @property
+    def b(self):
+        return self.data[:, 2]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def __len__(self):
+        return len(self.data)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    def __getitem__(self, key):
+        """Integer -> TFN tunggal (3,); slice/mask/array indeks -> TFNArray."""
+        if isinstance(key, (int, np.integer)):
+            return self.data[key]
+        index = None if self.index is None else self.index[key]
+        return TFNArray(self.data[key], index)
+
+    def __repr__(self):
+        return f"TFNArray(n={len(self)})"
+
+    def _other(self, other):
+        return other.data if isinstance(other, TFNArray) else other
+
+    def __add__(self, other):
+        return TFNArray(self.data + self._other(other), self.index)
+
+    __radd__ = __add__
+
+    def __mul__(self, w):
+        """Perkalian skalar atau bobot per baris (shape (n,)); w harus >= 0."""
+        w = np.asarray(w, dtype=float)
+        return TFNArray(self.data * (w[:, None] if w.ndim == 1 else w), self.index)
+
+    __rmul__ = __mul__
+
+    def sum(self):
+        """Jumlah seluruh TFN (satu TFN, shape (3,))."""
+        return self.data.sum(axis=0)
+
+    def defuzzify(self, method="mean"):
+        return defuzzify(self.data, method)
+
+    def to_frame(self, columns=("a", "m", "b")):
+        """DataFrame n x 3 (butuh pandas), berbagi memori bila memungkinkan."""
+        import pandas as pd
+
+        return pd.DataFrame(self.data, index=self.index, columns=list(columns), copy=False)
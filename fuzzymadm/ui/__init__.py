@@ -0,0 +1,4 @@
+"""Komponen Streamlit bersama untuk aplikasi fuzzy.py dan app single-file.
+
+Subpaket ini mengimpor streamlit dan tidak dimuat oleh `import fuzzymadm`.
+"""
@@ -0,0 +1,39 @@
+"""Grafik perbandingan SAW vs WP dengan cache PNG berkunci hash hasil."""
+import streamlit as st
+
+from ..cache import LRUCache
+from ..charts import BAR_MAX, CHART_MODES, MAX_POINTS, TOP_N, choose_mode, comparison_png
+from ..frames import frame_digest
+
+MODE_LABELS = {
+    "auto": "Otomatis",
+    "bar": "Batang (semua)",
+    "top": "Batang top-N",
+    "scatter": "Scatter skor",
+    "rank": "Plot ranking",
+}
+
+
+@st.cache_resource
+def get_chart_cache():
+    """PNG grafik untuk seluruh sesi; hanya bytes yang disimpan, bukan Figure."""
+    return LRUCache(max_bytes=32 * 2**20)
+
+
+def comparison_chart(compare, key):
+    """Pilihan jenis grafik + gambar PNG (dirender sekali per hasil & pengaturan)."""
+    n = len(compare)
+    modes = [m for m in CHART_MODES if m != "bar" or n <= 10 * BAR_MAX]
+    c_mode, c_top = st.columns([3, 2])
+    with c_mode:
+        mode = st.radio("Jenis grafik", modes, format_func=MODE_LABELS.get, horizontal=True,
+                        key=f"{key}_mode")
+    mode = choose_mode(n, mode)
+    top_n = TOP_N
+    if mode == "top":
+        with c_top:
+            top_n = st.slider("N", 5, 50, TOP_N, key=f"{key}_top")
+
+    chart_key = ("chart", frame_digest(compare), mode, top_n, MAX_POINTS)
+    png = get_chart_cache().get_or_compute(chart_key, lambda: comparison_png(compare, mode, top_n))
+    st.image(png, use_container_width=True)
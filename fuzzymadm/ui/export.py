@@ -0,0 +1,34 @@
+"""Tombol unduh yang membangun file ekspor hanya saat diminta."""
+import streamlit as st
+
+from ..export import MIME_TYPES, ExportCache, available_formats
+from ..frames import frame_digest
+
+
+@st.cache_resource
+def get_export_cache():
+    """Cache bytes ekspor untuk seluruh sesi (kunci = hash isi tabel + format)."""
+    return ExportCache(max_bytes=128 * 2**20)
+
+
+def download_section(frames, build, basename, label, key):
+    """Pilihan format + tombol "Siapkan"; file baru dibuat setelah diklik.
+
+    frames : DataFrame sumber (kunci cache; hasil sama -> file tidak dibuat ulang)
+    build  : fungsi tanpa argumen yang menyusun DataFrame untuk diekspor
+    """
+    digest = tuple(frame_digest(f) for f in frames)
+    col_fmt, col_btn = st.columns([1, 2])
+    with col_fmt:
+        fmt = st.selectbox("Format", available_formats(), key=f"{key}_fmt",
+                           label_visibility="collapsed")
+    ready = st.session_state.get(f"{key}_ready") == (fmt, digest)
+    with col_btn:
+        if not ready and st.button(f"📦 Siapkan {label} (.{fmt})", key=f"{key}_prepare"):
+            st.session_state[f"{key}_ready"] = (fmt, digest)
+            ready = True
+        if ready:
+            data = get_export_cache().get_export(frames, fmt, build)
+            st.download_button(f"⬇ Download {label} (.{fmt})", data=data,
+                               file_name=f"{basename}.{fmt}", mime=MIME_TYPES[fmt],
+                               key=f"{key}_download")
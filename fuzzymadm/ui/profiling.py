@@ -0,0 +1,51 @@
+"""Panel debug di sidebar: waktu/alokasi per tahap dan cProfile satu rerun."""
+import os
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from ..profiling import Profiler, StageTimer, enable_logging
+
+PROFILE_DIR = os.environ.get("FUZZYMADM_PROFILE_DIR", tempfile.gettempdir())
+
+
+def start_rerun(page):
+    """Dipanggil di awal skrip. Mengembalikan (timer, profiler atau None).
+
+    Waktu tahap selalu dicatat (murah); tracemalloc dan log JSON hanya aktif
+    bila panel debug dicentang. cProfile hanya untuk rerun yang diminta.
+    """
+    debug = st.sidebar.checkbox("🐞 Panel debug", key="debug_panel",
+                                help="Waktu & alokasi memori per tahap, log JSON, cProfile.")
+    if debug:
+        enable_logging()
+    profiler = Profiler().start() if st.session_state.pop("profile_next_run", False) else None
+    return StageTimer(trace_memory=debug, page=page), profiler
+
+
+def debug_panel(timer, profiler=None):
+    """Dipanggil di akhir skrip: tampilkan record tahap dan hasil cProfile."""
+    summary = timer.close()
+    if profiler is not None:
+        path = os.path.join(PROFILE_DIR, f"fuzzymadm-{timer.run_id}.prof")
+        st.session_state.profile_result = (path, profiler.stop(path))
+    if not st.session_state.get("debug_panel"):
+        return
+
+    with st.sidebar.expander("🐞 Waktu per tahap", expanded=True):
+        st.caption(f"Run {timer.run_id}: {summary['seconds'] * 1e3:.1f} ms total"
+                   + (f", puncak {summary['peak_kb'] / 1024:.1f} MB" if "peak_kb" in summary else ""))
+        if timer.records:
+            st.dataframe(pd.DataFrame(timer.records).set_index("stage"), use_container_width=True)
+        if st.button("⏱ Profil rerun berikutnya (cProfile)", key="profile_request"):
+            st.session_state.profile_next_run = True
+            st.rerun()
+        result = st.session_state.get("profile_result")
+        if result and os.path.exists(result[0]):
+            path, text = result
+            st.caption(f"cProfile: {path}")
+            st.code(text, language=None)
+            with open(path, "rb") as fh:
+                st.download_button("⬇ Download .prof", fh.read(), file_name=os.path.basename(path),
+                                   key="profile_download")
@@ -0,0 +1,43 @@
+"""Dataset bersama antar sesi + cache pipeline per proses (lihat fuzzymadm/shared.py)."""
+import streamlit as st
+
+from ..cache import PipelineCache
+from ..shared import SessionFrame, SharedRegistry, session_nbytes
+
+
+@st.cache_resource
+def get_registry():
+    """Dataset read-only yang dipakai bersama seluruh sesi di proses server ini."""
+    return SharedRegistry()
+
+
+@st.cache_resource
+def get_pipeline_cache():
+    """Cache hasil normalisasi/SAW/WP untuk seluruh sesi, berkunci hash isi data + bobot."""
+    return PipelineCache(max_bytes=256 * 2**20)
+
+
+def session_data(name, default_df, key="data"):
+    """`SessionFrame` sesi ini, awalnya menunjuk dataset bersama `name`.
+
+    `default_df` dibekukan dan di-hash sekali per proses; tahap data
+    (normalisasi, matriks log WP) untuk dataset tersebut disematkan di cache.
+    """
+    handle = st.session_state.get(key)
+    if handle is None:
+        registry = get_registry()
+        shared = registry.get(name) if name in registry else registry.register(name, default_df)
+        get_pipeline_cache().pin(shared.digest)
+        handle = st.session_state[key] = SessionFrame(shared)
+    return handle
+
+
+def memory_report(timer, key="data"):
+    """Caption memori sesi di sidebar; juga dicatat sebagai `session_kb` di log rerun."""
+    used = session_nbytes(st.session_state)
+    handle = st.session_state.get(key)
+    timer.context["session_kb"] = round(used / 1024, 1)
+    source = (f"data bersama '{handle.shared.name}'" if handle is not None and handle.is_shared
+              else "salinan pribadi")
+    st.sidebar.caption(f"💾 Memori sesi: {used / 1024:,.1f} KB ({source}) — "
+                       f"data bersama per proses: {get_registry().nbytes() / 1024:,.1f} KB")
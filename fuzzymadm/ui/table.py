@@ -0,0 +1,67 @@
+"""Penampil tabel hasil: tabel penuh untuk data kecil, halaman/top-N untuk data besar.
+
+Angka diformat oleh `st.column_config.NumberColumn` di browser, bukan oleh
+pandas Styler, dan untuk data besar hanya baris yang terlihat yang dikirim.
+"""
+import streamlit as st
+
+from ..view import INDEX_KEY, page_count, search_mask, table_view
+
+# Di atas jumlah baris ini tabel otomatis ditampilkan per halaman
+PAGED_THRESHOLD = 1000
+PAGE_SIZES = (25, 50, 100, 250)
+
+
+def number_config(df, decimals=6):
+    """column_config: semua kolom float dengan `decimals` angka di belakang koma."""
+    return {c: st.column_config.NumberColumn(format=f"%.{decimals}f")
+            for c in df.columns if df[c].dtype.kind == "f"}
+
+
+def results_table(df, key, decimals=6, sort_by=None, ascending=True, threshold=PAGED_THRESHOLD):
+    """Menampilkan `df`; bila lebih dari `threshold` baris, dengan kontrol server-side.
+
+    sort_by/ascending : urutan awal (mis. "Rank", True) untuk mode halaman;
+                        None = urutan baris `df`
+    key               : prefix kunci widget, harus unik per tabel di satu halaman
+    """
+    config = number_config(df, decimals)
+    if len(df) <= threshold:
+        st.dataframe(df, column_config=config, use_container_width=True)
+        return
+
+    columns = [None, INDEX_KEY, *df.columns]
+    labels = {None: "(urutan data)", INDEX_KEY: df.index.name or "Alternatif"}
+    c_search, c_sort, c_dir, c_mode = st.columns([3, 2, 1, 2])
+    with c_search:
+        query = st.text_input("Cari alternatif", key=f"{key}_query")
+    with c_sort:
+        sort_by = st.selectbox("Urutkan", columns,
+                               index=columns.index(sort_by) if sort_by in columns else 0,
+                               format_func=lambda c: labels.get(c, c), key=f"{key}_sort")
+    with c_dir:
+        ascending = st.toggle("Naik", value=ascending, key=f"{key}_asc")
+    with c_mode:
+        mode = st.radio("Tampilan", ["Halaman", "Top-N"], horizontal=True, key=f"{key}_mode")
+
+    if mode == "Top-N":
+        top_n = st.number_input("N", 1, 10_000, 100, key=f"{key}_top")
+        view, info = table_view(df, query, sort_by, ascending, top_n=int(top_n))
+    else:
+        c_size, c_page = st.columns([1, 3])
+        with c_size:
+            page_size = st.selectbox("Baris per halaman", PAGE_SIZES, index=1, key=f"{key}_size")
+        # Jumlah halaman dari baris yang cocok dengan pencarian, bukan seluruh df
+        mask = search_mask(df.index, query)
+        pages = page_count(len(df) if mask is None else int(mask.sum()), page_size)
+        if st.session_state.get(f"{key}_page", 1) > pages:
+            st.session_state[f"{key}_page"] = pages  # filter baru mempersempit hasil
+        with c_page:
+            page = st.number_input(f"Halaman (1-{pages:,})", 1, pages, 1, key=f"{key}_page")
+        view, info = table_view(df, query, sort_by, ascending, page=page, page_size=page_size,
+                                mask=mask)
+
+    st.dataframe(view, column_config=config, use_container_width=True)
+    found = f" ({info['matched']:,} cocok dengan pencarian)" if info["matched"] != info["rows"] else ""
+    st.caption(f"Baris {info['start'] + 1:,}-{info['stop']:,} dari {info['rows']:,}{found}"
+               if info["stop"] else f"Tidak ada baris dari {info['rows']:,}{found}")
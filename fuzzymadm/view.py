@@ -0,0 +1,88 @@
+"""Potongan tabel hasil di sisi server: cari, urutkan, halaman, top-N.
+
+Hanya baris yang akan ditampilkan yang diambil dari DataFrame; untuk
+halaman awal urutan dihitung dengan `np.argpartition` (O(n)) lalu hanya
+potongan tersebut yang di-sort. Modul ini membutuhkan pandas.
+"""
+import math
+
+import numpy as np
+
+INDEX_KEY = "__index__"
+
+
+def search_mask(index, query):
+    """Mask baris yang label index-nya memuat `query` (tanpa beda huruf besar/kecil)."""
+    query = (query or "").strip()
+    if not query:
+        return None
+    return np.asarray(index.astype(str).str.contains(query, case=False, regex=False), dtype=bool)
+
+
+def page_count(matched, page_size):
+    """Jumlah halaman untuk `matched` baris hasil filter (minimal 1)."""
+    return max(1, math.ceil(matched / page_size))
+
+
+def _sort_key(df, by, ascending):
+    """Kunci urut numerik: naik, NaN paling akhir (descending = dinegasikan)."""
+    key = df[by].to_numpy(dtype=float, na_value=np.nan)
+    if not ascending:
+        key = -key
+    return np.where(np.isnan(key), np.inf, key)
+
+
+def sorted_rows(key, start, stop):
+    """Posisi baris ke-start..stop (eksklusif) dalam urutan `key` naik (stabil).
+
+    Bila `stop` jauh lebih kecil dari n hanya `stop` baris terkecil yang
+    dipilih (argpartition) lalu di-sort, bukan seluruh kolom.
+    """
+    n = len(key)
+    stop = min(stop, n)
+    if start >= stop:
+        return np.empty(0, dtype=np.intp)
+    if stop < n // 4:
+        cand = np.argpartition(key, stop - 1)[:stop]
+        # Seri di batas partisi: ambil semua yang setara agar urutan tetap stabil
+        cand = np.flatnonzero(key <= key[cand].max())
+        order = cand[np.lexsort((cand, key[cand]))]
+    else:
+        order = np.argsort(key, kind="stable")
+    return order[start:stop]
+
+
+def table_view(df, query="", sort_by=None, ascending=True, page=1, page_size=50, top_n=None,
+               mask=None):
+    """Potongan `df` yang ditampilkan beserta info halaman.
+
+    query     : filter substring pada label index
+    sort_by   : nama kolom, INDEX_KEY (label index) atau None (urutan asli)
+    page      : nomor halaman mulai 1 (diabaikan bila `top_n` diisi)
+    top_n     : hanya N baris teratas menurut urutan
+    mask      : hasil `search_mask(df.index, query)` bila sudah dihitung
+
+    Mengembalikan (view, info) dengan info = {"rows", "matched", "page",
+    "pages", "start", "stop"} (start/stop 0-based dalam hasil filter).
+    """
+    if mask is None:
+        mask = search_mask(df.index, query)
+    base = df if mask is None else df[mask]
+    matched = len(base)
+    if top_n is not None:
+        start, stop, page, pages = 0, min(top_n, matched), 1, 1
+    else:
+        pages = page_count(matched, page_size)
+        page = min(max(1, int(page)), pages)
+        start, stop = (page - 1) * page_size, min(page * page_size, matched)
+
+    if sort_by is None:
+        view = base.iloc[start:stop]
+    elif sort_by == INDEX_KEY:
+        order = np.argsort(base.index.astype(str).to_numpy(), kind="stable")
+        view = base.iloc[(order if ascending else order[::-1])[start:stop]]
+    else:
+        view = base.iloc[sorted_rows(_sort_key(base, sort_by, ascending), start, stop)]
+    info = {"rows": len(df), "matched": matched, "page": page, "pages": pages,
+            "start": start, "stop": stop}
+    return view, info
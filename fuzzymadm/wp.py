@@ -0,0 +1,136 @@
+"""Weighted Product (WP) yang dihitung di ruang log.
+
+S_i = Prod_j x_ij ^ w*_j dihitung sebagai log S_i = Sum_j w*_j * log(x_ij),
+yaitu satu perkalian matriks-vektor, sehingga tidak terjadi underflow ke 0
+atau overflow ke inf walaupun jumlah kriteria banyak. Vektor V dinormalisasi
+dengan log-sum-exp.
+"""
+import numpy as np
+
+# Kebijakan untuk nilai crisp <= 0 (log tidak terdefinisi)
+#   "clip"  : ganti dengan eps (nilai positif sangat kecil)
+#   "shift" : geser kolom yang bermasalah sehingga nilai minimumnya = 1
+#   "raise" : lempar ValueError
+NONPOSITIVE_POLICIES = ("clip", "shift", "raise")
+
+
+def wp_exponents(weights, types):
+    """Pangkat WP w*_j: +w_j untuk benefit, -w_j untuk cost."""
+    w = np.asarray(weights, dtype=float)
+    cost = np.asarray(types[:len(w)]) == "cost"
+    return np.where(cost, -w, w)
+
+
+def _fix_nonpositive(X, active, nonpositive, eps, lo=None):
+    """Menangani x_ij <= 0 secara eksplisit sesuai kebijakan `nonpositive`.
+
+    `lo` (min per kolom) dipakai oleh "shift" bila data diproses per chunk,
+    agar pergeseran sama untuk seluruh baris.
+    """
+    bad = (X <= 0) & active
+    if lo is None and not bad.any():
+        return X
+    if nonpositive == "raise":
+        if not bad.any():
+            return X
+        rows, cols = np.nonzero(bad)
+        raise ValueError(
+            f"WP membutuhkan nilai crisp > 0; ditemukan {len(rows)} nilai <= 0 "
+            f"(contoh: baris {rows[0]}, kolom {cols[0]})."
+        )
+    if nonpositive == "clip":
+        X = X.copy()
+        X[bad] = eps
+    elif nonpositive == "shift":
+        if lo is None:
+            cols = bad.any(axis=0)
+            shift = 1.0 - np.nanmin(X[:, cols], axis=0)
+        else:
+            lo = np.asarray(lo, dtype=float)[:X.shape[1]]
+            cols = (lo <= 0) & active
+            shift = 1.0 - lo[cols]
+        X = X.copy()
+        X[:, cols] += shift
+    else:
+        raise ValueError(f"Kebijakan nonpositive tidak dikenal: {nonpositive!r} "
+                         f"(pilih salah satu dari {NONPOSITIVE_POLICIES}).")
+    return X
+
+
+def wp_log_s(X, weights, types, nonpositive="clip", eps=1e-12, lo=None):
+    """Menghitung log S_i untuk seluruh alternatif sekaligus.
+
+    Kolom di luar jumlah bobot diabaikan. Kolom dengan bobot 0 tidak
+    memengaruhi hasil sehingga nilai <= 0 di kolom tersebut dibiarkan.
+    """
+    X = np.asarray(X, dtype=float)
+    m = min(X.shape[1], len(weights))
+    X = X[:, :m]
+    expo = wp_exponents(np.asarray(weights, dtype=float)[:m], types)
+
+    return wp_aggregate(wp_log_matrix(X, expo != 0, nonpositive, eps, lo), expo)
+
+
+def wp_aggregate(logx, expo):
+    """log S_i = Sum_j log(x_ij) * w*_j untuk matriks log (n x m).
+
+    Memakai einsum (bukan matmul/BLAS) pada array C-contiguous sehingga
+    hasil satu baris tidak bergantung pada baris lain yang ikut dihitung
+    maupun tata letak memori input: baris yang dihitung ulang sendirian
+    identik dengan hasil penuh dan seri tetap seri.
+    """
+    return np.einsum("nj,j->n", np.ascontiguousarray(logx, dtype=float), expo)
+
+
+def wp_log_matrix(X, active, nonpositive="clip", eps=1e-12, lo=None):
+    """Matriks log(x_ij) setelah penanganan nilai <= 0; kolom tidak aktif = 0.
+
+    Hanya bergantung pada data (dan pola bobot nol), sehingga dapat
+    di-cache terpisah dari bobot: log S = wp_aggregate(wp_log_matrix(...), w*).
+    """
+    X = np.asarray(X, dtype=float)
+    active = np.asarray(active, dtype=bool)
+    X = _fix_nonpositive(X, active, nonpositive, eps, lo)
+    return np.log(np.where(active, X, 1.0))
+
+
+def log_sum_exp(log_s):
+    """log(Sum(exp(log_s))) yang stabil; -inf untuk input kosong/semua -inf."""
+    log_s = np.asarray(log_s, dtype=float)
+    if log_s.size == 0:
+        return -np.inf
+    top = log_s.max()
+    if not np.isfinite(top):
+        return top
+    return top + np.log(np.exp(log_s - top).sum())
+
+
+def wp_vector(log_s, lse=None):
+    """Vektor V_i = S_i / Sum(S) dari log S_i menggunakan log-sum-exp.
+
+    `lse` = log(Sum(S)) seluruh data; berikan bila log_s hanya sebagian
+    (chunk) dari alternatif.
+    """
+    log_s = np.asarray(log_s, dtype=float)
+    if lse is None:
+        if log_s.size == 0 or np.isnan(log_s).any():
+            return np.full_like(log_s, np.nan)
+        lse = log_sum_exp(log_s)
+    if np.isnan(lse):
+        return np.full_like(log_s, np.nan)
+    if lse == -np.inf:
+        # Semua S_i = 0 (sama seperti perilaku sum_S == 0 sebelumnya)
+        return np.zeros_like(log_s)
+    return np.exp(log_s - lse)
+
+
+def wp_scores(X, weights, types, nonpositive="clip", eps=1e-12):
+    """Perhitungan WP lengkap. Mengembalikan (S, V, log_S).
+
+    S hanya untuk ditampilkan (bisa 0/inf pada data ekstrem); V dan
+    ranking sebaiknya memakai log_S.
+    """
+    log_s = wp_log_s(X, weights, types, nonpositive=nonpositive, eps=eps)
+    with np.errstate(over="ignore", under="ignore"):
+        S = np.exp(log_s)
+    return S, wp_vector(log_s), log_s
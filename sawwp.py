@@ -2,6 +2,11 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
+from fuzzymadm.frames import alternatives_frame, crisp_saw_wp
+from fuzzymadm.ingest import content_hash, ingest_upload
+from fuzzymadm.ui.export import download_section
+from fuzzymadm.ui.table import results_table
+
 st.set_page_config(page_title="SAW & WP Cloud Computing", layout="wide")
 st.title("☁️ Analisis Metode SAW & WP untuk Pemilihan Layanan Cloud Computing")
 st.markdown("Aplikasi ini membandingkan hasil perangkingan layanan Cloud Computing menggunakan metode **Simple Additive Weighting (SAW)** dan **Weighted Product (WP)**.")
@@ -36,133 +41,188 @@ st.dataframe(df_kriteria.set_index("Kode"), use_container_width=True)
 # ============================================================
 # 2. FUNGSI KONVERSI NILAI CRIPS (Disesuaikan ke 1, 2, 3, 4)
 # ============================================================
-def konversi_crips(kode, nilai):
-    """
-    Konversi nilai crips (raw data) ke nilai bobot (1, 2, 3, 4).
-    """
-    # C1 Biaya (Cost) - Input: Harga ($/bln)
-    if kode == "C1":
-        if nilai <= 50: return 4
-        if nilai <= 100: return 3
-        if nilai <= 150: return 2
-        return 1
-
-    # C2, C3, C4 (Benefit) - Input: Skor (0-100)
-    if kode in ["C2", "C3", "C4"]:
-        if nilai >= 90: return 4
-        if nilai >= 80: return 3
-        if nilai >= 60: return 2
-        return 1
-
-    return None
+# convert_matrix(X, kode) dari fuzzymadm (lihat fuzzymadm/crisp.py) dipanggil oleh
+# fuzzymadm.frames.crisp_saw_wp; seluruh kolom dikonversi sekaligus untuk semua alternatif
 
 # ============================================================
-# INPUT JUMLAH ALTERNATIF
+# INPUT DATA ALTERNATIF
 # ============================================================
 st.header("📝 Input Data Alternatif")
 
-col1_jumlah, col2_kosong = st.columns([1, 3])
-with col1_jumlah:
-    jumlah_alt = st.selectbox("Jumlah Alternatif:", [1, 2, 3, 4, 5], index=4)
+# Di atas jumlah alternatif ini tabel langkah per langkah tidak ditampilkan
+# (hanya hasil akhir, dengan tabel per halaman)
+BATAS_DETAIL = 50
 
-st.subheader("Masukkan Detail Setiap Alternatif:")
 
-# DataFrame penampung
-data_input = []
+def contoh_data(n):
+    """Data raw contoh yang tetap antar rerun (seed tetap)."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Alternatif": [f"Layanan {i+1}" for i in range(n)],
+        "C1": rng.integers(40, 200, n).astype(float),
+        "C2": rng.integers(60, 100, n),
+        "C3": rng.integers(60, 100, n),
+        "C4": rng.integers(60, 100, n),
+    })
 
-# Kontainer untuk input alternatif
-input_container = st.container()
 
-with input_container:
-    cols = st.columns(jumlah_alt)
-    
-    for i in range(jumlah_alt):
-        with cols[i]:
-            st.markdown(f"### Alternatif A{i+1}")
-            
-            # Use a box/container for visual grouping
-            with st.container(border=True):
-                nama = st.text_input(f"Nama Alternatif A{i+1}", key=f"nama_{i}", value=f"Layanan {i+1}")
-
-                st.markdown("**Nilai Raw Data (Crips)**")
-
-                # C1 Biaya ($/bln)
-                c1_harga = st.number_input(
-                    f"C1: {nama_kriteria['C1']} ($/bulan)",
-                    min_value=0.0,
-                    step=1.0,
-                    format="%.2f",
-                    key=f"c1_{i}",
-                    value=float(np.random.randint(40, 200)) # Nilai acak untuk contoh
-                )
-
-                # ------------------------------------------------------------------
-                # PERUBAHAN: Mengganti st.slider menjadi st.number_input untuk C2, C3, C4
-                # St.number_input memberikan rentang min/max, tetapi juga dapat diketik manual.
-                # ------------------------------------------------------------------
-                
-                # C2 Kinerja (Skor 0-100)
-                c2_skor = st.number_input(
-                    f"C2: {nama_kriteria['C2']} (Skor 0-100)",
-                    min_value=0,
-                    max_value=100,
-                    step=1,
-                    key=f"c2_{i}",
-                    value=np.random.randint(60, 100) # Nilai acak untuk contoh
-                )
-                
-                # C3 Keamanan (Skor 0-100)
-                c3_skor = st.number_input(
-                    f"C3: {nama_kriteria['C3']} (Skor 0-100)",
-                    min_value=0,
-                    max_value=100,
-                    step=1,
-                    key=f"c3_{i}",
-                    value=np.random.randint(60, 100) # Nilai acak untuk contoh
-                )
-                
-                # C4 Skalabilitas (Skor 0-100)
-                c4_skor = st.number_input(
-                    f"C4: {nama_kriteria['C4']} (Skor 0-100)",
-                    min_value=0,
-                    max_value=100,
-                    step=1,
-                    key=f"c4_{i}",
-                    value=np.random.randint(60, 100) # Nilai acak untuk contoh
-                )
-                # ------------------------------------------------------------------
-                # AKHIR PERUBAHAN
-                # ------------------------------------------------------------------
-
-
-                data_input.append([
-                    nama,
-                    konversi_crips("C1", c1_harga),
-                    konversi_crips("C2", c2_skor),
-                    konversi_crips("C3", c3_skor),
-                    konversi_crips("C4", c4_skor),
-                ])
+mode_input = st.radio(
+    "Mode input",
+    ["Per alternatif (maks. 5)", "Tabel / unggah file (massal)"],
+    horizontal=True,
+    help="Mode massal memakai satu tabel yang dapat diedit atau file CSV/XLSX; "
+         "perubahan baru diproses setelah tombol pada formulir ditekan.",
+)
+massal = mode_input.startswith("Tabel")
+
+if not massal:
+    col1_jumlah, col2_kosong = st.columns([1, 3])
+    with col1_jumlah:
+        jumlah_alt = st.selectbox("Jumlah Alternatif:", [1, 2, 3, 4, 5], index=4)
+
+    st.subheader("Masukkan Detail Setiap Alternatif:")
+
+    # Nilai awal contoh harus tetap antar rerun: nilai acak baru membuat widget
+    # dianggap baru sehingga isian pengguna hilang
+    contoh = contoh_data(5)
+    nama_input, raw_input = [], []
+
+    # Kontainer untuk input alternatif
+    input_container = st.container()
+
+    with input_container:
+        cols = st.columns(jumlah_alt)
+
+        for i in range(jumlah_alt):
+            with cols[i]:
+                st.markdown(f"### Alternatif A{i+1}")
+
+                # Use a box/container for visual grouping
+                with st.container(border=True):
+                    nama = st.text_input(f"Nama Alternatif A{i+1}", key=f"nama_{i}", value=f"Layanan {i+1}")
+
+                    st.markdown("**Nilai Raw Data (Crips)**")
+
+                    # C1 Biaya ($/bln)
+                    c1_harga = st.number_input(
+                        f"C1: {nama_kriteria['C1']} ($/bulan)",
+                        min_value=0.0,
+                        step=1.0,
+                        format="%.2f",
+                        key=f"c1_{i}",
+                        value=float(contoh.at[i, "C1"])  # Nilai contoh
+                    )
+
+                    # C2, C3, C4 (Skor 0-100); dapat diketik manual
+                    skor = [
+                        st.number_input(
+                            f"{c}: {nama_kriteria[c]} (Skor 0-100)",
+                            min_value=0,
+                            max_value=100,
+                            step=1,
+                            key=f"{c.lower()}_{i}",
+                            value=int(contoh.at[i, c])  # Nilai contoh
+                        )
+                        for c in ["C2", "C3", "C4"]
+                    ]
+
+                    nama_input.append(nama)
+                    raw_input.append([c1_harga, *skor])
+
+    df_raw = pd.DataFrame(raw_input, columns=kriteria)
+    df_raw.insert(0, "Alternatif", nama_input)
+    data_crips = False
+    if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
+        st.session_state.alt_hitung = True
+    # Hasil tetap tampil pada rerun berikutnya (mis. tombol "Siapkan" pada ekspor)
+    hitung = st.session_state.get("alt_hitung", False)
+else:
+    if "bulk_raw" not in st.session_state:
+        st.session_state.bulk_raw = contoh_data(5)
+        st.session_state.bulk_crips = False
+
+    # Semua isian di dalam formulir dikirim sekaligus: mengedit sel tidak memicu rerun
+    with st.form("bulk_input"):
+        uploaded = st.file_uploader(
+            "Upload file CSV/XLSX (kolom 1 = nama alternatif, kolom 2-5 = C1-C4)",
+            type=["csv", "xlsx"],
+            help="File dengan kolom 'Crisp C1'..'Crisp C4' dianggap sudah berskala 1-4.",
+        )
+        edited = st.data_editor(
+            st.session_state.bulk_raw,
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "C1": st.column_config.NumberColumn(f"C1: {nama_kriteria['C1']} ($/bulan)", min_value=0.0),
+                **{c: st.column_config.NumberColumn(f"{c}: {nama_kriteria[c]} (0-100)", min_value=0, max_value=100)
+                   for c in ["C2", "C3", "C4"]},
+            },
+        )
+        submitted = st.form_submit_button("🚀 Terapkan dan Hitung SAW dan WP", type="primary")
+
+    if submitted:
+        if uploaded is not None:
+            try:
+                data_file = uploaded.getvalue()
+                # Tabel polos: header di baris pertama, nama alternatif di kolom pertama
+                df_file, info = ingest_upload(uploaded.name, data_file, kriteria,
+                                              digest=content_hash(data_file),
+                                              header_row=0, index_col=0)
+                st.session_state.bulk_raw = alternatives_frame(df_file, kriteria)
+                st.session_state.bulk_crips = info["layout"] == "crisp"
+                st.session_state.bulk_pesan = f"{info['rows']:,} alternatif dimuat dari {uploaded.name}."
+            except Exception as e:
+                st.error(f"File tidak dapat dibaca: {e}")
+                st.stop()
+        else:
+            # Isian tabel selalu berupa nilai raw
+            st.session_state.bulk_raw = edited
+            st.session_state.bulk_crips = False
+        st.session_state.bulk_hitung = True
+        # Rerun agar tabel di formulir menampilkan data yang baru diterapkan
+        st.rerun()
+
+    if "bulk_pesan" in st.session_state:
+        st.success(st.session_state.pop("bulk_pesan"))
+    df_raw = st.session_state.bulk_raw
+    data_crips = st.session_state.bulk_crips
+    if data_crips:
+        st.info("Kolom 'Crisp C1'..'Crisp C4' dipakai apa adanya (sudah berskala 1-4).")
+    # Hasil tetap tampil pada rerun berikutnya (mis. saat berpindah halaman tabel)
+    hitung = st.session_state.get("bulk_hitung", False)
 
 st.markdown("---")
 
 # ============================================================
 # HITUNG SAW & WP
 # ============================================================
-if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
-    df = pd.DataFrame(data_input, columns=["Alternatif"] + kriteria)
-    
-    # Filter dan tampilkan hanya data dengan nilai crips valid
-    df_valid = df.dropna(subset=kriteria)
-    
+if hitung:
+    # Baris dengan nilai raw kosong dilewati; sisanya dikonversi sekaligus per kolom,
+    # lalu SAW, WP dan perbandingan dihitung dalam satu langkah (fuzzymadm.frames)
+    hasil = crisp_saw_wp(df_raw, kriteria, [bobot[c] for c in kriteria],
+                         [atribut[c] for c in kriteria], crisp=data_crips)
+    df_valid = hasil["valid"]
+    if hasil["skipped"]:
+        st.warning(f"{hasil['skipped']} alternatif dengan nilai kosong dilewati.")
+
     if df_valid.empty:
         st.warning("Tidak ada data alternatif yang valid. Pastikan semua input terisi.")
         st.stop()
 
+    detail = len(df_valid) <= BATAS_DETAIL
+    if not detail:
+        st.info(f"{len(df_valid):,} alternatif: tabel langkah per langkah hanya ditampilkan untuk "
+                f"maksimal {BATAS_DETAIL} alternatif; rumus dan hasil akhir tetap ditampilkan.")
+
     st.subheader("✅ Matriks Keputusan Berdasarkan Nilai Crips (1 - 4)")
     # Ganti nama kolom C1, C2, dst. dengan nama kriteria
     df_crips_display = df_valid.rename(columns=nama_kriteria).set_index("Alternatif")
     df_crips_display.columns.name = "Kriteria"
-    st.dataframe(df_crips_display)
+    if detail:
+        st.dataframe(df_crips_display)
+    else:
+        results_table(df_crips_display, key="tbl_crips")
 
     st.markdown("---")
 
@@ -183,23 +243,18 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
         st.markdown("Untuk kriteria **Cost** (C1):")
         st.latex(r'''r_{ij} = \frac{\min_i(x_{ij})}{x_{ij}}''')
 
-    df_saw_norm = df_valid.copy()
-    X = df_saw_norm[kriteria].astype(float)
-
-    for c in kriteria:
-        if atribut[c] == "benefit":
-            # Benefit: x_ij / max(x_j)
-            df_saw_norm[c] = X[c] / X[c].max()
-        else:
-            # Cost: min(x_j) / x_ij
-            df_saw_norm[c] = X[c].min() / X[c]
+    # Benefit: x_ij / max(x_j), Cost: min(x_j) / x_ij (lihat fuzzymadm.normalize_ratio)
+    df_saw_norm = hasil["saw_norm"]
 
     # Tampilkan tabel normalisasi dengan nama kolom yang jelas dan format 3 desimal
     df_saw_norm_display = df_saw_norm.copy()
     df_saw_norm_display = df_saw_norm_display.rename(columns=nama_kriteria)
     df_saw_norm_display.set_index("Alternatif", inplace=True)
     df_saw_norm_display.columns.name = "Kriteria"
-    st.dataframe(df_saw_norm_display.apply(lambda x: x.map('{:.3f}'.format)), use_container_width=True)
+    if detail:
+        st.dataframe(df_saw_norm_display.apply(lambda x: x.map('{:.3f}'.format)), use_container_width=True)
+    else:
+        results_table(df_saw_norm_display, key="tbl_saw_norm", decimals=3)
 
     # --- Nilai Akhir SAW ---
     st.subheader("Tahap 2: Perhitungan Nilai Preferensi ($V_i$) dan Ranking")
@@ -207,16 +262,17 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
     st.latex(r'''V_i = \sum_{j=1}^n w_j \cdot r_{ij}''')
 
 
-    df_saw = df_saw_norm.copy()
-    # Hitung Skor SAW: sum(R_ij * w_j)
-    df_saw["Skor_SAW"] = sum(df_saw[c] * bobot[c] for c in kriteria)
-    df_saw = df_saw.sort_values("Skor_SAW", ascending=False)
-    df_saw["Ranking"] = range(1, len(df_saw) + 1)
+    # Skor SAW: sum(R_ij * w_j)
+    df_saw = hasil["saw"].sort_values("Ranking")
 
     # Tampilkan hasil SAW dengan Skor format 3 desimal
     df_saw_result_display = df_saw[["Alternatif", "Skor_SAW", "Ranking"]].copy()
-    df_saw_result_display["Skor_SAW"] = df_saw_result_display["Skor_SAW"].map('{:.3f}'.format)
-    st.dataframe(df_saw_result_display.set_index("Alternatif"), use_container_width=True)
+    if detail:
+        df_saw_result_display["Skor_SAW"] = df_saw_result_display["Skor_SAW"].map('{:.3f}'.format)
+        st.dataframe(df_saw_result_display.set_index("Alternatif"), use_container_width=True)
+    else:
+        results_table(df_saw_result_display.set_index("Alternatif"), key="tbl_saw", decimals=3,
+                      sort_by="Ranking")
 
     st.markdown("---")
 
@@ -225,10 +281,6 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
     # ============================================================
     st.header("📗 Perhitungan Metode Weighted Product (WP)")
     
-    df_wp = df_valid.copy()
-    df_wp.set_index("Alternatif", inplace=True)
-    X_wp = df_wp[kriteria].astype(float)
-    
     # 1. Hitung Bobot W* (Pangkat WP)
     st.subheader("Tahap 1: Vektor Bobot $W^*_j$ (Pangkat)")
     st.markdown("Bobot untuk kriteria **Cost** (C1: Biaya) harus **negatif**.")
@@ -257,33 +309,30 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
     st.markdown("Nilai $S_i$ dihitung sebagai hasil kali nilai kriteria $x_{ij}$ yang dipangkatkan dengan bobot $w^*_j$:")
     st.latex(r'''S_i = \prod_{j=1}^n x_{ij}^{w^*_j} \text{, di mana } w^*_j = \begin{cases} w_j & \text{untuk benefit} \\ -w_j & \text{untuk cost} \end{cases}''')
     
-    # HITUNG S_i MENGGUNAKAN ARRAY BOBOT YANG SUDAH DISESUAIKAN
-    S_i = (X_wp ** bobot_array_wp).prod(axis=1)
+    # S_i DIHITUNG DI RUANG LOG (log S_i = Sum(w*_j * log x_ij), lihat fuzzymadm.wp)
+    df_wp_result = hasil["wp"]
     
     # Tampilkan S_i dalam DataFrame dengan format 4 desimal
-    df_wp_result = pd.DataFrame(S_i, columns=["S_i"])
-    df_wp_result.index.name = "Alternatif"
-    S_i_float = S_i.copy() 
-    df_wp_result["S_i"] = df_wp_result["S_i"].map('{:.4f}'.format)
-    st.dataframe(df_wp_result, use_container_width=True)
+    if detail:
+        st.dataframe(df_wp_result[["S_i"]].map('{:.4f}'.format), use_container_width=True)
+    else:
+        results_table(df_wp_result[["S_i"]], key="tbl_wp_s", decimals=4)
 
     # 3. Hitung Vektor V_i: V_i = S_i / Sum(S_k)
     st.subheader("Tahap 3: Perhitungan Nilai Preferensi $V_i$ dan Ranking")
     st.markdown("Nilai preferensi $V_i$ dihitung dengan membagi $S_i$ dengan total $S_k$ dari semua alternatif:")
     st.latex(r'''V_i = \frac{S_i}{\sum_{k=1}^m S_k}''')
 
-    # Gunakan S_i_float untuk perhitungan V_i yang akurat
-    sum_S = S_i_float.sum()
-    V_i = S_i_float / sum_S
-    
-    df_wp_result["Skor_WP"] = V_i
-    df_wp_result = df_wp_result.sort_values("Skor_WP", ascending=False)
-    df_wp_result["Ranking"] = range(1, len(df_wp_result) + 1)
+    # V_i dinormalisasi dengan log-sum-exp sehingga tidak runtuh saat S_i underflow/overflow
+    df_wp_result = df_wp_result.sort_values("Ranking")
     
     # Tampilkan hasil WP dengan Skor format 4 desimal
     df_wp_final_display = df_wp_result[["Skor_WP", "Ranking"]].copy()
-    df_wp_final_display["Skor_WP"] = df_wp_final_display["Skor_WP"].map('{:.4f}'.format)
-    st.dataframe(df_wp_final_display, use_container_width=True)
+    if detail:
+        df_wp_final_display["Skor_WP"] = df_wp_final_display["Skor_WP"].map('{:.4f}'.format)
+        st.dataframe(df_wp_final_display, use_container_width=True)
+    else:
+        results_table(df_wp_final_display, key="tbl_wp", decimals=4, sort_by="Ranking")
 
     st.markdown("---")
 
@@ -292,32 +341,21 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
     # ============================================================
     st.header("📊 Perbandingan Hasil Ranking SAW dan WP")
     
-    # Ambil ranking SAW
-    df_saw_rank = df_saw[["Alternatif", "Ranking"]].copy()
-    df_saw_rank.rename(columns={"Ranking": "Ranking_SAW"}, inplace=True)
-    
-    # Ambil ranking WP
-    df_wp_result.reset_index(inplace=True)
-    df_wp_rank = df_wp_result.copy()
-    df_wp_rank.rename(columns={"Alternatif": "Alternatif", "Ranking": "Ranking_WP"}, inplace=True)
-    
-    # Gabungkan
-    df_compare = pd.merge(df_saw_rank, df_wp_rank[["Alternatif", "Ranking_WP"]], on="Alternatif")
-    
-    # Hitung selisih peringkat
-    df_compare["Selisih"] = df_compare["Ranking_WP"] - df_compare["Ranking_SAW"]
-    
-    # Urutkan berdasarkan ranking SAW
-    df_compare = df_compare.sort_values("Ranking_SAW").reset_index(drop=True)
-    df_compare.index = df_compare.index + 1 # Jadikan index sebagai no urut
-    df_compare.index.name = "No."
+    # Ranking SAW dan WP digabung per posisi baris (nama alternatif boleh kembar),
+    # diurutkan berdasarkan ranking SAW dengan nomor urut sebagai index
+    df_compare = hasil["compare"]
 
-    st.dataframe(df_compare, use_container_width=True)
+    if detail:
+        st.dataframe(df_compare, use_container_width=True)
+    else:
+        results_table(df_compare, key="tbl_compare", sort_by="Ranking_SAW")
+    download_section([df_compare], lambda: df_compare, "perbandingan_saw_wp", "perbandingan",
+                     key="dl_compare")
     
     # Kesimpulan otomatis
     st.subheader("📌 Analisis Singkat Konsistensi Ranking")
     
-    jumlah_sama = sum(df_compare["Ranking_SAW"] == df_compare["Ranking_WP"])
+    jumlah_sama = int((df_compare["Ranking_SAW"] == df_compare["Ranking_WP"]).sum())
     total_alt = len(df_compare)
     
     st.markdown(f"Dari **{total_alt}** alternatif, terdapat **{jumlah_sama}** alternatif yang memiliki urutan ranking yang sama persis antara metode SAW dan WP.")
@@ -332,8 +370,8 @@ if st.button("🚀 Mulai Perhitungan SAW dan WP", type="primary"):
 
     st.markdown("---")
     # Tampilkan alternatif terbaik
-    alt_saw_terbaik = df_saw_rank.loc[df_saw_rank["Ranking_SAW"] == 1, "Alternatif"].iloc[0]
-    alt_wp_terbaik = df_wp_rank.loc[df_wp_rank["Ranking_WP"] == 1, "Alternatif"].iloc[0]
+    alt_saw_terbaik = df_compare.loc[df_compare["Ranking_SAW"] == 1, "Alternatif"].iloc[0]
+    alt_wp_terbaik = df_compare.loc[df_compare["Ranking_WP"] == 1, "Alternatif"].iloc[0]
 
     st.subheader("🏆 Kesimpulan Alternatif Terbaik")
     if alt_saw_terbaik == alt_wp_terbaik:
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from fuzzymadm.cache import LRUCache, PipelineCache, array_digest
+from fuzzymadm.frames import frame_digest, saw_calc, wp_calc
+from fuzzymadm.store import open_store, store_from_frame
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.uniform(1, 5, (20, 4)), columns=list("abcd"),
+                        index=[f"A{i}" for i in range(20)])
+
+
+def test_frame_digest_covers_values_index_and_columns():
+    df = frame()
+    assert frame_digest(df) == frame_digest(df.copy())
+    edited = df.copy()
+    edited.iloc[3, 2] += 1e-9
+    assert frame_digest(edited) != frame_digest(df)
+    assert frame_digest(df.rename(index={"A0": "B0"})) != frame_digest(df)
+    assert frame_digest(df.rename(columns={"a": "z"})) != frame_digest(df)
+
+
+def test_array_digest_includes_dtype_and_shape():
+    a = np.arange(4.0)
+    assert array_digest(a) == array_digest(a.copy())
+    assert array_digest(a) != array_digest(a.astype(np.float32))
+    assert array_digest(a) != array_digest(a.reshape(2, 2))
+
+
+def test_weights_change_reuses_data_stage():
+    pc = PipelineCache()
+    df = frame()
+    res, _, _ = pc.saw_calc(df, W)
+    pd.testing.assert_frame_equal(res, saw_calc(df, W)[0])
+    res2, _, _ = pc.saw_calc(df, W[::-1])
+    pd.testing.assert_frame_equal(res2, saw_calc(df, W[::-1])[0])
+    stages = pc.stats()["stages"]
+    assert stages["normalize"] == {"hits": 1, "misses": 1}
+    assert stages["saw"] == {"hits": 0, "misses": 2}
+    pc.saw_calc(df, W)
+    assert pc.stats()["stages"]["saw"]["hits"] == 1
+
+
+def test_edit_invalidates_and_parameters_are_keyed():
+    pc = PipelineCache()
+    df = frame()
+    pc.wp_calc(df, W)
+    edited = df.copy()
+    edited.iloc[0, 0] = 4.5
+    pd.testing.assert_frame_equal(pc.wp_calc(edited, W), wp_calc(edited, W))
+    clip = pc.wp_calc(df.assign(a=0.0), W, nonpositive="clip")
+    shift = pc.wp_calc(df.assign(a=0.0), W, nonpositive="shift")
+    assert not clip.equals(shift)
+    pd.testing.assert_frame_equal(shift, wp_calc(df.assign(a=0.0), W, nonpositive="shift"))
+
+
+def test_tfn_parameters_are_keyed():
+    pc = PipelineCache()
+    df = frame()
+    a = pc.saw_calc(df, W, spread=0.1)[0]
+    b = pc.saw_calc(df, W, spread=0.2)[0]
+    c = pc.saw_calc(df, W, spread=0.2, method="graded_mean")[0]
+    assert not a.equals(b) and not b.equals(c)
+    pd.testing.assert_frame_equal(c, saw_calc(df, W, spread=0.2, method="graded_mean")[0])
+    _, _, tfn = pc.saw_calc(df, W, spread=0.2)
+    np.testing.assert_array_equal(tfn.data, saw_calc(df, W, spread=0.2)[2].data)
+
+
+def test_digest_replaces_hashing(tmp_path):
+    pc = PipelineCache()
+    df = frame()
+    pc.saw_calc(df, W, digest="shared")
+    # Kunci ditentukan oleh digest yang diberikan, bukan isi df
+    res, _, _ = pc.saw_calc(frame(1), W, digest="shared")
+    pd.testing.assert_frame_equal(res, saw_calc(df, W)[0])
+
+    # Digest store dipakai langsung sebagai kunci data
+    store = store_from_frame(tmp_path / "s", df)
+    pc.saw_calc(store.to_frame(), W, digest=store.digest)
+    pc.saw_calc(open_store(tmp_path / "s").to_frame(), W, digest=store.digest)
+    assert pc.stats()["stages"]["saw"]["hits"] == 2
+
+
+def test_pinned_data_stage_survives_eviction():
+    pc = PipelineCache(max_items=1)
+    df = frame()
+    pc.pin("d")
+    pc.saw_calc(df, W, digest="d")
+    for seed in range(1, 4):
+        pc.saw_calc(frame(seed), W)
+    pc.saw_calc(df, W, digest="d")
+    assert pc.stats()["stages"]["normalize"]["hits"] == 1
+    assert pc.stats()["pinned_items"] == 1
+
+
+def test_lru_byte_limit():
+    cache = LRUCache(max_bytes=3 * 800)
+    for i in range(5):
+        cache.put(("x", i), np.zeros(100))
+    assert len(cache) == 3 and cache.evictions == 2
+    assert ("x", 4) in cache and ("x", 1) not in cache
+    assert cache.put(("big",), np.zeros(10_000)) is not None and ("big",) not in cache
+
+
+def test_lru_get_refreshes_recency():
+    cache = LRUCache(max_items=2)
+    cache.put("a", np.zeros(1))
+    cache.put("b", np.zeros(1))
+    cache.get("a")
+    cache.put("c", np.zeros(1))
+    assert "a" in cache and "c" in cache and "b" not in cache
@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from fuzzymadm import DEFAULT_CRISP_TABLES, convert_column, convert_matrix, konversi_crips, load_crisp_tables
+from fuzzymadm.crisp import validate_table
+
+CODES = ["C1", "C2", "C3", "C4"]
+
+
+def old_konversi(kode, nilai):
+    """if/elif versi awal sawwp.py (NaN jatuh ke cabang terakhir)."""
+    if kode == "C1":
+        if nilai <= 50: return 4
+        if nilai <= 100: return 3
+        if nilai <= 150: return 2
+        return 1
+    if kode in ["C2", "C3", "C4"]:
+        if nilai >= 90: return 4
+        if nilai >= 80: return 3
+        if nilai >= 60: return 2
+        return 1
+    return None
+
+
+EDGES = [-np.inf, -1.0, 0.0, 49.999, 50.0, 50.001, 59.999, 60.0, 60.001, 79.999, 80.0, 80.001,
+         89.999, 90.0, 90.001, 99.999, 100.0, 100.001, 149.999, 150.0, 150.001, 1e12, np.inf, np.nan]
+
+
+@pytest.mark.parametrize("code", CODES)
+def test_column_matches_if_elif(code):
+    expected = [old_konversi(code, v) for v in EDGES]
+    np.testing.assert_array_equal(convert_column(EDGES, DEFAULT_CRISP_TABLES[code]), expected)
+    assert [konversi_crips(code, v) for v in EDGES] == expected
+
+
+def test_matrix_matches_if_elif():
+    X = np.array(np.meshgrid(EDGES, EDGES[::-1])).reshape(2, -1).T
+    X = np.column_stack([X, X[::-1]])
+    expected = [[old_konversi(c, v) for c, v in zip(CODES, row)] for row in X]
+    np.testing.assert_array_equal(convert_matrix(X, CODES), expected)
+    assert convert_matrix(np.empty((3, 0)), []).shape == (3, 0)
+
+
+def test_unknown_code():
+    assert konversi_crips("C9", 10) is None
+
+
+@pytest.mark.parametrize("table", [
+    {"kind": "ratio", "thresholds": [1], "scores": [1, 2]},
+    {"thresholds": [1], "scores": [1, 2]},
+    {"kind": "cost", "thresholds": [1, 2], "scores": [1, 2]},
+    {"kind": "benefit", "thresholds": [2, 2], "scores": [1, 2, 3]},
+    {"kind": "benefit", "thresholds": [3, 1], "scores": [1, 2, 3]},
+])
+def test_validate_rejects(table):
+    with pytest.raises(ValueError):
+        validate_table(table)
+
+
+def test_load_tables(tmp_path):
+    path = tmp_path / "crisp.json"
+    tables = {"C1": {"kind": "cost", "thresholds": [10, 20], "scores": [3, 2, 1]}}
+    path.write_text(json.dumps(tables))
+    loaded = load_crisp_tables(path)
+    assert loaded == tables
+    np.testing.assert_array_equal(convert_matrix([[5.0], [10.0], [15.0], [25.0]], ["C1"], loaded),
+                                  [[3], [3], [2], [1]])
+
+    tables["C1"]["thresholds"] = [20, 10]
+    path.write_text(json.dumps(tables))
+    with pytest.raises(ValueError):
+        load_crisp_tables(path)
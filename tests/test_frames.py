@@ -0,0 +1,121 @@
+"""Jalur massal sawwp.py (unggahan -> crisp_saw_wp) vs jalur per alternatif."""
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm.frames import alternatives_frame, crisp_saw_wp
+from fuzzymadm.ingest import ingest_upload
+
+CRITERIA = ["C1", "C2", "C3", "C4"]
+TYPES = ["cost", "benefit", "benefit", "benefit"]
+W = [0.35, 0.30, 0.15, 0.20]
+
+
+def example(n):
+    """Seperti `contoh_data` di sawwp.py."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Alternatif": [f"Layanan {i+1}" for i in range(n)],
+        "C1": rng.integers(40, 200, n).astype(float),
+        "C2": rng.integers(60, 100, n),
+        "C3": rng.integers(60, 100, n),
+        "C4": rng.integers(60, 100, n),
+    })
+
+
+def per_alternative(raw):
+    """df_raw seperti dibangun dari widget mode per alternatif."""
+    rows = [[float(r.C1), int(r.C2), int(r.C3), int(r.C4)] for r in raw.itertuples()]
+    df = pd.DataFrame(rows, columns=CRITERIA)
+    df.insert(0, "Alternatif", list(raw["Alternatif"]))
+    return df
+
+
+def old_konversi(kode, nilai):
+    """konversi_crips versi awal sawwp.py."""
+    if kode == "C1":
+        if nilai <= 50: return 4
+        if nilai <= 100: return 3
+        if nilai <= 150: return 2
+        return 1
+    if nilai >= 90: return 4
+    if nilai >= 80: return 3
+    if nilai >= 60: return 2
+    return 1
+
+
+def reference(raw):
+    """Rumus sawwp.py versi awal: (Skor_SAW, Skor_WP) per baris."""
+    X = np.array([[old_konversi(c, v) for c, v in zip(CRITERIA, row)]
+                  for row in raw[CRITERIA].to_numpy(dtype=float)], dtype=float)
+    R = np.where(np.array(TYPES) == "cost", X.min(axis=0) / X, X / X.max(axis=0))
+    saw = sum(R[:, j] * W[j] for j in range(4))
+    S = (X ** np.where(np.array(TYPES) == "cost", -np.array(W), W)).prod(axis=1)
+    return saw, S / S.sum()
+
+
+def upload_bytes(raw, fmt):
+    if fmt == "csv":
+        return raw.set_index("Alternatif").to_csv().encode()
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.active.append(list(raw.columns))
+    for row in raw.itertuples(index=False):
+        wb.active.append(list(row))
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def bulk(raw, fmt, cache_dir):
+    if fmt == "xlsx":
+        pytest.importorskip("openpyxl")
+    df, _ = ingest_upload(f"x.{fmt}", upload_bytes(raw, fmt), CRITERIA, cache_dir=cache_dir,
+                          header_row=0, index_col=0)
+    return crisp_saw_wp(alternatives_frame(df, CRITERIA), CRITERIA, W, TYPES)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_upload_matches_per_alternative(tmp_path, fmt):
+    raw = example(5)
+    res = bulk(raw, fmt, tmp_path)
+    expected = crisp_saw_wp(per_alternative(raw), CRITERIA, W, TYPES)
+    for key in ("valid", "saw_norm", "saw", "wp", "compare"):
+        pd.testing.assert_frame_equal(res[key], expected[key], check_dtype=False)
+    saw, wp = reference(raw)
+    np.testing.assert_allclose(res["saw"]["Skor_SAW"], saw, rtol=1e-12)
+    np.testing.assert_allclose(res["wp"]["Skor_WP"], wp, rtol=1e-12)
+
+
+def test_large_upload(tmp_path):
+    raw = example(20_000)
+    raw.loc[[3, 500], "C2"] = np.nan
+    res = bulk(raw, "csv", tmp_path)
+    assert res["skipped"] == 2 and len(res["valid"]) == 19_998
+    saw, wp = reference(raw.dropna())
+    np.testing.assert_allclose(res["saw"]["Skor_SAW"], saw, rtol=1e-12)
+    np.testing.assert_allclose(res["wp"]["Skor_WP"], wp, rtol=1e-9)
+    compare = res["compare"]
+    np.testing.assert_array_equal(compare["Ranking_SAW"], np.arange(1, 19_999))
+    np.testing.assert_array_equal(np.sort(compare["Ranking_WP"]), np.arange(1, 19_999))
+    # Skor menurun sepanjang ranking, seri dipecah oleh urutan data
+    saw_sorted = res["saw"].sort_values("Ranking")
+    assert saw_sorted["Skor_SAW"].is_monotonic_decreasing
+
+
+def test_crisp_input_is_not_converted():
+    raw = per_alternative(example(5))
+    raw[CRITERIA] = [[4, 1, 2, 3], [3, 2, 2, 2], [1, 4, 4, 4], [2, 3, 1, 1], [4, 4, 4, 4]]
+    res = crisp_saw_wp(raw, CRITERIA, W, TYPES, crisp=True)
+    np.testing.assert_array_equal(res["valid"][CRITERIA], raw[CRITERIA])
+    # C1 tetap dinormalisasi sebagai cost (min/x) seperti versi awal
+    assert res["compare"]["Alternatif"].iloc[0] == "Layanan 3"
+
+
+def test_alternatives_frame_needs_all_criteria():
+    df = pd.DataFrame({"a": [1.0], "b": [2.0]}, index=["X"])
+    with pytest.raises(ValueError):
+        alternatives_frame(df, CRITERIA)
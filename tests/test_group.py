@@ -0,0 +1,90 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES, defuzzify
+from fuzzymadm.frames import group_calc, saw_calc, stack_raters, wp_calc
+from fuzzymadm.group import aggregate_tfn, aggregate_weights, group_saw, group_wp_log_s
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def ratings(K=5, n=30, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(1, 10, (K, n, 4))
+    X[rng.random(X.shape) < 0.1] = np.nan
+    X[:, 0, 2] = np.nan  # sel tanpa nilai dari penilai mana pun
+    return X
+
+
+def direct_tfn(X, how):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mid = np.nanmean(X, axis=0) if how == "mean" else np.exp(np.nanmean(np.log(X), axis=0))
+        return np.stack([np.nanmin(X, axis=0), mid, np.nanmax(X, axis=0)], axis=-1)
+
+
+def direct_weights(Wk, how):
+    Wk = Wk / Wk.sum(axis=1, keepdims=True)
+    mid = Wk.mean(axis=0) if how == "mean" else np.exp(np.log(Wk).mean(axis=0))
+    return np.stack([Wk.min(axis=0), mid, Wk.max(axis=0)], axis=-1)
+
+
+@pytest.mark.parametrize("how", ["mean", "geometric"])
+def test_aggregation_matches_direct_reduction(how):
+    X = ratings()
+    np.testing.assert_allclose(aggregate_tfn(X, how), direct_tfn(X, how), rtol=1e-12)
+    Wk = np.random.default_rng(1).uniform(0.1, 1, (5, 4))
+    np.testing.assert_allclose(aggregate_weights(Wk, 4, how), direct_weights(Wk, how), rtol=1e-12)
+    np.testing.assert_allclose(aggregate_weights(W, 4, how), np.repeat(W[:, None], 3, axis=1))
+
+
+@pytest.mark.parametrize("how", ["mean", "geometric"])
+def test_group_scores_match_direct_reduction(how):
+    X = ratings()
+    Wk = np.random.default_rng(1).uniform(0.1, 1, (5, 4))
+    T = direct_tfn(X, how)
+    lo, hi = np.nanmin(T[..., 0], axis=0), np.nanmax(T[..., 2], axis=0)
+    cost = np.asarray(TYPES) == "cost"
+    R = np.where(cost[:, None], hi[:, None] - T[..., ::-1], T - lo[:, None]) / (hi - lo)[:, None]
+    V = np.einsum("njt,jt->nt", np.nan_to_num(R), direct_weights(Wk, how))
+    scores, tfn = group_saw(X, Wk, TYPES, how)
+    np.testing.assert_allclose(tfn.data, V, rtol=1e-12)
+    np.testing.assert_allclose(scores, defuzzify(V, "mean"), rtol=1e-12)
+
+    w = direct_weights(Wk, how)[:, 1]
+    expo = np.where(cost, -w, w) / w.sum()
+    np.testing.assert_allclose(group_wp_log_s(X, Wk, TYPES, how), np.log(T[..., 1]) @ expo, rtol=1e-12)
+
+
+@pytest.mark.parametrize("how", ["mean", "geometric"])
+def test_single_rater_reduces_to_single_calc(how):
+    df = pd.DataFrame(np.random.default_rng(2).uniform(1, 10, (25, 4)), columns=list("abcd"))
+    res_saw, tfn, res_wp = group_calc({"A": df}, W, how=how)
+    # Satu penilai: TFN agregat (x, x, x), sama dengan Fuzzy SAW tanpa spread
+    expected, _, tfn_single = saw_calc(df, W, spread=0.0)
+    np.testing.assert_allclose(res_saw["Score"], expected["Score"], rtol=1e-12)
+    np.testing.assert_array_equal(res_saw["Rank"], expected["Rank"])
+    np.testing.assert_allclose(tfn.data, tfn_single.data, rtol=1e-12)
+    pd.testing.assert_frame_equal(res_wp, wp_calc(df, W), rtol=1e-12)
+
+
+def test_stack_raters_aligns_on_first_frame():
+    a = pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}, index=["P", "Q"])
+    b = pd.DataFrame({"y": [40.0], "x": [20.0]}, index=["Q"])
+    X, index, columns = stack_raters({"a": a, "b": b})
+    assert list(index) == ["P", "Q"] and columns == ["x", "y"]
+    np.testing.assert_array_equal(X[1], [[np.nan, np.nan], [20.0, 40.0]])
+    with pytest.raises(ValueError):
+        stack_raters({})
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        aggregate_tfn(np.ones((3, 4)))
+    with pytest.raises(ValueError):
+        aggregate_tfn(np.zeros((2, 3, 4)), "geometric")
+    with pytest.raises(ValueError):
+        aggregate_weights([[0.0, 0.0]], 2)
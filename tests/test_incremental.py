@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm.frames import saw_calc, wp_calc
+from fuzzymadm.incremental import IncrementalRanker
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+FLAT = np.array([0.25, 0.25, 0.25, 0.25])
+
+# Baris 0/1 memegang min/max setiap kolom sehingga edit baris lain memakai jalur per baris.
+# Baris 2/3 dan 4/5 seri secara matematis dengan bobot FLAT (C2..C4 dipermutasi,
+# batas kolom sama), baris 6/7 identik.
+X0 = np.array([
+    [1.0, 1.0, 1.0, 1.0],
+    [5.0, 5.0, 5.0, 5.0],
+    [2.0, 2.0, 3.0, 4.0],
+    [2.0, 4.0, 2.0, 3.0],
+    [3.0, 1.5, 2.5, 4.5],
+    [3.0, 4.5, 1.5, 2.5],
+    [4.0, 3.0, 3.0, 2.0],
+    [4.0, 3.0, 3.0, 2.0],
+    [2.5, 3.5, 4.5, 1.5],
+    [3.5, 2.5, 1.5, 4.5],
+])
+
+
+def assert_exact(inc, X, w, **kwargs):
+    """Skor dan ranking identik bit per bit dengan saw_calc/wp_calc dan rebuild penuh."""
+    df = pd.DataFrame(X)
+    saw = saw_calc(df, w, **kwargs)[0]
+    wp = wp_calc(df, w)
+    np.testing.assert_array_equal(inc.saw, saw["Score"])
+    np.testing.assert_array_equal(inc.saw_rank, saw["Rank"])
+    np.testing.assert_array_equal(inc.S, wp["S"])
+    np.testing.assert_array_equal(inc.wp_rank, wp["Rank"])
+    full = IncrementalRanker(X, w, **kwargs)
+    np.testing.assert_array_equal(inc.tfn, full.tfn)
+    np.testing.assert_array_equal(inc.log_s, full.log_s)
+
+
+@pytest.mark.parametrize("w", [W, FLAT])
+def test_initial_scores_match_frames(w):
+    assert_exact(IncrementalRanker(X0, w), X0, w)
+
+
+@pytest.mark.parametrize("w", [W, FLAT])
+@pytest.mark.parametrize("src, dst", [(2, 9), (9, 2), (6, 3), (4, 5)])
+def test_copied_row_ties_with_source(w, src, dst):
+    ranker = IncrementalRanker(X0, w)
+    X = X0.copy()
+    X[dst] = X[src]
+    ranker.update(X)
+    assert ranker.last_update == "rows"
+    assert ranker.saw_rank[dst] == ranker.saw_rank[src]
+    assert ranker.wp_rank[dst] == ranker.wp_rank[src]
+    assert_exact(ranker, X, w)
+
+
+def test_permuted_rows_rank_like_full_calc():
+    # Seri matematis antarbaris berbeda: hasil per baris harus sama dengan hitung penuh
+    ranker = IncrementalRanker(X0, FLAT)
+    X = X0.copy()
+    for row, values in [(8, [2.0, 3.0, 4.0, 2.0]), (9, [2.0, 4.0, 3.0, 2.0]),
+                        (3, [2.0, 2.0, 4.0, 3.0])]:
+        X[row] = values
+        ranker.update(X)
+        assert ranker.last_update == "rows"
+        assert_exact(ranker, X, FLAT)
+
+
+EDITS = [
+    ("rows", {2: [2.5, 2.0, 3.0, 4.0]}),
+    ("rows", {3: [3.0, 3.0, 3.0, 3.0], 8: [3.0, 3.0, 3.0, 3.0]}),
+    ("bounds", {1: [6.0, 5.0, 5.0, 5.0]}),         # max C1 bergeser
+    ("bounds", {0: [1.0, 1.0, 1.0, 2.0], 7: [4.0, 3.0, 3.0, 0.5]}),  # min C4 pindah baris
+    ("rows", {5: [np.nan, 4.5, 1.5, 2.5]}),
+    ("rows", {5: [3.0, 4.5, 1.5, 2.5]}),
+    ("noop", {}),
+]
+
+
+@pytest.mark.parametrize("spread, method", [(0.1, "mean"), (0.05, "graded_mean"), (0.0, "mean")])
+def test_edit_sequence_matches_full_calc(spread, method):
+    X = X0.copy()
+    ranker = IncrementalRanker(X, W, spread=spread, method=method)
+    for kind, rows in EDITS:
+        for i, values in rows.items():
+            X[i] = values
+        ranker.update(X)
+        assert ranker.last_update == kind
+        df = pd.DataFrame(X)
+        saw = saw_calc(df, W, spread=spread, method=method)[0]
+        np.testing.assert_array_equal(ranker.saw, saw["Score"])
+        np.testing.assert_array_equal(ranker.saw_rank, saw["Rank"])
+        wp = wp_calc(df, W)
+        np.testing.assert_array_equal(ranker.wp_rank, wp["Rank"])
+        np.testing.assert_allclose(ranker.V, wp["V"], rtol=1e-12)
+
+
+def test_single_row_and_constant_column():
+    X = np.array([[3.0, 2.0, 2.0, 4.0]])
+    ranker = IncrementalRanker(X, W)
+    assert_exact(ranker, X, W)
+    ranker.update(np.array([[3.0, 2.0, 2.0, 5.0]]))
+    assert_exact(ranker, np.array([[3.0, 2.0, 2.0, 5.0]]), W)
+
+    X = X0.copy()
+    X[:, 2] = 3.0  # kolom konstan
+    ranker = IncrementalRanker(X, W)
+    X[4, 0] = 2.0
+    ranker.update(X)
+    assert_exact(ranker, X, W)
+
+
+def test_weights_and_shape_change():
+    ranker = IncrementalRanker(X0, W)
+    ranker.set_weights(FLAT)
+    assert ranker.last_update == "weights"
+    assert_exact(ranker, X0, FLAT)
+    ranker.set_weights([0.0, 0.5, 0.5, 0.0])  # pola bobot nol berubah
+    assert_exact(ranker, X0, [0.0, 0.5, 0.5, 0.0])
+    with pytest.raises(ValueError):
+        ranker.update(X0[:4])
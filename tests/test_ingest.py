@@ -0,0 +1,157 @@
+import os
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import ingest
+from fuzzymadm.ingest import ingest_upload, prune_sidecars, save_sidecar, sidecar_path
+
+
+def csv_bytes(df):
+    return df.to_csv().encode()
+
+
+@pytest.mark.parametrize("index", [
+    pd.Index([1, 2, 3], name="No"),
+    pd.Index(["A", "B", "C"], name="Alternatif"),
+    pd.Index(["A", None, "C"]),
+])
+def test_sidecar_reload_matches_first_parse(tmp_path, index):
+    df = pd.DataFrame(np.arange(12.0).reshape(3, 4), index=index, columns=list("abcd"))
+    data = csv_bytes(df)
+    first, info = ingest_upload("x.csv", data, cache_dir=tmp_path)
+    again, info2 = ingest_upload("x.csv", data, cache_dir=tmp_path)
+    assert (info["source"], info2["source"]) == ("parsed", "sidecar")
+    pd.testing.assert_frame_equal(first, again)
+
+
+def test_sidecar_keyed_on_criteria(tmp_path):
+    assert sidecar_path("h", ["C1"], tmp_path) != sidecar_path("h", ["Biaya"], tmp_path)
+    pytest.importorskip("openpyxl")
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    for _ in range(13):
+        ws.append([None])
+    ws.append(["No", "Nama", "x1", "x2", "x3", "x4", "catatan"])
+    ws.append([1, "A", 10, 70, 80, 90, "abaikan"])
+    ws.append([2, None, 20, 60, 85, 95, "abaikan"])
+    buf = BytesIO()
+    wb.save(buf)
+    data = buf.getvalue()
+
+    a, _ = ingest_upload("x.xlsx", data, ["C1", "C2", "C3", "C4"], cache_dir=tmp_path)
+    b, info = ingest_upload("x.xlsx", data, ["Biaya", "Kinerja", "Keamanan", "Skalabilitas"],
+                            cache_dir=tmp_path)
+    assert info["source"] == "parsed"
+    assert list(a.columns) == ["C1", "C2", "C3", "C4"]
+    assert list(b.columns) == ["Biaya", "Kinerja", "Keamanan", "Skalabilitas"]
+    c, info = ingest_upload("x.xlsx", data, ["C1", "C2", "C3", "C4"], cache_dir=tmp_path)
+    assert info["source"] == "sidecar"
+    pd.testing.assert_frame_equal(a, c)
+    assert pd.isna(c.index[1]) and c.index[0] == "A"
+
+
+def xlsx_bytes(rows):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    for row in rows:
+        wb.active.append(row)
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def test_plain_xlsx_layout(tmp_path):
+    pytest.importorskip("openpyxl")
+    values = np.arange(80.0).reshape(20, 4) + 1
+    data = xlsx_bytes([["Alternatif", "C1", "C2", "C3", "C4"],
+                       *([f"L{i}", *v] for i, v in enumerate(values.tolist()))])
+    criteria = ["C1", "C2", "C3", "C4"]
+
+    df, info = ingest_upload("x.xlsx", data, criteria, cache_dir=tmp_path, header_row=0, index_col=0)
+    assert info["layout"] == "positional" and info["rows"] == 20
+    np.testing.assert_array_equal(df.to_numpy(), values)
+    assert list(df.index) == [f"L{i}" for i in range(20)] and df.index.name == "Alternatif"
+    again, info = ingest_upload("x.xlsx", data, criteria, cache_dir=tmp_path, header_row=0, index_col=0)
+    assert info["source"] == "sidecar"
+    pd.testing.assert_frame_equal(again, df)
+    # Tata letak template (header baris ke-14) memakai sidecar lain
+    _, info = ingest_upload("x.xlsx", data, criteria, cache_dir=tmp_path)
+    assert info["source"] == "parsed" and info["rows"] == 7
+
+
+def test_plain_csv_reads_only_criteria_columns(tmp_path):
+    df = pd.DataFrame(np.arange(12.0).reshape(3, 4), index=list("ABC"), columns=list("abcd"))
+    wide = df.assign(catatan=["x", "y", "z"], e=[1.0, 2.0, 3.0])
+    out, info = ingest_upload("x.csv", csv_bytes(wide), cache_dir=tmp_path)
+    assert info["layout"] == "csv"
+    pd.testing.assert_frame_equal(out, df)
+    # File lebih sempit dari kriteria: dibaca apa adanya
+    out, _ = ingest_upload("y.csv", csv_bytes(df[["a", "b"]]), cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(out, df[["a", "b"]])
+
+
+@pytest.mark.parametrize("damage", [b"", b"bukan zip", "truncate"])
+def test_damaged_sidecar_is_reparsed(tmp_path, damage):
+    df = pd.DataFrame(np.arange(12.0).reshape(3, 4), index=list("ABC"), columns=list("abcd"))
+    data = csv_bytes(df)
+    first, info = ingest_upload("x.csv", data, cache_dir=tmp_path)
+    path = sidecar_path(info["hash"], cache_dir=tmp_path)
+    raw = open(path, "rb").read()
+    with open(path, "wb") as fh:
+        fh.write(raw[:len(raw) // 2] if damage == "truncate" else damage)
+    again, info = ingest_upload("x.csv", data, cache_dir=tmp_path)
+    assert info["source"] == "parsed"
+    pd.testing.assert_frame_equal(again, first)
+    # Sidecar ditulis ulang dan dipakai lagi
+    assert ingest_upload("x.csv", data, cache_dir=tmp_path)[1]["source"] == "sidecar"
+
+
+def test_failed_save_leaves_no_partial_file(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(ingest.np, "savez", fail)
+    df = pd.DataFrame(np.ones((2, 4)), index=["A", "B"], columns=list("abcd"))
+    with pytest.raises(OSError):
+        save_sidecar(str(tmp_path / "s.v2.npz"), df, "csv")
+    out, info = ingest_upload("x.csv", csv_bytes(df), cache_dir=tmp_path)
+    assert info["source"] == "parsed"
+    pd.testing.assert_frame_equal(out, df)
+    assert os.listdir(tmp_path) == []
+
+
+def test_prune_by_age_then_size(tmp_path):
+    now = 1_000_000.0
+    paths = []
+    for i, age in enumerate([50, 40, 30, 20, 10]):
+        path = tmp_path / f"h{i}-k.v2.npz"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age, now - age))
+        paths.append(path)
+    partial = tmp_path / (ingest.PARTIAL_PREFIX + "abc.npz")
+    partial.write_bytes(b"x")
+    os.utime(partial, (now - 50, now - 50))
+    other = tmp_path / "lain.txt"
+    other.write_bytes(b"x" * 1000)
+    os.utime(other, (now - 50, now - 50))
+
+    # h0 terlalu tua dan partial basi; sisanya 400 byte > 250 -> h1, h2 ikut dihapus
+    assert prune_sidecars(tmp_path, max_bytes=250, max_age=45, now=now) == 4
+    assert [p.exists() for p in paths] == [False, False, False, True, True]
+    assert not partial.exists() and other.exists()
+    assert prune_sidecars(tmp_path, max_bytes=250, max_age=45, now=now) == 0
+
+
+def test_loading_refreshes_use_time(tmp_path):
+    df = pd.DataFrame(np.ones((2, 4)), index=["A", "B"], columns=list("abcd"))
+    _, info = ingest_upload("x.csv", csv_bytes(df), cache_dir=tmp_path)
+    path = sidecar_path(info["hash"], cache_dir=tmp_path)
+    os.utime(path, (0, 0))
+    assert ingest_upload("x.csv", csv_bytes(df), cache_dir=tmp_path)[1]["source"] == "sidecar"
+    assert prune_sidecars(tmp_path) == 0 and os.path.exists(path)
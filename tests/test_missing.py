@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES, tri
+from fuzzymadm.cache import PipelineCache
+from fuzzymadm.frames import saw_calc, skyline_filter, wp_calc, wp_log_total
+from fuzzymadm.missing import MISSING_POLICIES, impute_missing
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def data(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(1, 10, (60, 4))
+    X[rng.random(X.shape) < 0.15] = np.nan
+    X[0] = np.nan  # baris dengan satu nilai saja
+    X[0, 1] = 5.0
+    return pd.DataFrame(X, columns=list("abcd"))
+
+
+def test_impute_median_and_penalty():
+    X = np.array([[1.0, 10, np.nan, 4], [3.0, np.nan, 2, 4], [np.nan, 30, 6, 4]])
+    med = impute_missing(X, TYPES, "median")
+    np.testing.assert_array_equal(med[:, :3], [[1, 10, 4], [3, 20, 2], [2, 30, 6]])
+    pen = impute_missing(X, TYPES, "penalty")
+    # C1 cost -> nilai terburuk = max; benefit -> min
+    np.testing.assert_array_equal(pen[:, :3], [[1, 10, 2], [3, 10, 2], [3, 30, 6]])
+    for policy in ("none", "skip"):
+        np.testing.assert_array_equal(np.isnan(impute_missing(X, TYPES, policy)), np.isnan(X))
+    with pytest.raises(ValueError):
+        impute_missing(X, TYPES, "mean")
+
+
+def test_skip_renormalizes_row_weights():
+    df = data()
+    res, normal, tfn = saw_calc(df, W, missing="skip")
+    R = normal.to_numpy()
+    for i in range(len(R)):
+        present = ~np.isnan(R[i])
+        w = W[present] / W[present].sum()
+        expected = (tri(R[i, present]) * w[:, None]).sum(axis=0).mean()
+        assert res["Score"].iloc[i] == pytest.approx(expected)
+
+    wp = wp_calc(df, W, missing="skip")
+    X = df.to_numpy()
+    for i in range(len(X)):
+        present = ~np.isnan(X[i])
+        w = W[present] / W[present].sum()
+        expo = np.where(np.asarray(TYPES)[present] == "cost", -w, w)
+        assert wp["S"].iloc[i] == pytest.approx(np.prod(X[i, present] ** expo))
+    assert wp["V"].sum() == pytest.approx(1.0)
+
+
+def test_complete_data_unchanged_by_policy():
+    df = pd.DataFrame(np.random.default_rng(1).uniform(1, 10, (30, 4)))
+    base_saw, base_wp = saw_calc(df, W)[0], wp_calc(df, W)
+    for policy in MISSING_POLICIES:
+        pd.testing.assert_frame_equal(saw_calc(df, W, missing=policy)[0], base_saw)
+        pd.testing.assert_frame_equal(wp_calc(df, W, missing=policy), base_wp)
+
+
+def test_none_keeps_previous_behaviour():
+    df = data()
+    assert wp_calc(df, W)["V"].isna().all()
+    assert not saw_calc(df, W)[0]["Score"].isna().any()
+
+
+@pytest.mark.parametrize("policy", MISSING_POLICIES)
+def test_pipeline_and_prefilter_agree(policy):
+    df = data(2)
+    pc = PipelineCache()
+    pd.testing.assert_frame_equal(pc.saw_calc(df, W, missing=policy)[0],
+                                  saw_calc(df, W, missing=policy)[0])
+    pd.testing.assert_frame_equal(pc.wp_calc(df, W, missing=policy), wp_calc(df, W, missing=policy))
+
+    # Seperti fuzzy.py: median/penalty diisi sebelum prefilter, mesin hanya tahu "skip"
+    full, _ = pc.impute_frame(df, TYPES, policy)
+    engine = "skip" if policy == "skip" else "none"
+    sky, info = skyline_filter(full)
+    sub = saw_calc(sky, W, bounds=info["bounds"], missing=engine)[0]
+    np.testing.assert_allclose(sub["Score"], saw_calc(full, W, missing=engine)[0]["Score"].loc[sky.index])
+    lse = wp_log_total(full, W, missing=engine)
+    sub = wp_calc(sky, W, lo=info["bounds"][0], lse=lse, missing=engine)
+    np.testing.assert_allclose(sub["V"], wp_calc(full, W, missing=engine)["V"].loc[sky.index])
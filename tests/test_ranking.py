@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import rank_min, rank_ordinal, top_k, top_k_mask
+from fuzzymadm.frames import saw_calc, saw_top_k, wp_calc, wp_top_k
+
+SCORES = {
+    "ties": [3.0, 5.0, 5.0, 1.0, 3.0, 5.0],
+    "nan": [0.2, np.nan, 0.7, np.nan, 0.2],
+    "all_nan": [np.nan, np.nan],
+    "constant": [4.0] * 5,
+    "single": [0.5],
+    "empty": [],
+}
+
+
+def pandas_rank(s):
+    return pd.Series(s, dtype=float).rank(ascending=False, method="min",
+                                          na_option="bottom").astype(int).to_numpy()
+
+
+@pytest.mark.parametrize("case", SCORES)
+def test_rank_min_matches_pandas(case):
+    np.testing.assert_array_equal(rank_min(SCORES[case]), pandas_rank(SCORES[case]))
+
+
+def test_rank_min_ties_and_nan():
+    np.testing.assert_array_equal(rank_min([3, 5, 5, 1, np.nan]), [3, 1, 1, 4, 5])
+    np.testing.assert_array_equal(rank_min([np.nan, 1.0, np.nan]), [2, 1, 2])
+
+
+def test_rank_ordinal_breaks_ties_by_position():
+    np.testing.assert_array_equal(rank_ordinal([1.0, 2.0, 2.0]), [3, 1, 2])
+
+
+@pytest.mark.parametrize("k", [0, 1, 2, 3, 5, 100])
+def test_top_k_keeps_boundary_ties(k):
+    s = np.array([5.0, 9.0, 7.0, 7.0, np.nan, 1.0, 7.0])
+    idx, rank = top_k(s, k)
+    full = rank_min(s)
+    expected = np.flatnonzero((full <= k) & ~np.isnan(s)) if k else np.empty(0, dtype=int)
+    np.testing.assert_array_equal(np.sort(idx), expected)
+    np.testing.assert_array_equal(rank, full[idx])
+    assert np.all(np.diff(rank) >= 0)
+
+
+@pytest.mark.parametrize("case", ["constant", "single", "all_nan", "empty"])
+def test_top_k_degenerate(case):
+    s = np.asarray(SCORES[case], dtype=float)
+    idx, rank = top_k(s, 2)
+    np.testing.assert_array_equal(idx, np.flatnonzero(~np.isnan(s)))
+    np.testing.assert_array_equal(rank, rank_min(s)[idx])
+
+
+def test_top_k_matches_full_ranking():
+    # Banyak nilai seri: 1000 skor dengan hanya 30 nilai berbeda
+    s = (np.arange(1000) * 7 % 30).astype(float)
+    idx, rank = top_k(s, 10)
+    full = rank_min(s)
+    np.testing.assert_array_equal(np.sort(idx), np.flatnonzero(full <= 10))
+    np.testing.assert_array_equal(rank, full[idx])
+    assert top_k_mask(s, 10).sum() == len(idx)
+
+
+def test_frame_top_k_matches_full():
+    df = pd.DataFrame(np.random.default_rng(0).uniform(1, 5, (500, 4)))
+    w = [0.35, 0.30, 0.15, 0.20]
+    saw, _, _ = saw_calc(df, w)
+    top = saw_top_k(df, w, 5)
+    pd.testing.assert_frame_equal(top, saw[saw["Rank"] <= 5].sort_values("Rank"))
+    wp = wp_calc(df, w)
+    top = wp_top_k(df, w, 5)
+    pd.testing.assert_frame_equal(top, wp[wp["Rank"] <= 5].sort_values("Rank"))
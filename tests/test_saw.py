@@ -0,0 +1,81 @@
+"""Fuzzy SAW vektor vs rumus per sel versi awal fuzzy.py."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES, saw_scores
+from fuzzymadm.frames import normalize_saw, saw_calc
+
+W = [0.35, 0.30, 0.15, 0.20]
+DEFAULT = pd.DataFrame({
+    "Biaya": [60, 80, 60, 80, 100],
+    "Kinerja": [100, 100, 80, 60, 80],
+    "Keamanan": [100, 80, 100, 60, 60],
+    "Skalabilitas": [100, 100, 80, 80, 60],
+}, index=["AWS", "GCP", "Microsoft Azure", "Alibaba Cloud", "DigitalOcean"], dtype=float)
+
+
+def with_cell(df, row, col, value):
+    df = df.copy()
+    df.iloc[row, col] = value
+    return df
+
+
+CASES = {
+    "default": DEFAULT,
+    # Baris identik harus seri persis
+    "ties": pd.concat([DEFAULT, DEFAULT.iloc[[2, 2]].set_axis(["X", "Y"])]),
+    "constant": DEFAULT.assign(Keamanan=80.0),
+    "nan": with_cell(DEFAULT, 3, 1, np.nan),
+    "single": DEFAULT.iloc[:1],
+}
+
+
+def reference_saw(df, weights):
+    """Implementasi loop asli (normalisasi min-max, TFN ±0.1, rata-rata)."""
+    normal = pd.DataFrame(index=df.index, columns=df.columns, dtype=float)
+    for i, col in enumerate(df.columns):
+        lo, hi = df[col].min(), df[col].max()
+        if hi == lo:
+            normal[col] = 1.0
+        elif TYPES[i] == "benefit":
+            normal[col] = (df[col] - lo) / (hi - lo)
+        else:
+            normal[col] = (hi - df[col]) / (hi - lo)
+    scores = []
+    for idx in normal.index:
+        total = np.zeros(3)
+        for j, col in enumerate(normal.columns[:len(weights)]):
+            v = normal.loc[idx, col]
+            t = np.zeros(3) if pd.isna(v) else np.array([max(0, v - 0.1), v, min(1, v + 0.1)])
+            total += t * weights[j]
+        scores.append(total.mean())
+    res = pd.DataFrame({"Score": scores}, index=df.index)
+    res["Rank"] = res["Score"].rank(ascending=False, method="min").astype(int)
+    return res, normal
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_matches_reference(case):
+    df = CASES[case]
+    ref, ref_normal = reference_saw(df, W)
+    res, normal, _ = saw_calc(df, W)
+    pd.testing.assert_frame_equal(normal, ref_normal)
+    np.testing.assert_allclose(res["Score"], ref["Score"], rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(res["Rank"], ref["Rank"])
+
+
+def test_identical_rows_tie():
+    res = saw_calc(CASES["ties"], W)[0]
+    assert res.loc["X", "Rank"] == res.loc["Y", "Rank"] == res.loc["Microsoft Azure", "Rank"]
+
+
+def test_flat_column_normalizes_to_one():
+    np.testing.assert_array_equal(normalize_saw(CASES["constant"])["Keamanan"], 1.0)
+    np.testing.assert_array_equal(normalize_saw(CASES["single"]), 1.0)
+
+
+def test_extra_columns_ignored():
+    R = np.random.default_rng(0).random((10, 6))
+    scores, _ = saw_scores(R, W)
+    np.testing.assert_allclose(scores, saw_scores(R[:, :4], W)[0])
@@ -0,0 +1,66 @@
+import os
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import scenarios
+from fuzzymadm.frames import saw_calc, wp_calc
+from fuzzymadm.scenarios import expand_jobs, run_scenarios
+
+W = {"default": [0.35, 0.30, 0.15, 0.20], "flat": [0.25, 0.25, 0.25, 0.25]}
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Nama shared memory yang dibuat runner."""
+    names = []
+
+    class Recording(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if kwargs.get("create"):
+                names.append(self.name)
+
+    monkeypatch.setattr(scenarios, "SharedMemory", Recording)
+    return names
+
+
+def datasets():
+    rng = np.random.default_rng(0)
+    return {name: pd.DataFrame(rng.uniform(1, 10, (n, 4)), index=[f"{name}{i}" for i in range(n)])
+            for name, n in (("a", 40), ("b", 25))}
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_jobs_match_frames_and_errors_are_per_job(created, workers):
+    data = datasets()
+    jobs = expand_jobs(data, W)
+    jobs += [{"name": "bad-weights", "dataset": "a", "weights": [1.0, 1.0], "method": "saw"},
+             {"name": "bad-method", "dataset": "b", "weights": W["flat"], "method": "topsis"}]
+    results, report = run_scenarios(data, jobs, workers=workers)
+
+    status = report.set_index("scenario")["status"]
+    assert (status.drop(["bad-weights", "bad-method"]) == "ok").all()
+    errors = report.set_index("scenario")["error"]
+    assert errors["bad-weights"].startswith("ValueError: jumlah bobot (2)")
+    assert "topsis" in errors["bad-method"]
+    if workers:
+        assert (report["pid"] != os.getpid()).all()
+
+    for job in jobs[:-2]:
+        df = data[job["dataset"]]
+        got = results[results["scenario"] == job["name"]].set_index("alternative")
+        if job["method"] == "saw":
+            expected = saw_calc(df, job["weights"])[0].rename(columns={"Score": "score"})
+        else:
+            expected = wp_calc(df, job["weights"]).rename(columns={"V": "score"})
+        np.testing.assert_allclose(got["score"], expected["score"], rtol=1e-12)
+        np.testing.assert_array_equal(got["rank"], expected["Rank"])
+
+    # Shared memory dilepas setelah runner selesai
+    assert len(created) == len(data)
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
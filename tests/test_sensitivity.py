@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES, rank_min, sensitivity
+from fuzzymadm.frames import saw_calc, wp_calc
+from fuzzymadm.sensitivity import (
+    acceptability,
+    rank_min_rows,
+    sample_weights,
+    saw_sensitivity,
+    wp_sensitivity,
+)
+
+W0 = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def data(n=30, seed=0):
+    X = np.random.default_rng(seed).integers(1, 5, (n, 4)).astype(float)
+    return X
+
+
+def reference_counts(score_rows, n):
+    counts = np.zeros((n, n))
+    for scores in score_rows:
+        counts[np.arange(n), rank_min(scores) - 1] += 1
+    return counts / len(score_rows)
+
+
+def test_rank_min_rows_matches_rank_min():
+    S = data(8).T  # baris dengan nilai kembar
+    np.testing.assert_array_equal(rank_min_rows(S), [rank_min(s) for s in S])
+
+
+def test_rank_min_rows_groups_nan_like_rank_min():
+    S = np.array([[np.nan, 2.0, np.nan, 2.0, 1.0, np.nan],
+                  [3.0, 1.0, 2.0, 2.0, 0.0, -1.0],
+                  [np.nan] * 6,
+                  [np.nan, 5.0, 5.0, 5.0, 5.0, 5.0]])
+    expected = [[4, 1, 4, 1, 3, 4], [1, 4, 2, 2, 5, 6], [1] * 6, [6, 1, 1, 1, 1, 1]]
+    np.testing.assert_array_equal(rank_min_rows(S), expected)
+    np.testing.assert_array_equal(rank_min_rows(S), [rank_min(s) for s in S])
+    assert rank_min_rows(np.empty((2, 0))).shape == (2, 0)
+
+
+@pytest.mark.parametrize("method", ["mean", "graded_mean"])
+def test_saw_sensitivity_uses_spread_and_method(method):
+    X = data()
+    W = sample_weights(W0, 50, rng=1)
+    res = saw_sensitivity(X, W0, W=W, spread=0.2, method=method, ranks=None)
+    df = pd.DataFrame(X)
+    scores = [saw_calc(df, w, TYPES, spread=0.2, method=method)[0]["Score"].to_numpy() for w in W]
+    np.testing.assert_allclose(res["acceptability"], reference_counts(scores, len(X)))
+
+
+def test_wp_sensitivity_matches_wp_calc():
+    X = data()
+    W = sample_weights(W0, 50, rng=2)
+    res = wp_sensitivity(X, W0, W=W, ranks=None)
+    log_s = [np.log(wp_calc(pd.DataFrame(X), w)["S"].to_numpy()) for w in W]
+    np.testing.assert_allclose(res["acceptability"], reference_counts(log_s, len(X)), atol=1e-12)
+
+
+def test_rank_cap_and_small_blocks(monkeypatch):
+    X = data(40)
+    W = sample_weights(W0, 300, rng=3)
+    full = saw_sensitivity(X, W0, W=W, ranks=None)
+    monkeypatch.setattr(sensitivity, "BLOCK_CELLS", 40 * 7)  # blok 7 sampel
+    capped = saw_sensitivity(X, W0, W=W, ranks=3)
+    assert capped["acceptability"].shape == (40, 3)
+    np.testing.assert_allclose(capped["acceptability"], full["acceptability"][:, :3])
+    np.testing.assert_allclose(capped["mean_rank"], full["mean_rank"])
+    np.testing.assert_allclose(full["acceptability"].sum(axis=1), 1.0)
+
+
+def test_ranks_larger_than_n():
+    res = acceptability(lambda Wb: Wb @ np.eye(2), np.eye(2), 2, ranks=5)
+    assert res["acceptability"].shape == (2, 2)
@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES
+from fuzzymadm.frames import saw_calc, wp_calc
+from fuzzymadm.service import Dataset, RankingService
+
+WEIGHTS = [[0.35, 0.30, 0.15, 0.20], [0.25, 0.25, 0.25, 0.25], [0.0, 0.5, 0.2, 0.3],
+           [0.7, 0.1, 0.1, 0.1], [1.0, 0.0, 0.0, 0.0]]
+
+
+@pytest.fixture
+def service():
+    df = pd.DataFrame(np.random.default_rng(0).integers(1, 6, (60, 4)).astype(float),
+                      index=[f"A{i}" for i in range(60)])
+    df.iloc[[3, 40]] = [0.5, 5.5, 5.5, 5.5]  # seri di puncak
+    svc = RankingService(max_batch=64, max_wait=0.05, workers=2)
+    svc.register(Dataset.from_frame("demo", df, TYPES))
+    yield svc, df
+    svc.close()
+
+
+def call(svc, path, body):
+    return svc.dispatch("POST", path, json.dumps(body).encode())
+
+
+def test_batched_requests_match_frames(service):
+    svc, df = service
+
+    async def run():
+        bodies = [{"dataset": "demo", "weights": w} for w in WEIGHTS]
+        return await asyncio.gather(*[call(svc, p, b) for p in ("/saw", "/wp") for b in bodies])
+
+    replies = asyncio.run(run())
+    assert all(status == 200 for status, _ in replies)
+    # Bandingkan dengan bobot ternormalisasi yang dikembalikan layanan
+    for _, saw in replies[:len(WEIGHTS)]:
+        expected = saw_calc(df, saw["weights"])[0]
+        np.testing.assert_array_equal(saw["Score"], expected["Score"])
+        assert saw["Rank"] == expected["Rank"].tolist()
+    for _, wp in replies[len(WEIGHTS):]:
+        expected = wp_calc(df, wp["weights"])
+        np.testing.assert_allclose(wp["S"], expected["S"], rtol=1e-12)
+        np.testing.assert_allclose(wp["V"], expected["V"], rtol=1e-12)
+        assert wp["Rank"] == expected["Rank"].tolist()
+
+    # Bobot berbeda, kunci sama: dihitung dalam satu batch
+    batches = svc.metrics.snapshot()["batches"]
+    assert batches["saw"]["max_size"] == len(WEIGHTS)
+    assert batches["wp"]["max_size"] > 1
+
+
+def test_top_k_keeps_tied_leaders(service):
+    svc, df = service
+    status, res = asyncio.run(call(svc, "/saw", {"dataset": "demo", "weights": WEIGHTS[0],
+                                                  "top_k": 1}))
+    assert status == 200
+    assert res["alternatives"] == ["A3", "A40"] and res["Rank"] == [1, 1]
+
+
+@pytest.mark.parametrize("name, status", [
+    (["demo"], 400), ({"x": 1}, 400), (None, 400), (1, 400), ("lain", 404)])
+def test_bad_dataset_name(service, name, status):
+    svc, _ = service
+    got, payload = asyncio.run(call(svc, "/saw", {"dataset": name, "weights": WEIGHTS[0]}))
+    assert got == status and "dataset" in payload["error"]
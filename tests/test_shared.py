@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from fuzzymadm.frames import frame_digest
+from fuzzymadm.shared import SessionFrame, SharedRegistry, session_nbytes
+
+
+def frame():
+    return pd.DataFrame({"C1": [50, 120, 80], "C2": [90, 60, 70], "C3": [80, 95, 60],
+                         "C4": [70, 85, 90]}, index=["Layanan 1", "Layanan 2", "Layanan 3"])
+
+
+def test_register_freezes_and_reuses():
+    reg = SharedRegistry()
+    shared = reg.register("default", frame())
+    pd.testing.assert_frame_equal(shared.frame, frame())
+    with pytest.raises(ValueError):
+        shared.frame.to_numpy()[0, 0] = 1
+    assert shared.digest == frame_digest(frame())
+    # Isi sama: objek yang sama, isi baru: diganti
+    assert reg.register("default", frame()) is shared
+    other = reg.register("default", frame().assign(C1=[1, 2, 3]))
+    assert other is not shared and reg.get("default") is other and len(reg) == 1
+
+
+def test_session_copy_on_write_and_reset():
+    shared = SharedRegistry().register("default", frame())
+    a, b = SessionFrame(shared), SessionFrame(shared)
+    assert a.frame is shared.frame and a.is_shared and a.nbytes == 0
+
+    # Hasil editor tanpa perubahan isi tidak membuat salinan
+    assert not a.update(shared.frame.copy())
+    assert a.is_shared
+
+    edited = shared.frame.copy()
+    edited.iloc[1, 0] = 10
+    assert a.update(edited)
+    assert not a.is_shared and a.frame is edited and a.nbytes > 0
+    assert a.digest == frame_digest(edited) != shared.digest
+    # Sesi lain dan data bersama tidak ikut berubah
+    assert b.is_shared and b.frame.iloc[1, 0] == 120 and shared.frame.iloc[1, 0] == 120
+    assert not a.update(edited.copy())
+
+    # Edit balik ke isi semula: kembali memakai data bersama
+    assert a.update(frame())
+    assert a.is_shared and a.frame is shared.frame and a.digest == shared.digest
+
+    a.replace(edited)
+    a.reset()
+    assert a.is_shared and a.nbytes == 0
+
+
+def test_session_nbytes_counts_private_copies_only():
+    shared = SharedRegistry().register("default", frame())
+    s = SessionFrame(shared)
+    state = {"data": s}
+    assert session_nbytes(state) == 0
+    s.replace(frame().assign(C1=[1, 2, 3]))
+    assert session_nbytes(state) == s.nbytes > 0
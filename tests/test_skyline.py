@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TYPES
+from fuzzymadm.frames import saw_calc, skyline_filter, wp_calc, wp_log_total
+from fuzzymadm.skyline import benefit_matrix, skyline_mask
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+
+
+def brute_force(X, types=TYPES):
+    B = benefit_matrix(X, types)
+    keep = np.ones(len(B), dtype=bool)
+    for i, p in enumerate(B):
+        if np.isnan(p).any():
+            continue
+        others = B[~np.isnan(B).any(axis=1)]
+        keep[i] = not ((others >= p).all(axis=1) & (others > p).any(axis=1)).any()
+    return keep
+
+
+# 300 baris bernilai kecil: banyak duplikat dan dominasi lintas blok
+GRID = np.random.default_rng(0).integers(1, 6, (300, 4)).astype(float)
+CASES = {
+    "grid": GRID,
+    "nan": np.where((np.arange(300) % 37 == 0)[:, None] & (np.arange(4) == 2), np.nan, GRID),
+    "constant": np.column_stack([GRID[:, :3], np.full(300, 3.0)]),
+    "identical": np.tile([2.0, 4.0, 4.0, 4.0], (10, 1)),
+    "single": GRID[:1],
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("block", [3, 16, 1024])
+def test_matches_brute_force(case, block):
+    X = CASES[case]
+    np.testing.assert_array_equal(skyline_mask(X, TYPES, block=block), brute_force(X))
+
+
+def test_duplicates_kept_and_dominated_dropped():
+    X = np.array([[1.0, 5, 5, 5], [1.0, 5, 5, 5], [2.0, 5, 5, 5], [1.0, 4, 5, 5]])
+    np.testing.assert_array_equal(skyline_mask(X), [True, True, False, False])
+
+
+def test_empty():
+    assert skyline_mask(np.empty((0, 4))).shape == (0,)
+
+
+@pytest.mark.parametrize("nonpositive", ["clip", "shift"])
+def test_prefilter_keeps_scores(nonpositive):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(0, 8, (2000, 4)).astype(float))
+    sky, info = skyline_filter(df)
+    assert info["kept"] + info["pruned"] == len(df)
+    # Alternatif teratas tidak pernah terdominasi
+    full_saw = saw_calc(df, W)[0]
+    sub_saw = saw_calc(sky, W, bounds=info["bounds"])[0]
+    np.testing.assert_allclose(sub_saw["Score"], full_saw["Score"].loc[sky.index])
+    assert full_saw["Score"].idxmax() in sky.index
+    full_wp = wp_calc(df, W, nonpositive=nonpositive)
+    lse = wp_log_total(df, W, nonpositive=nonpositive)
+    sub_wp = wp_calc(sky, W, nonpositive=nonpositive, lo=info["bounds"][0], lse=lse)
+    np.testing.assert_allclose(sub_wp["V"], full_wp["V"].loc[sky.index])
+    assert full_wp["V"].idxmax() in sky.index
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from fuzzymadm import TYPES, normalize_minmax, saw_scores, wp_scores
+from fuzzymadm.stability import saw_stability, stability_intervals, wp_stability
+
+W = np.array([0.35, 0.30, 0.15, 0.20])
+GRID = np.linspace(0, 1, 401)
+
+
+def shifted(w, j, t):
+    """Bobot j = t, bobot lain diskalakan ulang proporsional (total 1)."""
+    out = w * (1 - t) / (1 - w[j])
+    out[j] = t
+    return out
+
+
+def brute_force(score_fn, w, j, leader):
+    """Untuk tiap t di GRID: apakah `leader` masih (seri) teratas?"""
+    keep = []
+    for t in GRID:
+        s = score_fn(shifted(w, j, t))
+        keep.append(s[leader] >= np.nanmax(s) - 1e-12)
+    return np.array(keep)
+
+
+def check(result, score_fn):
+    w = result["weights"]
+    for j in range(len(w)):
+        lo, hi = result["lower"][j], result["upper"][j]
+        inside = brute_force(score_fn, w, j, result["leader"])
+        # Titik grid yang sangat dekat batas tidak dinilai
+        far = (np.abs(GRID - lo) > 1e-6) & (np.abs(GRID - hi) > 1e-6)
+        expected = (GRID >= lo) & (GRID <= hi)
+        np.testing.assert_array_equal(inside[far], expected[far], err_msg=f"kriteria {j}")
+        for bound, by in ((lo, result["lower_by"][j]), (hi, result["upper_by"][j])):
+            if by >= 0:
+                s = score_fn(shifted(w, j, bound))
+                assert s[by] == pytest.approx(s[result["leader"]], abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_saw_matches_brute_force(seed):
+    X = np.random.default_rng(seed).uniform(1, 10, (8, 4))
+    R = normalize_minmax(X, TYPES)
+    check(saw_stability(X, W), lambda w: saw_scores(R, w)[0])
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_wp_matches_brute_force(seed):
+    X = np.random.default_rng(seed).uniform(1, 10, (8, 4))
+    # V_i sebanding dengan S_i, jadi pemimpin dibandingkan lewat log S
+    check(wp_stability(X, W), lambda w: wp_scores(X, w, TYPES)[2])
+
+
+def test_tied_leader():
+    # Dua alternatif berbeda dengan skor sama: setiap kriteria yang membedakan
+    # keduanya langsung mengganti pemimpin ke salah satu arah
+    C = np.array([[1.0, 0.0], [0.0, 1.0], [0.2, 0.2]])
+    res = stability_intervals(C, [0.5, 0.5])
+    assert res["leader"] == 0
+    np.testing.assert_array_equal(res["upper"], [1.0, 0.5])
+    np.testing.assert_array_equal(res["lower"], [0.5, 0.0])
+    np.testing.assert_array_equal(res["upper_by"], [-1, 1])
+    np.testing.assert_array_equal(res["lower_by"], [1, -1])
+
+
+def test_duplicate_leader_does_not_bound():
+    C = np.array([[0.9, 0.8], [0.9, 0.8], [0.1, 0.9]])
+    res = stability_intervals(C, [0.5, 0.5])
+    assert res["leader"] == 0
+    assert 1 not in res["lower_by"] and 1 not in res["upper_by"]
+    check(res, lambda w: C @ w)
+
+
+def test_single_alternative():
+    res = saw_stability(np.array([[3.0, 4.0, 5.0, 6.0]]), W)
+    assert res["leader"] == 0
+    np.testing.assert_array_equal(res["lower"], 0.0)
+    np.testing.assert_array_equal(res["upper"], 1.0)
+    np.testing.assert_array_equal(res["lower_by"], -1)
+    np.testing.assert_array_equal(res["upper_by"], -1)
+
+
+def test_empty():
+    assert stability_intervals(np.empty((0, 3)), [0.2, 0.3, 0.5])["leader"] == -1
@@ -0,0 +1,83 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import CRITERIA_NAMES, TYPES
+from fuzzymadm.frames import saw_calc
+from fuzzymadm.service import Dataset
+from fuzzymadm.store import SCHEMA_FILE, open_store, store_from_frame, write_store
+
+
+def frame():
+    X = np.array([[50.0, 90.0, 80.0, 70.0], [120.0, 60.0, 95.0, 85.0], [50.0, 90.0, 80.0, 70.0],
+                  [0.5, np.nan, 100.0, 1e6]])
+    return pd.DataFrame(X, columns=CRITERIA_NAMES,
+                        index=pd.Index([f"Layanan {i}" for i in range(1, 5)], name="Alternatif"))
+
+
+def test_round_trip_through_memmap(tmp_path):
+    df = frame()
+    store = store_from_frame(tmp_path / "s", df)
+    assert isinstance(store.X, np.memmap) and not store.X.flags.writeable
+    assert store.criteria == CRITERIA_NAMES and store.types == TYPES and len(store) == 4
+    out = store.to_frame()
+    pd.testing.assert_frame_equal(out, df)
+    # DataFrame berbagi halaman memory map, tidak menyalin
+    assert np.shares_memory(out.to_numpy(), store.X)
+    # Dibuka ulang dari disk: isi dan digest sama
+    again = open_store(tmp_path / "s")
+    pd.testing.assert_frame_equal(again.to_frame(), df)
+    assert again.digest == store.digest
+
+
+def test_digest_tracks_values_and_index(tmp_path):
+    df = frame()
+    base = store_from_frame(tmp_path / "a", df).digest
+    assert store_from_frame(tmp_path / "b", df.copy()).digest == base
+    edited = df.copy()
+    edited.iloc[1, 2] += 1e-9
+    assert store_from_frame(tmp_path / "c", edited).digest != base
+    assert store_from_frame(tmp_path / "d", df.rename(index={"Layanan 1": "X"})).digest != base
+    assert store_from_frame(tmp_path / "e", df, dtype="float32").digest != base
+
+
+def test_chunked_write_matches_single_chunk(tmp_path):
+    df = frame()
+    X = df.to_numpy()
+    chunks = [(df.index[:1], X[:1]), (df.index[1:3], X[1:3]), (df.index[3:], X[3:])]
+    store = write_store(tmp_path / "s", chunks, len(df), index_name="Alternatif")
+    assert store.digest == store_from_frame(tmp_path / "t", df).digest
+    with pytest.raises(ValueError):
+        write_store(tmp_path / "u", chunks, len(df) - 1)
+    with pytest.raises(ValueError):
+        write_store(tmp_path / "v", chunks, len(df) + 1)
+
+
+def test_float64_is_shared_and_float32_is_copied(tmp_path):
+    df = frame()
+    for dtype, shared in (("float64", True), ("float32", False)):
+        store = store_from_frame(tmp_path / dtype, df, dtype=dtype)
+        assert store.X.dtype == dtype
+        # Jalur mesin (service.Dataset.saw_tensor): np.asarray(X, dtype=float)
+        X = np.asarray(store.X, dtype=float)
+        assert np.shares_memory(X, store.X) is shared
+        ds = Dataset.from_store("s", store)
+        # Registrasi tidak menyalin dan tidak mengubah dtype
+        assert np.shares_memory(ds.X, store.X) and ds.X.dtype == dtype
+        res = saw_calc(store.to_frame().astype(float), [0.35, 0.30, 0.15, 0.20])[0]
+        expected = saw_calc(df.astype(dtype).astype(float), [0.35, 0.30, 0.15, 0.20])[0]
+        pd.testing.assert_frame_equal(res, expected)
+
+
+def test_inconsistent_schema_is_rejected(tmp_path):
+    store_from_frame(tmp_path / "s", frame())
+    path = tmp_path / "s" / SCHEMA_FILE
+    schema = json.loads(path.read_text())
+    schema["rows"] = 5
+    path.write_text(json.dumps(schema))
+    with pytest.raises(ValueError):
+        open_store(tmp_path / "s")
+    with pytest.raises(ValueError):
+        store_from_frame(tmp_path / "t", frame(), types=["cost"])
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import CRITERIA_NAMES, DEFAULT_WEIGHTS, rank_min
+from fuzzymadm.cli import main
+from fuzzymadm.frames import saw_calc, wp_calc
+
+N = 1000
+CHUNK = 97  # tidak membagi N
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(1, 6, (N, 4)).astype(float), columns=CRITERIA_NAMES,
+                      index=pd.Index([f"A{i}" for i in range(N)], name="Alternatif"))
+    # Tiga baris terbaik identik di kedua sisi batas chunk (96 | 97) dan di chunk lain,
+    # dua baris berikutnya seri di batas 193 | 194 (Rank 4)
+    df.iloc[[96, 97, 500]] = [0.5, 5.5, 5.5, 5.5]
+    df.iloc[[193, 194]] = [0.5, 5.5, 5.5, 5.0]
+    path = tmp_path / "catalog.csv"
+    df.to_csv(path)
+    return df, path
+
+
+def run(path, out, *args):
+    assert main(["rank", str(path), "-o", str(out), "--chunksize", str(CHUNK), *args]) == 0
+    return pd.read_csv(out, index_col=0)
+
+
+@pytest.mark.parametrize("method", ["saw", "wp"])
+@pytest.mark.parametrize("nonpositive", ["clip", "shift"])
+def test_chunked_scores_match_full(catalog, tmp_path, method, nonpositive):
+    df, path = catalog
+    out = run(path, tmp_path / "out.csv", "--method", method, "--nonpositive", nonpositive)
+    assert list(out.index) == list(df.index)
+    if method == "saw":
+        np.testing.assert_allclose(out["Score"], saw_calc(df, DEFAULT_WEIGHTS)[0]["Score"],
+                                   rtol=0, atol=1e-12)
+    else:
+        full = wp_calc(df, DEFAULT_WEIGHTS, nonpositive=nonpositive)
+        np.testing.assert_allclose(out["S"], full["S"], rtol=1e-12)
+        np.testing.assert_allclose(out["V"], full["V"], rtol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["saw", "wp"])
+@pytest.mark.parametrize("k", [1, 4, 40])
+def test_chunked_top_k_matches_full_rank(catalog, tmp_path, method, k):
+    df, path = catalog
+    out = run(path, tmp_path / "top.csv", "--method", method, "--top-k", str(k))
+    if method == "saw":
+        full = saw_calc(df, DEFAULT_WEIGHTS)[0]
+    else:
+        full = wp_calc(df, DEFAULT_WEIGHTS)
+    expected = full[full["Rank"] <= k].sort_values("Rank", kind="stable")
+    assert list(out.index) == list(expected.index)
+    np.testing.assert_array_equal(out["Rank"], expected["Rank"])
+    # Seri lintas batas chunk tetap satu kelompok
+    assert list(out.index[out["Rank"] == 1]) == ["A96", "A97", "A500"]
+    if k >= 4:
+        assert list(out.index[out["Rank"] == 4]) == ["A193", "A194"]
+
+
+def test_chunk_size_does_not_change_ranks(catalog, tmp_path):
+    df, path = catalog
+    runs = []
+    for chunksize in (13, 97, 250, N + 1):
+        assert main(["rank", str(path), "-o", str(tmp_path / "out.csv"), "--top-k", "25",
+                     "--chunksize", str(chunksize)]) == 0
+        runs.append(pd.read_csv(tmp_path / "out.csv", index_col=0))
+    for other in runs[1:]:
+        pd.testing.assert_frame_equal(other, runs[0])
+    full = rank_min(saw_calc(df, DEFAULT_WEIGHTS)[0]["Score"].to_numpy())
+    assert len(runs[0]) == np.count_nonzero(full <= 25)
+
+
+def test_rejects_bad_arguments(catalog, tmp_path):
+    _, path = catalog
+    for args in (["--top-k", "0"], ["--chunksize", "0"], ["--weights", "1,2"]):
+        with pytest.raises(SystemExit):
+            main(["rank", str(path), "-o", str(tmp_path / "x.csv"), *args])
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import TFNArray, defuzzify, tri
+
+V = [0.0, 0.05, 0.5, 0.95, 1.0, np.nan]
+EXPECTED = [[0.0, 0.0, 0.1], [0.0, 0.05, 0.15], [0.4, 0.5, 0.6], [0.85, 0.95, 1.0],
+            [0.9, 1.0, 1.0], [0.0, 0.0, 0.0]]
+
+
+def test_tri_clips_to_unit_interval():
+    np.testing.assert_allclose(tri(V), EXPECTED)
+    np.testing.assert_allclose(tri(0.5, 0.0), [0.5, 0.5, 0.5])
+    assert tri(np.zeros((2, 4))).shape == (2, 4, 3)
+
+
+def test_arithmetic_is_per_row():
+    x = TFNArray.from_values(V, index=list("abcdef"))
+    y = TFNArray([[1.0, 2.0, 3.0]] * 6)
+    np.testing.assert_allclose((x + y).data, np.array(EXPECTED) + [1.0, 2.0, 3.0])
+    np.testing.assert_allclose((y + x).data, (x + y).data)
+    w = np.arange(6.0)
+    np.testing.assert_allclose((x * w).data, np.array(EXPECTED) * w[:, None])
+    np.testing.assert_allclose((2 * x).data, np.array(EXPECTED) * 2)
+    # Hasil operasi tetap membawa label baris
+    assert (x * w).index == list("abcdef")
+    np.testing.assert_allclose(x.sum(), np.sum(EXPECTED, axis=0))
+    # Sum_j w_j * TFN_j sama dengan jalan panjang per elemen
+    acc = TFNArray.zeros(1)
+    for j in range(6):
+        acc = acc + TFNArray(x[j][None, :]) * w[j]
+    np.testing.assert_allclose(acc.data[0], (x * w).sum())
+
+
+def test_indexing_and_components():
+    x = TFNArray.from_values(V, index=pd.Index(list("abcdef")))
+    np.testing.assert_array_equal(x[2], [0.4, 0.5, 0.6])
+    sub = x[np.array([True, False, True, False, False, True])]
+    assert isinstance(sub, TFNArray) and list(sub.index) == ["a", "c", "f"]
+    np.testing.assert_array_equal(sub.m, [0.0, 0.5, 0.0])
+    assert list(x[1:3].index) == ["b", "c"]
+    np.testing.assert_array_equal(np.column_stack([x.a, x.m, x.b]), x.data)
+    np.testing.assert_array_equal(np.asarray(x), x.data)
+    assert len(x) == 6 and x.shape == (6, 3) and x.nbytes == 6 * 3 * 8
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("mean", [1 / 30, 1 / 15, 0.5, 2.8 / 3, 2.9 / 3, 0.0]),
+    ("centroid", [1 / 30, 1 / 15, 0.5, 2.8 / 3, 2.9 / 3, 0.0]),
+    ("graded_mean", [0.1 / 6, 0.35 / 6, 0.5, 5.65 / 6, 5.9 / 6, 0.0]),
+])
+def test_defuzzify(method, expected):
+    x = TFNArray.from_values(V)
+    np.testing.assert_allclose(x.defuzzify(method), expected, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(defuzzify(EXPECTED, method), expected, rtol=1e-12, atol=1e-15)
+
+
+def test_to_frame_shares_memory():
+    x = TFNArray.from_values(V[:3], index=["A1", "A2", "A3"])
+    df = x.to_frame()
+    assert list(df.columns) == ["a", "m", "b"] and list(df.index) == ["A1", "A2", "A3"]
+    assert np.shares_memory(df.to_numpy(), x.data)
+    assert list(x.to_frame(("l", "m", "u")).columns) == ["l", "m", "u"]
+
+
+def test_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        TFNArray(np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        TFNArray(np.zeros((3, 3)), index=["a"])
+    with pytest.raises(ValueError):
+        defuzzify(EXPECTED, "median")
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from fuzzymadm.view import INDEX_KEY, page_count, search_mask, table_view
+
+
+def frame(n=1000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"Score": rng.random(n).round(2)}, index=[f"alt-{i}" for i in range(n)])
+
+
+def test_pages_follow_filtered_rows():
+    df = frame()
+    mask = search_mask(df.index, "alt-1")
+    matched = int(mask.sum())
+    assert matched == 111
+    assert page_count(matched, 50) == 3
+    view, info = table_view(df, "alt-1", page=3, page_size=50, mask=mask)
+    assert (info["pages"], info["matched"], len(view)) == (3, 111, 11)
+    # Halaman di luar jangkauan dijepit ke halaman terakhir yang berisi
+    view, info = table_view(df, "alt-1", page=20, page_size=50)
+    assert info["page"] == 3 and len(view) == 11
+
+
+def test_sorted_pages_match_full_sort():
+    df = frame()
+    full = df.sort_values("Score", ascending=False, kind="stable")
+    for page in (1, 2, 7):
+        view, _ = table_view(df, sort_by="Score", ascending=False, page=page, page_size=25)
+        pd.testing.assert_frame_equal(view, full.iloc[(page - 1) * 25:page * 25])
+    view, _ = table_view(df, sort_by=INDEX_KEY, top_n=3)
+    assert list(view.index) == ["alt-0", "alt-1", "alt-10"]
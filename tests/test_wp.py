@@ -0,0 +1,89 @@
+"""WP ruang log vs rumus produk langsung versi awal fuzzy.py."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from fuzzymadm import wp_scores
+
+TYPES = ["cost", "benefit", "benefit", "benefit"]
+W = np.array([0.35, 0.30, 0.15, 0.20])
+# Nilai kontinu: seri matematis dengan faktor berbeda (mis. 2^.3 * 4^.15 * 2^.2
+# = 4^.3 * 2^.2) dapat berbeda 1 ulp di kedua rumus, sehingga tidak dipakai di sini
+BASE = np.array([
+    [61.5, 97.0, 93.5, 99.0],
+    [78.0, 99.5, 81.0, 96.5],
+    [59.0, 82.5, 98.0, 83.0],
+    [83.5, 62.0, 58.5, 79.5],
+    [97.0, 78.5, 63.0, 61.0],
+])
+
+
+def with_cell(X, row, col, value):
+    X = X.copy()
+    X[row, col] = value
+    return X
+
+
+CASES = {
+    "default": BASE,
+    "ties": np.vstack([BASE, BASE[[2, 2]]]),
+    "constant": np.column_stack([BASE[:, :2], np.full(5, 80.0), BASE[:, 3]]),
+    "nan": with_cell(BASE, 3, 1, np.nan),
+    "single": BASE[:1],
+}
+
+
+def reference_wp(X, weights):
+    S = np.array([
+        np.prod([x ** (w if t == "benefit" else -w) for x, w, t in zip(row, weights, TYPES)])
+        for row in X
+    ])
+    V = S / S.sum() if S.sum() != 0 else np.zeros_like(S)
+    return S, V
+
+
+def pandas_rank(s):
+    return pd.Series(s).rank(ascending=False, method="min").astype(int).to_numpy()
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_matches_reference(case):
+    X = CASES[case]
+    S, V = reference_wp(X, W)
+    S_log, V_log, log_s = wp_scores(X, W, TYPES)
+    np.testing.assert_allclose(S_log, S, rtol=1e-12)
+    np.testing.assert_allclose(V_log, V, rtol=1e-12)
+    if case != "nan":
+        np.testing.assert_array_equal(pandas_rank(log_s), pandas_rank(V))
+
+
+def test_identical_rows_tie():
+    _, V, log_s = wp_scores(CASES["ties"], W, TYPES)
+    assert log_s[2] == log_s[5] == log_s[6]
+    assert V[2] == V[5] == V[6]
+
+
+def test_single_alternative_gets_everything():
+    _, V, _ = wp_scores(CASES["single"], W, TYPES)
+    np.testing.assert_array_equal(V, [1.0])
+
+
+def test_no_overflow_for_extreme_values():
+    X = np.array([[1e-300, 1e300, 1e300, 1e300], [1e-300, 1e299, 1e300, 1e300]])
+    S, V, log_s = wp_scores(X, [0.1, 0.3, 0.3, 0.3], TYPES)
+    assert np.isfinite(log_s).all()
+    np.testing.assert_allclose(V.sum(), 1.0)
+    assert V[0] > V[1]
+
+
+@pytest.mark.parametrize("policy", ["clip", "shift"])
+def test_nonpositive_policies(policy):
+    X = np.array([[0.0, 2.0, 3.0, 4.0], [2.0, -1.0, 3.0, 4.0], [1.0, 1.0, 1.0, 1.0]])
+    _, V, log_s = wp_scores(X, W, TYPES, nonpositive=policy)
+    assert np.isfinite(log_s).all()
+    np.testing.assert_allclose(V.sum(), 1.0)
+
+
+def test_nonpositive_raise():
+    with pytest.raises(ValueError):
+        wp_scores(np.array([[0.0, 1.0, 1.0, 1.0]]), W, TYPES, nonpositive="raise")